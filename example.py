@@ -18,8 +18,10 @@ def main():
     # 시세 조회
     # =========================================
     
+    # 현재가 + 호가 + 일봉 (동시 조회)
+    ticker, ob, ohlcv = kis.fetch_snapshot("005930", "1d", limit=5)
+    
     # 현재가
-    ticker = kis.fetch_ticker("005930")
     print(f"=== {ticker.name} ({ticker.symbol}) ===")
     print(f"현재가: {ticker.last:,.0f}원")
     print(f"등락률: {ticker.change_percent:+.2f}%")
@@ -27,7 +29,6 @@ def main():
     print()
 
     # 호가
-    ob = kis.fetch_order_book("005930")
     print("=== 호가 ===")
     print("매도호가:")
     for ask in ob.asks[:3]:
@@ -38,7 +39,6 @@ def main():
     print()
 
     # 일봉
-    ohlcv = kis.fetch_ohlcv("005930", "1d", limit=5)
     print("=== 최근 5일 ===")
     for candle in ohlcv:
         print(f"{candle.datetime.strftime('%Y-%m-%d')}: "
@@ -6,6 +6,7 @@ PyKIS 비동기 사용 예제
 ※ Rate Limit 유의:
   - 실전투자: 초당 20건 (1계좌당)
   - 모의투자: 초당 2건
+  - 클라이언트가 자동으로 요청 속도를 조절하므로 별도 대기가 필요 없습니다.
   
 ※ WebSocket:
   - 1세션
@@ -33,9 +34,6 @@ async def main():
         print("       .env.example 파일을 참고하세요.")
         return
     
-    # Rate Limit 설정 (모의투자: 초당 2건, 실전투자: 초당 20건)
-    delay = 0.5 if is_paper else 0.05
-    
     # 클라이언트 초기화
     async with AsyncKIS(
         app_key=app_key,
@@ -46,24 +44,23 @@ async def main():
         
         mode = "모의투자" if is_paper else "실전투자"
         print(f"[{mode}] 계좌: {account_no}")
-        print(f"Rate Limit: 초당 {2 if is_paper else 20}건 (딜레이: {delay}초)")
+        print(f"Rate Limit: 초당 {2 if is_paper else 20}건")
         print()
         
         # =========================================
         # 시세 조회 (비동기)
         # =========================================
         
+        # 현재가 + 호가 + 일봉 (동시 조회)
+        ticker, ob, ohlcv = await kis.fetch_snapshot("005930", "1d", limit=5)
+        
         # 현재가
-        ticker = await kis.fetch_ticker("005930")
         print(f"=== {ticker.name} ({ticker.symbol}) ===")
         print(f"현재가: {ticker.last:,.0f}원")
         print(f"등락률: {ticker.change_percent:+.2f}%")
         print()
         
-        await asyncio.sleep(delay)  # Rate Limit 대기
-
         # 호가
-        ob = await kis.fetch_order_book("005930")
         print("=== 호가 ===")
         print("매도호가:")
         for ask in ob.asks[:3]:
@@ -73,10 +70,7 @@ async def main():
             print(f"  {bid.price:,.0f}원 - {bid.amount:,}주")
         print()
         
-        await asyncio.sleep(delay)  # Rate Limit 대기
-
         # 일봉
-        ohlcv = await kis.fetch_ohlcv("005930", "1d", limit=5)
         print("=== 최근 5일 ===")
         for candle in ohlcv:
             print(f"{candle.datetime.strftime('%Y-%m-%d')}: "
@@ -84,8 +78,6 @@ async def main():
                   f"저{candle.low:,.0f} 종{candle.close:,.0f}")
         print()
         
-        await asyncio.sleep(delay)  # Rate Limit 대기
-
         # =========================================
         # 잔고 조회 (비동기)
         # =========================================
@@ -107,36 +99,27 @@ async def main():
         # ※ 1세션, 합산 41건까지 등록 가능
         # =========================================
         
-        # # 5초간 실시간 시세 수신
+        # # 5초간 실시간 시세 수신 (여러 종목이 하나의 연결을 공유)
         # print("=== 실시간 시세 (5초) ===")
         # 
-        # async def watch_with_timeout():
-        #     try:
-        #         async for ticker in kis.watch_ticker("005930"):
-        #             print(f"{ticker.datetime.strftime('%H:%M:%S')} - {ticker.last:,.0f}원")
-        #     except asyncio.CancelledError:
-        #         pass
+        # async def watch(symbol):
+        #     async for ticker in kis.watch_ticker(symbol):
+        #         print(f"{ticker.datetime.strftime('%H:%M:%S')} {symbol} - {ticker.last:,.0f}원")
         # 
-        # task = asyncio.create_task(watch_with_timeout())
+        # tasks = [asyncio.create_task(watch(s)) for s in ("005930", "000660", "035420")]
         # await asyncio.sleep(5)
-        # task.cancel()
-        # try:
-        #     await task
-        # except asyncio.CancelledError:
-        #     pass
+        # for task in tasks:
+        #     task.cancel()
+        # await asyncio.gather(*tasks, return_exceptions=True)
 
         # =========================================
         # 주문 (주석 처리 - 실제 실행시 해제)
         # =========================================
         
-        # await asyncio.sleep(delay)  # Rate Limit 대기
-        # 
         # # 지정가 매수
         # order = await kis.create_limit_order("005930", "buy", 10, 50000)
         # print(f"주문번호: {order.id}")
         # 
-        # await asyncio.sleep(delay)  # Rate Limit 대기
-        # 
         # # 주문 취소
         # await kis.cancel_order(order.id, "005930")
 
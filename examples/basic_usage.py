@@ -6,10 +6,10 @@ PyKIS 기본 사용 예제 (동기)
 ※ Rate Limit 유의:
   - 실전투자: 초당 20건 (1계좌당)
   - 모의투자: 초당 2건
+  - 클라이언트가 자동으로 요청 속도를 조절하므로 별도 대기가 필요 없습니다.
 """
 
 import os
-import time
 from dotenv import load_dotenv
 from pykis import KIS
 
@@ -29,9 +29,6 @@ def main():
         print("       .env.example 파일을 참고하세요.")
         return
     
-    # Rate Limit 설정 (모의투자: 초당 2건, 실전투자: 초당 20건)
-    delay = 0.5 if is_paper else 0.05
-    
     # 클라이언트 초기화
     kis = KIS(
         app_key=app_key,
@@ -42,25 +39,24 @@ def main():
     
     mode = "모의투자" if is_paper else "실전투자"
     print(f"[{mode}] 계좌: {account_no}")
-    print(f"Rate Limit: 초당 {2 if is_paper else 20}건 (딜레이: {delay}초)")
+    print(f"Rate Limit: 초당 {2 if is_paper else 20}건")
     print()
 
     # =========================================
     # 시세 조회
     # =========================================
     
+    # 현재가 + 호가 + 일봉 (동시 조회)
+    ticker, ob, ohlcv = kis.fetch_snapshot("005930", "1d", limit=5)
+    
     # 현재가
-    ticker = kis.fetch_ticker("005930")
     print(f"=== {ticker.name} ({ticker.symbol}) ===")
     print(f"현재가: {ticker.last:,.0f}원")
     print(f"등락률: {ticker.change_percent:+.2f}%")
     print(f"거래량: {ticker.volume:,}주")
     print()
     
-    time.sleep(delay)  # Rate Limit 대기
-
     # 호가
-    ob = kis.fetch_order_book("005930")
     print("=== 호가 ===")
     print("매도호가:")
     for ask in ob.asks[:3]:
@@ -70,10 +66,7 @@ def main():
         print(f"  {bid.price:,.0f}원 - {bid.amount:,}주")
     print()
     
-    time.sleep(delay)  # Rate Limit 대기
-
     # 일봉
-    ohlcv = kis.fetch_ohlcv("005930", "1d", limit=5)
     print("=== 최근 5일 ===")
     for candle in ohlcv:
         print(f"{candle.datetime.strftime('%Y-%m-%d')}: "
@@ -81,8 +74,6 @@ def main():
               f"저{candle.low:,.0f} 종{candle.close:,.0f}")
     print()
     
-    time.sleep(delay)  # Rate Limit 대기
-
     # =========================================
     # 잔고 조회
     # =========================================
@@ -103,21 +94,15 @@ def main():
     # 주문 (주석 처리 - 실제 실행시 해제)
     # =========================================
     
-    # time.sleep(delay)  # Rate Limit 대기
-    # 
     # # 지정가 매수
     # order = kis.create_limit_order("005930", "buy", 10, 50000)
     # print(f"주문번호: {order.id}")
     # 
-    # time.sleep(delay)  # Rate Limit 대기
-    # 
     # # 미체결 조회
     # open_orders = kis.fetch_open_orders()
     # for o in open_orders:
     #     print(f"[{o.id}] {o.symbol} {o.side.value} {o.remaining}주 @ {o.price:,}원")
     # 
-    # time.sleep(delay)  # Rate Limit 대기
-    # 
     # # 주문 취소
     # kis.cancel_order(order.id, "005930")
 
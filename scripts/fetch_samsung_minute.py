@@ -2,11 +2,11 @@
 삼성전자 분봉 데이터 수집 스크립트
 
 특정 날짜의 분봉 데이터를 CSV로 저장합니다.
-라이브러리의 fetch_minute_ohlcv_range 메서드를 사용합니다.
+AsyncKIS.fetch_minute_ohlcv_range로 시간 구간별 요청을 동시에 보내 수집합니다.
 
 사용법:
     python scripts/fetch_samsung_minute.py [날짜]
-    
+
 예시:
     python scripts/fetch_samsung_minute.py 20260115
     python scripts/fetch_samsung_minute.py 2026-01-15
@@ -15,29 +15,45 @@
 import os
 import sys
 import csv
+import asyncio
 from datetime import datetime
+from typing import List
+from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
 
 # .env 로드
 load_dotenv()
 
-from pykis import KIS
+from pykis import AsyncKIS
+from pykis.models import OHLCV
+
+KST = ZoneInfo("Asia/Seoul")
+
+COLUMNS = ["datetime", "open", "high", "low", "close", "volume"]
+
+
+async def fetch_minute_data(kis: AsyncKIS, symbol: str, target_date: str) -> List[OHLCV]:
+    """
+    하루치 1분봉을 조회합니다.
+    
+    Args:
+        kis: AsyncKIS 인스턴스
+        symbol: 종목 코드
+        target_date: 조회일 (YYYYMMDD)
+    
+    Returns:
+        분봉 리스트 (시간순)
+    """
+    # 시간 구간 동시 요청·병합과 Rate Limit은 클라이언트가 처리
+    return await kis.fetch_minute_ohlcv_range(symbol, target_date, target_date)
 
 
-def main():
-    # 날짜 인자 처리 (기본: 오늘)
+async def main():
+    # 날짜 인자 처리 (기본: 한국 시간 기준 오늘)
     if len(sys.argv) > 1:
         target_date = sys.argv[1].replace("-", "")
     else:
-        target_date = datetime.now().strftime("%Y%m%d")
-    
-    # 과거 분봉 조회는 실전투자만 가능
-    kis = KIS(
-        app_key=os.getenv("KIS_APP_KEY"),
-        app_secret=os.getenv("KIS_APP_SECRET"),
-        account_no=os.getenv("KIS_ACCOUNT_NO"),
-        is_paper=False,
-    )
+        target_date = datetime.now(KST).strftime("%Y%m%d")
     
     symbol = "005930"  # 삼성전자
     
@@ -45,51 +61,45 @@ def main():
     print(f"대상 날짜: {target_date}")
     print()
     
-    try:
-        # 라이브러리의 fetch_minute_ohlcv_range 사용 (동적 시간 조회)
-        ohlcv_list = kis.fetch_minute_ohlcv_range(symbol, target_date, target_date, interval=1)
-        
-        print(f"수집 완료: {len(ohlcv_list)}건")
-        
-        # 딕셔너리 리스트로 변환
-        data_list = [
-            {
-                "datetime": o.datetime.strftime("%Y-%m-%d %H:%M:%S"),
-                "open": int(o.open),
-                "high": int(o.high),
-                "low": int(o.low),
-                "close": int(o.close),
-                "volume": int(o.volume),
-            }
-            for o in ohlcv_list
-        ]
-        
-    except Exception as e:
-        print(f"오류: {e}")
-        import traceback
-        traceback.print_exc()
-        data_list = []
-    finally:
-        kis.close()
+    # 과거 분봉 조회는 실전투자만 가능
+    async with AsyncKIS(
+        app_key=os.getenv("KIS_APP_KEY"),
+        app_secret=os.getenv("KIS_APP_SECRET"),
+        account_no=os.getenv("KIS_ACCOUNT_NO"),
+        is_paper=False,
+    ) as kis:
+        try:
+            rows = await fetch_minute_data(kis, symbol, target_date)
+            print(f"수집 완료: {len(rows)}건")
+        except Exception as e:
+            print(f"오류: {e}")
+            import traceback
+            traceback.print_exc()
+            rows = []
     
-    if not data_list:
+    if not rows:
         print("데이터가 없습니다.")
         return
     
     # CSV 저장
     output_file = f"samsung_minute_{target_date}.csv"
     
-    with open(output_file, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=["datetime", "open", "high", "low", "close", "volume"])
-        writer.writeheader()
-        writer.writerows(data_list)
+    fmt = "%Y-%m-%d %H:%M:%S"
+    
+    with open(output_file, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        writer.writerows(
+            (o.datetime.strftime(fmt), int(o.open), int(o.high), int(o.low), int(o.close), o.volume)
+            for o in rows
+        )
     
     print()
     print("=" * 50)
     print(f"저장 완료: {output_file}")
-    print(f"기간: {data_list[0]['datetime']} ~ {data_list[-1]['datetime']}")
-    print(f"총 {len(data_list)}개 레코드")
+    print(f"기간: {rows[0].datetime.strftime(fmt)} ~ {rows[-1].datetime.strftime(fmt)}")
+    print(f"총 {len(rows)}개 레코드")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
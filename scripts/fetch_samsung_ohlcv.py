@@ -2,36 +2,41 @@
 삼성전자 일봉 데이터 수집 스크립트 (PyKIS 사용)
 
 2020년 1월 1일부터 오늘까지의 일봉 데이터를 CSV로 저장합니다.
+AsyncKIS로 기간 구간별 요청을 동시에 보내 수집합니다.
 """
 
 import os
 import csv
+import asyncio
 from dotenv import load_dotenv
 
 # .env 로드
 load_dotenv()
 
-from pykis import KIS
+from pykis import AsyncKIS
 
+COLUMNS = ["date", "open", "high", "low", "close", "volume"]
 
-def main():
-    kis = KIS(
+
+async def main():
+    kis = AsyncKIS(
         app_key=os.getenv("KIS_APP_KEY"),
         app_secret=os.getenv("KIS_APP_SECRET"),
         account_no=os.getenv("KIS_ACCOUNT_NO"),
         is_paper=True,
+        cache=True,  # 과거 구간은 디스크 캐시 재사용
     )
     
     symbol = "005930"  # 삼성전자
     
     print(f"삼성전자({symbol}) 일봉 데이터 수집 시작...")
     print("기간: 2020-01-01 ~ 오늘")
-    print("(모의투자 Rate Limit으로 약 10초 소요)")
+    print("(모의투자 Rate Limit 초당 2건)")
     print()
     
     try:
         # 2020년 1월 1일부터 오늘까지 조회
-        ohlcv = kis.fetch_ohlcv_range(symbol, "20200101")
+        ohlcv = await kis.fetch_ohlcv_range(symbol, "20200101")
         
         print(f"수집 완료: {len(ohlcv)}개")
         
@@ -40,17 +45,11 @@ def main():
         
         with open(output_file, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
-            writer.writerow(["date", "open", "high", "low", "close", "volume"])
-            
-            for o in ohlcv:
-                writer.writerow([
-                    o.datetime.strftime("%Y-%m-%d"),
-                    int(o.open),
-                    int(o.high),
-                    int(o.low),
-                    int(o.close),
-                    o.volume,
-                ])
+            writer.writerow(COLUMNS)
+            writer.writerows(
+                (o.datetime.strftime("%Y-%m-%d"), int(o.open), int(o.high), int(o.low), int(o.close), o.volume)
+                for o in ohlcv
+            )
         
         print()
         print(f"저장 완료: {output_file}")
@@ -58,8 +57,8 @@ def main():
             print(f"기간: {ohlcv[0].datetime.strftime('%Y-%m-%d')} ~ {ohlcv[-1].datetime.strftime('%Y-%m-%d')}")
         
     finally:
-        kis.close()
+        await kis.close()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
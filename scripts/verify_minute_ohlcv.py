@@ -1,8 +1,14 @@
 import sys
 import os
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
 
+try:
+    import numpy as np
+except ImportError:
+    sys.exit("이 스크립트는 numpy가 필요합니다: pip install pykis[numpy]")
+
 # 프로젝트 루트를 path에 추가하여 pykis 모듈을 찾을 수 있게 함
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + "/src")
 
@@ -11,6 +17,8 @@ from pykis import KIS
 # .env 로드
 load_dotenv()
 
+KST = ZoneInfo("Asia/Seoul")
+
 def verify_minute_data():
     # KIS 클라이언트 초기화
     # 실전투자 계좌 정보가 필요함 (분봉 과거 조회는 실전만 가능)
@@ -18,13 +26,14 @@ def verify_minute_data():
         app_key=os.getenv("KIS_APP_KEY"),
         app_secret=os.getenv("KIS_APP_SECRET"),
         account_no=os.getenv("KIS_ACCOUNT_NO"),
-        is_paper=False
+        is_paper=False,
+        cache=True,  # 과거 날짜 분봉은 디스크 캐시 재사용
     )
     
     symbol = "005930" # 삼성전자
     
-    # 한국 시간 기준 어제 날짜 계산 (UTC+9)
-    kst_now = datetime.utcnow() + timedelta(hours=9)
+    # 한국 시간 기준 어제 날짜 계산
+    kst_now = datetime.now(KST)
     yesterday = kst_now - timedelta(days=1)
     target_date = yesterday.strftime("%Y%m%d")
     
@@ -56,17 +65,17 @@ def verify_minute_data():
         print(f"시작 시간: {start_time}")
         print(f"종료 시간: {end_time}")
         
-        # 갭 검사
-        gaps = []
-        expected_diff = timedelta(minutes=1)
+        # 갭 검사 (1분 초과 간격)
+        ts = np.array([d.datetime for d in ohlcv], dtype="datetime64[s]")
+        diffs = np.diff(ts)
+        gap_idx = np.nonzero(diffs > np.timedelta64(60, "s"))[0]
         
-        for i in range(1, count):
-            prev = ohlcv[i-1].datetime
-            curr = ohlcv[i].datetime
-            diff = curr - prev
-            
-            if diff > expected_diff:
-                gaps.append(f"{prev.strftime('%H:%M:%S')} -> {curr.strftime('%H:%M:%S')} (차이: {diff})")
+        gaps = [
+            f"{ohlcv[i].datetime.strftime('%H:%M:%S')} -> "
+            f"{ohlcv[i + 1].datetime.strftime('%H:%M:%S')} "
+            f"(차이: {timedelta(seconds=int(diffs[i] / np.timedelta64(1, 's')))})"
+            for i in gap_idx
+        ]
         
         if gaps:
             print(f"\n❌ 발견된 시간 누락 구간 ({len(gaps)}건):")
@@ -75,11 +84,12 @@ def verify_minute_data():
         else:
             print("\n✅ 시간 누락 구간이 없습니다. 데이터가 연속적입니다.")
             
-        # 첫 데이터와 마지막 데이터 시간 검증
+        # 첫 데이터와 마지막 데이터 시간 검증 (자정 기준 경과 분)
+        minutes = ts.astype("datetime64[m]").astype(np.int64) % 1440
         # 09:00 ~ 09:05 사이 데이터가 있어야 함
-        has_start = any("09:00" <= d.datetime.strftime("%H:%M") <= "09:05" for d in ohlcv)
+        has_start = bool(np.any((minutes >= 540) & (minutes <= 545)))
         # 15:20 ~ 15:30 사이 데이터가 있어야 함
-        has_end = any("15:20" <= d.datetime.strftime("%H:%M") <= "15:30" for d in ohlcv)
+        has_end = bool(np.any((minutes >= 920) & (minutes <= 930)))
         
         if has_start:
             print("✅ 개장 초반(09:00~) 데이터 존재함")
@@ -29,15 +29,13 @@ __version__ = "0.1.1"
 from pykis.client import KIS
 from pykis.async_client import AsyncKIS
 
-# WebSocket 클라이언트
-from pykis.websocket import WebSocketClient
-
 # 데이터 모델
 from pykis.models import (
     Ticker,
     OrderBook,
     OrderBookLevel,
     OHLCV,
+    OHLCVFrame,
     Order,
     Balance,
     Position,
@@ -77,6 +75,7 @@ __all__ = [
     "OrderBook",
     "OrderBookLevel",
     "OHLCV",
+    "OHLCVFrame",
     "Order",
     "Balance",
     "Position",
@@ -96,3 +95,12 @@ __all__ = [
     "InsufficientBalanceError",
     "MarketClosedError",
 ]
+
+
+def __getattr__(name: str):
+    # WebSocket 클라이언트는 사용할 때 로드 (websockets 임포트 비용 절감)
+    if name == "WebSocketClient":
+        from pykis.websocket import WebSocketClient
+        
+        return WebSocketClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,7 +4,7 @@ PyKIS 계좌 API
 잔고 조회 기능을 제공합니다.
 """
 
-from pykis.constants import Endpoint, TrID
+from pykis.constants import Endpoint, resolve_tr
 from pykis.models import Balance
 
 
@@ -30,6 +30,22 @@ class AccountAPI:
         self._acnt_prdt_cd = parts[1] if len(parts) > 1 else "01"
         
         self._is_paper = is_paper
+        
+        # 호출마다 바뀌지 않는 TR_ID와 요청 파라미터는 미리 생성
+        self._tr_balance = resolve_tr("balance", is_paper)
+        self._params_balance = {
+            "CANO": self._cano,
+            "ACNT_PRDT_CD": self._acnt_prdt_cd,
+            "AFHR_FLPR_YN": "N",           # 시간외단일가 반영 여부
+            "OFL_YN": "",                  # 오프라인 여부
+            "INQR_DVSN": "02",             # 조회구분 (01: 대출, 02: 일반)
+            "UNPR_DVSN": "01",             # 단가구분 (01: 기본)
+            "FUND_STTL_ICLD_YN": "N",      # 펀드결제분 포함 여부
+            "FNCG_AMT_AUTO_RDPT_YN": "N",  # 융자금 자동상환 여부
+            "PRCS_DVSN": "00",             # 처리구분 (00: 전일)
+            "CTX_AREA_FK100": "",          # 연속조회 키
+            "CTX_AREA_NK100": "",          # 연속조회 키
+        }
     
     def fetch_balance(self) -> Balance:
         """
@@ -38,24 +54,10 @@ class AccountAPI:
         Returns:
             Balance 인스턴스 (예수금, 평가금액, 보유 종목 등 포함)
         """
-        tr_id = TrID.BALANCE_PAPER if self._is_paper else TrID.BALANCE
-        
         data = self._http.get(
             Endpoint.BALANCE,
-            tr_id,
-            params={
-                "CANO": self._cano,
-                "ACNT_PRDT_CD": self._acnt_prdt_cd,
-                "AFHR_FLPR_YN": "N",           # 시간외단일가 반영 여부
-                "OFL_YN": "",                  # 오프라인 여부
-                "INQR_DVSN": "02",             # 조회구분 (01: 대출, 02: 일반)
-                "UNPR_DVSN": "01",             # 단가구분 (01: 기본)
-                "FUND_STTL_ICLD_YN": "N",      # 펀드결제분 포함 여부
-                "FNCG_AMT_AUTO_RDPT_YN": "N",  # 융자금 자동상환 여부
-                "PRCS_DVSN": "00",             # 처리구분 (00: 전일)
-                "CTX_AREA_FK100": "",          # 연속조회 키
-                "CTX_AREA_NK100": "",          # 연속조회 키
-            },
+            self._tr_balance,
+            params=self._params_balance,
         )
         
         return Balance.from_kis(data)
@@ -4,7 +4,7 @@ PyKIS 비동기 계좌 API
 잔고 조회의 비동기 기능을 제공합니다.
 """
 
-from pykis.constants import Endpoint, TrID
+from pykis.constants import Endpoint, resolve_tr
 from pykis.models import Balance
 
 
@@ -29,6 +29,22 @@ class AsyncAccountAPI:
         self._acnt_prdt_cd = parts[1] if len(parts) > 1 else "01"
         
         self._is_paper = is_paper
+        
+        # 호출마다 바뀌지 않는 TR_ID와 요청 파라미터는 미리 생성
+        self._tr_balance = resolve_tr("balance", is_paper)
+        self._params_balance = {
+            "CANO": self._cano,
+            "ACNT_PRDT_CD": self._acnt_prdt_cd,
+            "AFHR_FLPR_YN": "N",
+            "OFL_YN": "",
+            "INQR_DVSN": "02",
+            "UNPR_DVSN": "01",
+            "FUND_STTL_ICLD_YN": "N",
+            "FNCG_AMT_AUTO_RDPT_YN": "N",
+            "PRCS_DVSN": "00",
+            "CTX_AREA_FK100": "",
+            "CTX_AREA_NK100": "",
+        }
     
     async def fetch_balance(self) -> Balance:
         """
@@ -37,24 +53,10 @@ class AsyncAccountAPI:
         Returns:
             Balance 인스턴스
         """
-        tr_id = TrID.BALANCE_PAPER if self._is_paper else TrID.BALANCE
-        
         data = await self._http.get(
             Endpoint.BALANCE,
-            tr_id,
-            params={
-                "CANO": self._cano,
-                "ACNT_PRDT_CD": self._acnt_prdt_cd,
-                "AFHR_FLPR_YN": "N",
-                "OFL_YN": "",
-                "INQR_DVSN": "02",
-                "UNPR_DVSN": "01",
-                "FUND_STTL_ICLD_YN": "N",
-                "FNCG_AMT_AUTO_RDPT_YN": "N",
-                "PRCS_DVSN": "00",
-                "CTX_AREA_FK100": "",
-                "CTX_AREA_NK100": "",
-            },
+            self._tr_balance,
+            params=self._params_balance,
         )
         
         return Balance.from_kis(data)
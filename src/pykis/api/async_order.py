@@ -4,11 +4,12 @@ PyKIS 비동기 주문 API
 주문 생성, 취소, 조회의 비동기 기능을 제공합니다.
 """
 
-from datetime import datetime
 from typing import List, Optional
 
-from pykis.constants import Endpoint, TrID, OrderSide, OrderType, OrderStatus
+from pykis.api.order import _ORDER_DIVISION, _open_order_fields
+from pykis.constants import Endpoint, OrderSide, OrderType, OrderStatus, resolve_tr
 from pykis.models import Order
+from pykis.utils.clock import now_with_ms
 
 
 class AsyncOrderAPI:
@@ -32,6 +33,26 @@ class AsyncOrderAPI:
         self._acnt_prdt_cd = parts[1] if len(parts) > 1 else "01"
         
         self._is_paper = is_paper
+        
+        # 실전/모의 TR_ID는 미리 결정
+        self._tr_buy = resolve_tr("buy", is_paper)
+        self._tr_sell = resolve_tr("sell", is_paper)
+        self._tr_modify = resolve_tr("modify", is_paper)
+        self._tr_open_orders = resolve_tr("open_orders", is_paper)
+        self._tr_order = {OrderSide.BUY: self._tr_buy, OrderSide.SELL: self._tr_sell}
+        
+        # 주문 요청 본문의 계좌 필드는 호출마다 동일
+        self._account_body = {"CANO": self._cano, "ACNT_PRDT_CD": self._acnt_prdt_cd}
+        
+        # 미체결 조회 파라미터는 호출마다 동일하므로 미리 생성
+        self._params_open_orders = {
+            "CANO": self._cano,
+            "ACNT_PRDT_CD": self._acnt_prdt_cd,
+            "CTX_AREA_FK100": "",
+            "CTX_AREA_NK100": "",
+            "INQR_DVSN_1": "0",
+            "INQR_DVSN_2": "0",
+        }
     
     async def create_order(
         self,
@@ -54,30 +75,22 @@ class AsyncOrderAPI:
         Returns:
             Order 인스턴스
         """
-        if side == OrderSide.BUY:
-            tr_id = TrID.BUY_PAPER if self._is_paper else TrID.BUY
-        else:
-            tr_id = TrID.SELL_PAPER if self._is_paper else TrID.SELL
-        
-        ord_dvsn = "00" if order_type == OrderType.LIMIT else "01"
-        
         data = await self._http.post(
             Endpoint.ORDER,
-            tr_id,
+            self._tr_order[side],
             json={
-                "CANO": self._cano,
-                "ACNT_PRDT_CD": self._acnt_prdt_cd,
+                **self._account_body,
                 "PDNO": symbol,
-                "ORD_DVSN": ord_dvsn,
+                "ORD_DVSN": _ORDER_DIVISION[order_type],
                 "ORD_QTY": str(amount),
                 "ORD_UNPR": str(price or 0),
             },
         )
         
         output = data.get("output", {})
-        now = datetime.now()
+        now, now_ms = now_with_ms()
         
-        return Order(
+        return Order.model_construct(
             id=output.get("ODNO", ""),
             symbol=symbol,
             side=side,
@@ -87,7 +100,7 @@ class AsyncOrderAPI:
             price=price,
             filled=0,
             remaining=amount,
-            timestamp=int(now.timestamp() * 1000),
+            timestamp=now_ms,
             datetime=now,
         )
     
@@ -102,14 +115,11 @@ class AsyncOrderAPI:
         Returns:
             취소된 Order 인스턴스
         """
-        tr_id = TrID.MODIFY_PAPER if self._is_paper else TrID.MODIFY
-        
         await self._http.post(
             Endpoint.ORDER_MODIFY,
-            tr_id,
+            self._tr_modify,
             json={
-                "CANO": self._cano,
-                "ACNT_PRDT_CD": self._acnt_prdt_cd,
+                **self._account_body,
                 "KRX_FWDG_ORD_ORGNO": "",
                 "ORGN_ODNO": order_id,
                 "ORD_DVSN": "00",
@@ -120,9 +130,9 @@ class AsyncOrderAPI:
             },
         )
         
-        now = datetime.now()
+        now, now_ms = now_with_ms()
         
-        return Order(
+        return Order.model_construct(
             id=order_id,
             symbol=symbol,
             side=OrderSide.BUY,
@@ -132,7 +142,7 @@ class AsyncOrderAPI:
             price=None,
             filled=0,
             remaining=0,
-            timestamp=int(now.timestamp() * 1000),
+            timestamp=now_ms,
             datetime=now,
         )
     
@@ -143,38 +153,35 @@ class AsyncOrderAPI:
         Returns:
             미체결 Order 리스트
         """
-        tr_id = TrID.OPEN_ORDERS_PAPER if self._is_paper else TrID.OPEN_ORDERS
-        
         data = await self._http.get(
             Endpoint.OPEN_ORDERS,
-            tr_id,
-            params={
-                "CANO": self._cano,
-                "ACNT_PRDT_CD": self._acnt_prdt_cd,
-                "CTX_AREA_FK100": "",
-                "CTX_AREA_NK100": "",
-                "INQR_DVSN_1": "0",
-                "INQR_DVSN_2": "0",
-            },
+            self._tr_open_orders,
+            params=self._params_open_orders,
         )
         
+        # 조회 시각은 모든 주문에 공통
+        now, now_ms = now_with_ms()
+        
         orders: List[Order] = []
         for item in data.get("output", []):
-            sll_buy_cd = item.get("sll_buy_dvsn_cd", "02")
+            order_id, symbol, sll_buy_cd, qty, price, filled, remaining = _open_order_fields(item)
+            
+            # 매수/매도 구분 (01: 매도, 02: 매수)
             side = OrderSide.SELL if sll_buy_cd == "01" else OrderSide.BUY
             
-            orders.append(Order(
-                id=item.get("odno", ""),
-                symbol=item.get("pdno", ""),
-                side=side,
-                type=OrderType.LIMIT,
-                status=OrderStatus.OPEN,
-                amount=int(item.get("ord_qty", 0)),
-                price=int(float(item.get("ord_unpr", 0))),
-                filled=int(item.get("tot_ccld_qty", 0)),
-                remaining=int(item.get("psbl_qty", 0)),
-                timestamp=int(datetime.now().timestamp() * 1000),
-                datetime=datetime.now(),
+            # 주문단가는 보통 정수 문자열 ("50000"), 소수점 표기일 때만 float 경유
+            price = str(price)
+            
+            orders.append(Order.from_open(
+                order_id,
+                symbol,
+                side,
+                int(qty),
+                int(price) if price.isdigit() else int(float(price)),
+                int(filled),
+                int(remaining),
+                now,
+                now_ms,
             ))
         
         return orders
@@ -4,10 +4,31 @@ PyKIS 비동기 시세 API
 현재가, 호가, OHLCV 비동기 조회 기능을 제공합니다.
 """
 
-from typing import List, Optional
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
-from pykis.constants import Endpoint, TrID, MarketCode
-from pykis.models import Ticker, OrderBook, OHLCV
+from pykis.api.quote import (
+    MINUTE_WINDOWS,
+    _collect_minute_bars,
+    _date_windows,
+    _merge_minute_windows,
+    _merge_ohlcv_range,
+    _minute_params,
+    _minute_range_params,
+    _normalize_range,
+    _ohlcv_params,
+    _parse_ohlcv,
+    _recent_items,
+    _range_items,
+    _range_params,
+    _symbol_params,
+    _today_minute_windows,
+    _weekdays,
+)
+from pykis.constants import Endpoint, TrID
+from pykis.models import Ticker, OrderBook, OHLCV, OHLCVFrame
+from pykis.utils.cache import KST, TTLCache
 
 
 class AsyncQuoteAPI:
@@ -17,12 +38,67 @@ class AsyncQuoteAPI:
     국내 주식(KOSPI/KOSDAQ/ETF)의 시세 정보를 비동기로 조회합니다.
     """
     
-    def __init__(self, http):
+    # 기간 조회 시 동시 요청 수 (초당 처리량은 HTTP 클라이언트의 Rate Limit이 제한)
+    MAX_CONCURRENT_REQUESTS = 10
+    
+    # 최근 시세 응답 메모리 캐시 유효 시간(초, 0이면 캐시하지 않음)
+    TICKER_TTL = 0.1
+    ORDERBOOK_TTL = 0.5
+    OHLCV_TTL = 1.0
+    
+    def __init__(self, http, is_paper: bool = False):
         """
         Args:
             http: AsyncHTTPClient 인스턴스
+            is_paper: 모의투자 여부
         """
         self._http = http
+        self._is_paper = is_paper
+        self._ttl = TTLCache()
+        
+        # 진행 중인 요청 (같은 키의 동시 요청은 하나의 요청 결과를 공유)
+        self._inflight: Dict[Tuple, "asyncio.Future[Dict[str, Any]]"] = {}
+    
+    def clear_cache(self) -> None:
+        """
+        최근 시세 메모리 캐시를 비웁니다.
+        """
+        self._ttl.clear()
+    
+    async def _get_cached(
+        self,
+        key: Tuple,
+        ttl: float,
+        endpoint: str,
+        tr_id: str,
+        params: Dict[str, str],
+    ) -> Dict[str, Any]:
+        """
+        TTL 이내의 같은 요청은 이전 응답을 재사용합니다.
+        
+        캐시가 비어 있을 때 동시에 들어온 같은 요청은 한 번만 전송합니다.
+        """
+        if ttl <= 0:
+            return await self._http.get(endpoint, tr_id, params=params)
+        
+        data = self._ttl.get(key)
+        if data is not None:
+            return data
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._http.get(endpoint, tr_id, params=params))
+            self._inflight[key] = task
+            
+            def done(t: "asyncio.Future[Dict[str, Any]]") -> None:
+                self._inflight.pop(key, None)
+                if not t.cancelled() and t.exception() is None:
+                    self._ttl.set(key, t.result(), ttl)
+            
+            task.add_done_callback(done)
+        
+        # 한 호출자가 취소되어도 다른 호출자의 요청은 유지
+        return await asyncio.shield(task)
     
     async def fetch_ticker(self, symbol: str) -> Ticker:
         """
@@ -30,37 +106,54 @@ class AsyncQuoteAPI:
         
         Args:
             symbol: 종목 코드 (예: "005930")
-            
+        
         Returns:
             Ticker 인스턴스
         """
-        data = await self._http.get(
+        data = await self._get_cached(
+            ("ticker", symbol),
+            self.TICKER_TTL,
             Endpoint.PRICE,
             TrID.PRICE,
-            params={
-                "FID_COND_MRKT_DIV_CODE": MarketCode.STOCK.value,
-                "FID_INPUT_ISCD": symbol,
-            },
+            _symbol_params(symbol),
         )
         return Ticker.from_kis(data, symbol)
     
+    async def fetch_tickers(self, symbols: List[str]) -> Dict[str, Ticker]:
+        """
+        여러 종목의 현재가를 동시에 조회합니다.
+        
+        Args:
+            symbols: 종목 코드 리스트
+        
+        Returns:
+            {종목 코드: Ticker} 딕셔너리 (요청 순서 유지)
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        
+        async def fetch_one(symbol: str) -> Ticker:
+            async with semaphore:
+                return await self.fetch_ticker(symbol)
+        
+        tickers = await asyncio.gather(*(fetch_one(symbol) for symbol in symbols))
+        return dict(zip(symbols, tickers))
+    
     async def fetch_order_book(self, symbol: str) -> OrderBook:
         """
         호가를 비동기로 조회합니다.
         
         Args:
             symbol: 종목 코드 (예: "005930")
-            
+        
         Returns:
             OrderBook 인스턴스
         """
-        data = await self._http.get(
+        data = await self._get_cached(
+            ("orderbook", symbol),
+            self.ORDERBOOK_TTL,
             Endpoint.ORDERBOOK,
             TrID.ORDERBOOK,
-            params={
-                "FID_COND_MRKT_DIV_CODE": MarketCode.STOCK.value,
-                "FID_INPUT_ISCD": symbol,
-            },
+            _symbol_params(symbol),
         )
         return OrderBook.from_kis(data, symbol)
     
@@ -77,34 +170,209 @@ class AsyncQuoteAPI:
             symbol: 종목 코드 (예: "005930")
             timeframe: 기간 구분 ("1d", "1w", "1M")
             limit: 최대 개수
-            
+        
         Returns:
             OHLCV 리스트 (과거 → 최근 순)
         """
-        period_map = {"1d": "D", "1w": "W", "1M": "M"}
+        data = await self._get_cached(
+            ("ohlcv", symbol, timeframe),
+            self.OHLCV_TTL,
+            Endpoint.DAILY_PRICE,
+            TrID.DAILY_PRICE,
+            _ohlcv_params(symbol, timeframe),
+        )
+        return _parse_ohlcv(data, limit)
+    
+    async def fetch_ohlcv_frame(
+        self,
+        symbol: str,
+        timeframe: str = "1d",
+        limit: Optional[int] = None,
+    ) -> OHLCVFrame:
+        """
+        OHLCV (캔들) 데이터를 컬럼형 numpy 배열로 비동기 조회합니다.
         
-        data = await self._http.get(
+        Args:
+            symbol: 종목 코드 (예: "005930")
+            timeframe: 기간 구분 ("1d", "1w", "1M")
+            limit: 최대 개수
+        
+        Returns:
+            OHLCVFrame 인스턴스 (과거 → 최근 순)
+        """
+        data = await self._get_cached(
+            ("ohlcv", symbol, timeframe),
+            self.OHLCV_TTL,
             Endpoint.DAILY_PRICE,
             TrID.DAILY_PRICE,
-            params={
-                "FID_COND_MRKT_DIV_CODE": MarketCode.STOCK.value,
-                "FID_INPUT_ISCD": symbol,
-                "FID_INPUT_DATE_1": "",
-                "FID_INPUT_DATE_2": "",
-                "FID_PERIOD_DIV_CODE": period_map.get(timeframe, "D"),
-                "FID_ORG_ADJ_PRC": "0",
-            },
+            _ohlcv_params(symbol, timeframe),
         )
-        # 캔들 데이터 파싱 (API 버전에 따라 output 또는 output2)
-        items = data.get("output2") or data.get("output") or []
+        return OHLCVFrame.from_kis(_recent_items(data, limit))
+    
+    async def fetch_snapshot(
+        self,
+        symbol: str,
+        timeframe: str = "1d",
+        limit: Optional[int] = None,
+    ) -> Tuple[Ticker, OrderBook, List[OHLCV]]:
+        """
+        현재가, 호가, OHLCV를 동시에 비동기로 조회합니다.
         
-        # items가 dict인 경우 리스트로 변환
-        if isinstance(items, dict):
-            items = []
+        Args:
+            symbol: 종목 코드 (예: "005930")
+            timeframe: OHLCV 기간 구분 ("1d", "1w", "1M")
+            limit: OHLCV 최대 개수
         
-        ohlcv_list = [OHLCV.from_kis(item) for item in items if item]
+        Returns:
+            (Ticker, OrderBook, OHLCV 리스트) 튜플
+        """
+        ticker_data, orderbook_data, ohlcv_data = await self._http.batch([
+            (Endpoint.PRICE, TrID.PRICE, _symbol_params(symbol)),
+            (Endpoint.ORDERBOOK, TrID.ORDERBOOK, _symbol_params(symbol)),
+            (Endpoint.DAILY_PRICE, TrID.DAILY_PRICE, _ohlcv_params(symbol, timeframe)),
+        ])
+        return (
+            Ticker.from_kis(ticker_data, symbol),
+            OrderBook.from_kis(orderbook_data, symbol),
+            _parse_ohlcv(ohlcv_data, limit),
+        )
+    
+    async def fetch_ohlcv_range(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: Optional[str] = None,
+        timeframe: str = "1d",
+    ) -> List[OHLCV]:
+        """
+        특정 기간의 OHLCV (캔들) 데이터를 비동기로 조회합니다.
+        
+        기간을 API 1회 호출 단위 구간으로 나누어 동시에 요청합니다.
+        
+        Args:
+            symbol: 종목 코드 (예: "005930")
+            start_date: 시작일 ("YYYYMMDD" 또는 "YYYY-MM-DD")
+            end_date: 종료일 ("YYYYMMDD" 또는 "YYYY-MM-DD", 기본: 오늘)
+            timeframe: 기간 구분 ("1d", "1w", "1M")
+        
+        Returns:
+            OHLCV 리스트 (과거 → 최근 순)
+        """
+        start, end = _normalize_range(start_date, end_date)
+        responses = await self._fetch_range_windows(symbol, start, end, timeframe)
+        
+        return _merge_ohlcv_range(responses, start, end)
+    
+    async def fetch_ohlcv_range_frame(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: Optional[str] = None,
+        timeframe: str = "1d",
+    ) -> OHLCVFrame:
+        """
+        특정 기간의 OHLCV 데이터를 컬럼형 numpy 배열로 비동기 조회합니다.
+        
+        Args:
+            symbol: 종목 코드 (예: "005930")
+            start_date: 시작일 ("YYYYMMDD" 또는 "YYYY-MM-DD")
+            end_date: 종료일 ("YYYYMMDD" 또는 "YYYY-MM-DD", 기본: 오늘)
+            timeframe: 기간 구분 ("1d", "1w", "1M")
+        
+        Returns:
+            OHLCVFrame 인스턴스 (과거 → 최근 순)
+        """
+        start, end = _normalize_range(start_date, end_date)
+        responses = await self._fetch_range_windows(symbol, start, end, timeframe)
+        return OHLCVFrame.from_kis(_range_items(responses, start, end))
+    
+    async def _fetch_range_windows(
+        self,
+        symbol: str,
+        start: str,
+        end: str,
+        timeframe: str,
+    ) -> List[dict]:
+        """
+        기간을 구간별로 나누어 동시에 요청합니다.
+        """
+        return await self._http.batch([
+            (Endpoint.DAILY_CHART, TrID.DAILY_CHART,
+             _range_params(symbol, window_start, window_end, timeframe))
+            for window_start, window_end in _date_windows(start, end, timeframe)
+        ], limit=self.MAX_CONCURRENT_REQUESTS)
+    
+    async def fetch_minute_ohlcv(
+        self,
+        symbol: str,
+        interval: int = 1,
+    ) -> List[OHLCV]:
+        """
+        당일 분봉 데이터를 비동기로 조회합니다.
+        
+        조회 기준 시각별 구간(각 30건)을 동시에 요청한 뒤 병합합니다.
+        
+        Args:
+            symbol: 종목 코드 (예: "005930")
+            interval: 분 간격 (1, 3, 5, 10, 15, 30, 60)
+        
+        Returns:
+            OHLCV 리스트 (과거 → 최근 순)
+        """
+        windows = _today_minute_windows(datetime.now(KST).strftime("%H%M%S"))
+        responses = await self._http.batch([
+            (Endpoint.MINUTE_CHART, TrID.MINUTE_CHART, _minute_params(symbol, hour))
+            for hour in windows
+        ])
+        
+        all_data: Dict[int, OHLCV] = {}
+        for data in responses:
+            _collect_minute_bars(data.get("output2", []), None, None, interval, all_data)
+        
+        return [all_data[key] for key in sorted(all_data)]
+    
+    async def fetch_minute_ohlcv_range(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: Optional[str] = None,
+        interval: int = 1,
+    ) -> List[OHLCV]:
+        """
+        특정 기간의 분봉 데이터를 비동기로 조회합니다. (실전투자 전용)
+        
+        날짜 x 조회 기준 시각(MINUTE_WINDOWS) 구간을 동시에 요청한 뒤 병합합니다.
         
-        if limit:
-            ohlcv_list = ohlcv_list[:limit]
+        Args:
+            symbol: 종목 코드 (예: "005930")
+            start_date: 시작일 ("YYYYMMDD" 또는 "YYYY-MM-DD")
+            end_date: 종료일 ("YYYYMMDD" 또는 "YYYY-MM-DD", 기본: 오늘)
+            interval: 분 간격 (1, 3, 5, 10, 15, 30, 60)
         
-        return list(reversed(ohlcv_list))
+        Returns:
+            OHLCV 리스트 (과거 → 최근 순)
+        
+        Raises:
+            ValueError: 모의투자에서 호출한 경우
+            RateLimitError: Rate Limit 초과로 일부 구간을 받지 못한 경우
+        """
+        if self._is_paper:
+            raise ValueError("fetch_minute_ohlcv_range는 실전투자에서만 사용 가능합니다. 모의투자는 fetch_minute_ohlcv로 당일 데이터만 조회하세요.")
+        
+        start, end = _normalize_range(start_date, end_date)
+        
+        # 날짜 x 조회 기준 시각 구간을 한 번에 전송 (휴장일 등 오류 구간은 건너뜀)
+        windows = [(date, hour) for date in _weekdays(start, end) for hour in MINUTE_WINDOWS]
+        responses = await self._http.batch(
+            [
+                (
+                    Endpoint.MINUTE_CHART_DAILY,
+                    TrID.MINUTE_CHART_DAILY,
+                    _minute_range_params(symbol, date, hour),
+                )
+                for date, hour in windows
+            ],
+            return_exceptions=True,
+            limit=self.MAX_CONCURRENT_REQUESTS,
+        )
+        return _merge_minute_windows(responses, start, end, interval)
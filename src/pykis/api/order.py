@@ -4,11 +4,44 @@ PyKIS 주문 API
 주문 생성, 취소, 조회 기능을 제공합니다.
 """
 
-from datetime import datetime
-from typing import List, Optional
+from collections import ChainMap
+from operator import itemgetter
+from typing import List, Optional, Tuple
 
-from pykis.constants import Endpoint, TrID, OrderSide, OrderType, OrderStatus
+from pykis.constants import Endpoint, OrderSide, OrderType, OrderStatus, resolve_tr
 from pykis.models import Order
+from pykis.utils.clock import now_with_ms
+
+
+# 미체결 조회 응답 필드 (주문번호, 종목, 매도매수구분, 주문수량, 주문단가, 체결수량, 가능수량)
+_OPEN_ORDER_FIELDS = itemgetter(
+    "odno", "pdno", "sll_buy_dvsn_cd", "ord_qty", "ord_unpr", "tot_ccld_qty", "psbl_qty",
+)
+_OPEN_ORDER_DEFAULTS = {
+    "odno": "",
+    "pdno": "",
+    "sll_buy_dvsn_cd": "02",
+    "ord_qty": 0,
+    "ord_unpr": "0",
+    "tot_ccld_qty": 0,
+    "psbl_qty": 0,
+}
+
+
+# 주문구분 (00: 지정가, 01: 시장가)
+_ORDER_DIVISION = {OrderType.LIMIT: "00", OrderType.MARKET: "01"}
+
+
+def _open_order_fields(item: dict) -> Tuple:
+    """
+    미체결 주문 항목에서 필요한 필드를 한 번에 추출합니다.
+    
+    누락된 필드가 있을 때만 기본값을 적용합니다.
+    """
+    try:
+        return _OPEN_ORDER_FIELDS(item)
+    except KeyError:
+        return _OPEN_ORDER_FIELDS(ChainMap(item, _OPEN_ORDER_DEFAULTS))
 
 
 class OrderAPI:
@@ -33,6 +66,26 @@ class OrderAPI:
         self._acnt_prdt_cd = parts[1] if len(parts) > 1 else "01"
         
         self._is_paper = is_paper
+        
+        # 실전/모의 TR_ID는 미리 결정
+        self._tr_buy = resolve_tr("buy", is_paper)
+        self._tr_sell = resolve_tr("sell", is_paper)
+        self._tr_modify = resolve_tr("modify", is_paper)
+        self._tr_open_orders = resolve_tr("open_orders", is_paper)
+        self._tr_order = {OrderSide.BUY: self._tr_buy, OrderSide.SELL: self._tr_sell}
+        
+        # 주문 요청 본문의 계좌 필드는 호출마다 동일
+        self._account_body = {"CANO": self._cano, "ACNT_PRDT_CD": self._acnt_prdt_cd}
+        
+        # 미체결 조회 파라미터는 호출마다 동일하므로 미리 생성
+        self._params_open_orders = {
+            "CANO": self._cano,
+            "ACNT_PRDT_CD": self._acnt_prdt_cd,
+            "CTX_AREA_FK100": "",
+            "CTX_AREA_NK100": "",
+            "INQR_DVSN_1": "0",  # 0: 전체, 1: 매도, 2: 매수
+            "INQR_DVSN_2": "0",
+        }
     
     def create_order(
         self,
@@ -55,32 +108,22 @@ class OrderAPI:
         Returns:
             Order 인스턴스 (주문번호 포함)
         """
-        # TR_ID 선택 (실전/모의, 매수/매도)
-        if side == OrderSide.BUY:
-            tr_id = TrID.BUY_PAPER if self._is_paper else TrID.BUY
-        else:
-            tr_id = TrID.SELL_PAPER if self._is_paper else TrID.SELL
-        
-        # 주문구분 (00: 지정가, 01: 시장가)
-        ord_dvsn = "00" if order_type == OrderType.LIMIT else "01"
-        
         data = self._http.post(
             Endpoint.ORDER,
-            tr_id,
+            self._tr_order[side],
             json={
-                "CANO": self._cano,
-                "ACNT_PRDT_CD": self._acnt_prdt_cd,
+                **self._account_body,
                 "PDNO": symbol,
-                "ORD_DVSN": ord_dvsn,
+                "ORD_DVSN": _ORDER_DIVISION[order_type],
                 "ORD_QTY": str(amount),
                 "ORD_UNPR": str(price or 0),
             },
         )
         
         output = data.get("output", {})
-        now = datetime.now()
+        now, now_ms = now_with_ms()
         
-        return Order(
+        return Order.model_construct(
             id=output.get("ODNO", ""),
             symbol=symbol,
             side=side,
@@ -90,7 +133,7 @@ class OrderAPI:
             price=price,
             filled=0,
             remaining=amount,
-            timestamp=int(now.timestamp() * 1000),
+            timestamp=now_ms,
             datetime=now,
         )
     
@@ -105,14 +148,11 @@ class OrderAPI:
         Returns:
             취소된 Order 인스턴스
         """
-        tr_id = TrID.MODIFY_PAPER if self._is_paper else TrID.MODIFY
-        
         self._http.post(
             Endpoint.ORDER_MODIFY,
-            tr_id,
+            self._tr_modify,
             json={
-                "CANO": self._cano,
-                "ACNT_PRDT_CD": self._acnt_prdt_cd,
+                **self._account_body,
                 "KRX_FWDG_ORD_ORGNO": "",
                 "ORGN_ODNO": order_id,
                 "ORD_DVSN": "00",
@@ -123,9 +163,9 @@ class OrderAPI:
             },
         )
         
-        now = datetime.now()
+        now, now_ms = now_with_ms()
         
-        return Order(
+        return Order.model_construct(
             id=order_id,
             symbol=symbol,
             side=OrderSide.BUY,           # 원본 정보 없음
@@ -135,7 +175,7 @@ class OrderAPI:
             price=None,
             filled=0,
             remaining=0,
-            timestamp=int(now.timestamp() * 1000),
+            timestamp=now_ms,
             datetime=now,
         )
     
@@ -146,39 +186,35 @@ class OrderAPI:
         Returns:
             미체결 Order 리스트
         """
-        tr_id = TrID.OPEN_ORDERS_PAPER if self._is_paper else TrID.OPEN_ORDERS
-        
         data = self._http.get(
             Endpoint.OPEN_ORDERS,
-            tr_id,
-            params={
-                "CANO": self._cano,
-                "ACNT_PRDT_CD": self._acnt_prdt_cd,
-                "CTX_AREA_FK100": "",
-                "CTX_AREA_NK100": "",
-                "INQR_DVSN_1": "0",  # 0: 전체, 1: 매도, 2: 매수
-                "INQR_DVSN_2": "0",
-            },
+            self._tr_open_orders,
+            params=self._params_open_orders,
         )
         
+        # 조회 시각은 모든 주문에 공통
+        now, now_ms = now_with_ms()
+        
         orders: List[Order] = []
         for item in data.get("output", []):
+            order_id, symbol, sll_buy_cd, qty, price, filled, remaining = _open_order_fields(item)
+            
             # 매수/매도 구분 (01: 매도, 02: 매수)
-            sll_buy_cd = item.get("sll_buy_dvsn_cd", "02")
             side = OrderSide.SELL if sll_buy_cd == "01" else OrderSide.BUY
             
-            orders.append(Order(
-                id=item.get("odno", ""),
-                symbol=item.get("pdno", ""),
-                side=side,
-                type=OrderType.LIMIT,  # 미체결 조회에서는 기본 지정가
-                status=OrderStatus.OPEN,
-                amount=int(item.get("ord_qty", 0)),
-                price=int(float(item.get("ord_unpr", 0))),
-                filled=int(item.get("tot_ccld_qty", 0)),
-                remaining=int(item.get("psbl_qty", 0)),
-                timestamp=int(datetime.now().timestamp() * 1000),
-                datetime=datetime.now(),
+            # 주문단가는 보통 정수 문자열 ("50000"), 소수점 표기일 때만 float 경유
+            price = str(price)
+            
+            orders.append(Order.from_open(
+                order_id,
+                symbol,
+                side,
+                int(qty),
+                int(price) if price.isdigit() else int(float(price)),
+                int(filled),
+                int(remaining),
+                now,
+                now_ms,
             ))
         
         return orders
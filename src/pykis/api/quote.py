@@ -4,12 +4,350 @@ PyKIS 시세 API
 현재가, 호가, OHLCV 조회 기능을 제공합니다.
 """
 
-import time
+from collections import ChainMap
 from datetime import datetime, timedelta
-from typing import List, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
 
 from pykis.constants import Endpoint, TrID, MarketCode
-from pykis.models import Ticker, OrderBook, OHLCV
+from pykis.exceptions import APIError, RateLimitError
+from pykis.models import Ticker, OrderBook, OHLCV, OHLCVFrame
+from pykis.models.ohlcv import parse_kis_datetime
+from pykis.utils.cache import KST, TTLCache
+
+
+# timeframe → KIS 기간 구분 코드
+PERIOD_MAP = {
+    "1d": "D",  # 일봉
+    "1w": "W",  # 주봉
+    "1M": "M",  # 월봉
+}
+
+# 시장 분류 코드 (주식/ETF)
+_MARKET = MarketCode.STOCK.value
+
+
+@lru_cache(maxsize=1024)
+def _symbol_params(symbol: str) -> Dict[str, str]:
+    """
+    현재가/호가 조회용 요청 파라미터를 생성합니다.
+    
+    종목별로 한 번만 생성해 재사용하므로 반환값을 수정하면 안 됩니다.
+    """
+    return {
+        "FID_COND_MRKT_DIV_CODE": _MARKET,
+        "FID_INPUT_ISCD": symbol,
+    }
+
+
+@lru_cache(maxsize=1024)
+def _ohlcv_params(symbol: str, timeframe: str) -> Dict[str, str]:
+    """
+    최근 OHLCV 조회용 요청 파라미터를 생성합니다.
+    
+    종목/기간 구분별로 한 번만 생성해 재사용하므로 반환값을 수정하면 안 됩니다.
+    """
+    return {
+        "FID_COND_MRKT_DIV_CODE": _MARKET,
+        "FID_INPUT_ISCD": symbol,
+        "FID_INPUT_DATE_1": "",        # 시작일 (빈 문자열 = 최근)
+        "FID_INPUT_DATE_2": "",        # 종료일
+        "FID_PERIOD_DIV_CODE": PERIOD_MAP.get(timeframe, "D"),
+        "FID_ORG_ADJ_PRC": "0",        # 0: 수정주가 반영
+    }
+
+
+def _date_windows(start: str, end: str, timeframe: str) -> List[Tuple[str, str]]:
+    """
+    기간 조회를 API 1회 호출로 처리 가능한 구간으로 나눕니다.
+    
+    API 호출당 약 100개가 반환되므로 일봉은 150일(≈100 거래일),
+    주/월봉은 1년 단위로 나눕니다.
+    
+    Args:
+        start: 시작일 (YYYYMMDD)
+        end: 종료일 (YYYYMMDD)
+        timeframe: 기간 구분 ("1d", "1w", "1M")
+    
+    Returns:
+        (구간 시작일, 구간 종료일) 리스트 (최근 → 과거 순)
+    """
+    chunk_days = 150 if timeframe == "1d" else 365
+    
+    start_dt = parse_kis_datetime(start)
+    current_end = parse_kis_datetime(end)
+    
+    windows = []
+    while current_end >= start_dt:
+        current_start = max(start_dt, current_end - timedelta(days=chunk_days))
+        windows.append((current_start.strftime("%Y%m%d"), current_end.strftime("%Y%m%d")))
+        current_end = current_start - timedelta(days=1)
+    
+    return windows
+
+
+def _range_params(symbol: str, start: str, end: str, timeframe: str) -> Dict[str, str]:
+    """
+    기간별 OHLCV 조회용 요청 파라미터를 생성합니다.
+    """
+    return {
+        "FID_COND_MRKT_DIV_CODE": _MARKET,
+        "FID_INPUT_ISCD": symbol,
+        "FID_INPUT_DATE_1": start,
+        "FID_INPUT_DATE_2": end,
+        "FID_PERIOD_DIV_CODE": PERIOD_MAP.get(timeframe, "D"),
+        "FID_ORG_ADJ_PRC": "0",
+    }
+
+
+def _range_items(
+    responses: List[Dict[str, Any]],
+    start: str,
+    end: str,
+) -> List[Dict[str, Any]]:
+    """
+    구간별 응답의 캔들 항목을 병합합니다 (중복 제거, 기간 필터).
+    
+    키는 YYYYMMDD 정수이며, 같은 날짜는 처음 나온 항목을 사용합니다.
+    
+    Returns:
+        캔들 항목 리스트 (과거 → 최근 순)
+    """
+    all_items: Dict[int, Dict[str, Any]] = {}
+    for data in responses:
+        for item in data.get("output2", []):
+            date_str = item.get("stck_bsop_date", "")
+            if not date_str or not start <= date_str <= end:
+                continue
+            all_items.setdefault(int(date_str), item)
+    
+    return [all_items[key] for key in sorted(all_items)]
+
+
+def _merge_ohlcv_range(
+    responses: List[Dict[str, Any]],
+    start: str,
+    end: str,
+) -> List[OHLCV]:
+    """
+    구간별 응답을 병합합니다 (중복 제거, 기간 필터).
+    
+    Returns:
+        OHLCV 리스트 (과거 → 최근 순)
+    """
+    return [OHLCV.from_kis(item) for item in _range_items(responses, start, end)]
+
+
+def _normalize_range(start_date: str, end_date: Optional[str]) -> Tuple[str, str]:
+    """
+    기간 조회 날짜를 YYYYMMDD로 정규화합니다. (종료일 기본: 오늘)
+    """
+    start = start_date.replace("-", "")
+    end = end_date.replace("-", "") if end_date else datetime.now().strftime("%Y%m%d")
+    return start, end
+
+
+# 과거 분봉 조회 기준 시각 (각 요청은 해당 시각 이전 최대 120건, 09:00 ~ 15:30 커버)
+MINUTE_WINDOWS = ("153000", "133000", "113000", "093000")
+
+# 당일 분봉 조회 기준 시각 (각 요청은 해당 시각 이전 최대 30건, 09:00 ~ 15:30 커버)
+TODAY_MINUTE_WINDOWS = tuple(
+    f"{minutes // 60:02d}{minutes % 60:02d}00"
+    for minutes in range(15 * 60 + 30, 9 * 60 - 1, -30)
+)
+
+# 분봉 응답 필드 (영업일자, 체결시각, 시가, 고가, 저가, 현재가, 체결거래량)
+_MINUTE_FIELDS = itemgetter(
+    "stck_bsop_date", "stck_cntg_hour",
+    "stck_oprc", "stck_hgpr", "stck_lwpr", "stck_prpr", "cntg_vol",
+)
+_MINUTE_DEFAULTS = {
+    "stck_bsop_date": "", "stck_cntg_hour": "",
+    "stck_oprc": 0, "stck_hgpr": 0, "stck_lwpr": 0, "stck_prpr": 0, "cntg_vol": 0,
+}
+
+
+def _weekdays(start: str, end: str) -> List[str]:
+    """
+    기간 내 평일(월~금)을 최근 → 과거 순으로 반환합니다.
+    
+    주말은 장이 열리지 않아 직전 거래일 분봉만 중복 반환되므로 제외합니다.
+    공휴일은 요청 후 오류 구간으로 건너뜁니다.
+    
+    Args:
+        start: 시작일 (YYYYMMDD)
+        end: 종료일 (YYYYMMDD)
+    """
+    start_dt = parse_kis_datetime(start)
+    end_dt = parse_kis_datetime(end)
+    days = (end_dt - timedelta(days=offset) for offset in range((end_dt - start_dt).days + 1))
+    return [day.strftime("%Y%m%d") for day in days if day.weekday() < 5]
+
+
+def _today_minute_windows(now: str) -> List[str]:
+    """
+    현재 시각(HHMMSS) 기준으로 당일 분봉 조회 기준 시각을 반환합니다.
+    
+    아직 오지 않은 시각은 최신 데이터와 중복되므로 제외하고,
+    장중이면 현재 시각을 첫 구간으로 추가합니다.
+    """
+    windows = [hour for hour in TODAY_MINUTE_WINDOWS if hour <= now]
+    if len(windows) < len(TODAY_MINUTE_WINDOWS):
+        windows.insert(0, now)
+    return windows
+
+
+def _minute_params(symbol: str, hour: str) -> Dict[str, str]:
+    """
+    당일 분봉 조회용 요청 파라미터를 생성합니다.
+    """
+    return {
+        "FID_ETC_CLS_CODE": "",
+        "FID_COND_MRKT_DIV_CODE": _MARKET,
+        "FID_INPUT_ISCD": symbol,
+        "FID_INPUT_HOUR_1": hour,
+        "FID_PW_DATA_INCU_YN": "N",
+    }
+
+
+def _minute_range_params(symbol: str, date: str, hour: str) -> Dict[str, str]:
+    """
+    과거 분봉 조회용 요청 파라미터를 생성합니다.
+    """
+    return {
+        "FID_COND_MRKT_DIV_CODE": _MARKET,
+        "FID_INPUT_ISCD": symbol,
+        "FID_INPUT_DATE_1": date,
+        "FID_INPUT_HOUR_1": hour,
+        "FID_PW_DATA_INCU_YN": "Y",
+        "FID_FAKE_TICK_INCU_YN": "",
+    }
+
+
+def _collect_minute_bars(
+    items: List[Dict[str, Any]],
+    start: Optional[str],
+    end: Optional[str],
+    interval: int,
+    out: Dict[int, OHLCV],
+) -> None:
+    """
+    분봉 응답 항목을 OHLCV로 변환해 out에 모읍니다.
+    
+    키는 (영업일자 << 24 | 체결시각) 정수이며, 이미 있는 분봉은 건너뜁니다.
+    
+    Args:
+        items: 응답의 output2 항목
+        start: 시작일 (YYYYMMDD, None이면 날짜 필터 없음)
+        end: 종료일 (YYYYMMDD)
+        interval: 분 간격
+        out: 결과 저장 dict
+    """
+    # 반복문 안에서 자주 쓰는 이름은 지역 변수로 바인딩
+    _float = float
+    _int = int
+    from_bar = OHLCV.from_bar
+    
+    for item in items:
+        try:
+            date_str, time_str, o, h, lo, c, v = _MINUTE_FIELDS(item)
+        except KeyError:
+            date_str, time_str, o, h, lo, c, v = _MINUTE_FIELDS(ChainMap(item, _MINUTE_DEFAULTS))
+        
+        if not date_str or not time_str:
+            continue
+        
+        # 날짜 범위 확인
+        if start is not None and (date_str < start or date_str > end):
+            continue
+        
+        # 분 간격 필터링
+        if interval > 1 and _int(time_str[2:4]) % interval != 0:
+            continue
+        
+        try:
+            key = (_int(date_str) << 24) | _int(time_str)
+        except ValueError:
+            continue
+        if key in out:
+            continue
+        
+        out[key] = from_bar(
+            parse_kis_datetime(date_str, time_str),
+            _float(o),
+            _float(h),
+            _float(lo),
+            _float(c),
+            _int(v),
+        )
+
+
+def _merge_minute_windows(
+    responses: List[Any],
+    start: str,
+    end: str,
+    interval: int,
+) -> List[OHLCV]:
+    """
+    분봉 구간 응답(batch(return_exceptions=True) 결과)을 시간순으로 병합합니다.
+    
+    휴장일 등 데이터가 없는 구간의 APIError는 건너뛰지만,
+    Rate Limit 초과는 구간이 누락되므로 그대로 발생시킵니다.
+    
+    Raises:
+        RateLimitError: Rate Limit 초과로 실패한 구간이 있는 경우
+    """
+    all_data: Dict[int, OHLCV] = {}
+    for data in responses:
+        if isinstance(data, RateLimitError):
+            raise data
+        if isinstance(data, APIError):
+            continue
+        if isinstance(data, BaseException):
+            raise data
+        _collect_minute_bars(data.get("output2", []), start, end, interval, all_data)
+    
+    # 키가 (일자, 시각) 순서이므로 키 정렬이 곧 시간순 정렬
+    return [all_data[key] for key in sorted(all_data)]
+
+
+def _recent_items(data: Dict[str, Any], limit: Optional[int]) -> List[Dict[str, Any]]:
+    """
+    최근 OHLCV 응답에서 최근 limit개 캔들 항목을 추출합니다.
+    
+    Returns:
+        캔들 항목 리스트 (과거 → 최근 순)
+    """
+    # 캔들 데이터 (API 버전에 따라 output 또는 output2)
+    items = data.get("output2") or data.get("output") or []
+    
+    # items가 dict인 경우 리스트로 변환
+    if isinstance(items, dict):
+        items = []
+    
+    # 응답은 최근 → 과거 순이므로 limit개까지만 선택
+    selected: List[Dict[str, Any]] = []
+    for item in items:
+        if not item:
+            continue
+        selected.append(item)
+        if limit and len(selected) >= limit:
+            break
+    
+    # 과거 → 최근 순으로 뒤집어 반환 (제자리)
+    selected.reverse()
+    return selected
+
+
+def _parse_ohlcv(data: Dict[str, Any], limit: Optional[int]) -> List[OHLCV]:
+    """
+    최근 OHLCV 응답을 파싱합니다.
+    
+    Returns:
+        OHLCV 리스트 (과거 → 최근 순)
+    """
+    return [OHLCV.from_kis(item) for item in _recent_items(data, limit)]
 
 
 class QuoteAPI:
@@ -22,16 +360,48 @@ class QuoteAPI:
     # API 호출당 최대 반환 개수
     MAX_OHLCV_PER_REQUEST = 100
     
+    # 최근 시세 응답 메모리 캐시 유효 시간(초, 0이면 캐시하지 않음)
+    TICKER_TTL = 0.1
+    ORDERBOOK_TTL = 0.5
+    OHLCV_TTL = 1.0
+    
     def __init__(self, http, is_paper: bool = False):
         """
         Args:
             http: HTTPClient 인스턴스
-            is_paper: 모의투자 여부 (Rate Limit 결정용)
+            is_paper: 모의투자 여부
+        
+        Note:
+            Rate Limit(모의 초당 2건, 실전 초당 20건)은 HTTP 클라이언트의
+            토큰 버킷이 요청마다 적용합니다.
         """
         self._http = http
         self._is_paper = is_paper
-        # Rate Limit: 모의투자 초당 2건, 실전 초당 20건
-        self._delay = 0.5 if is_paper else 0.05
+        self._ttl = TTLCache()
+    
+    def clear_cache(self) -> None:
+        """
+        최근 시세 메모리 캐시를 비웁니다.
+        """
+        self._ttl.clear()
+    
+    def _get_cached(
+        self,
+        key: Tuple,
+        ttl: float,
+        endpoint: str,
+        tr_id: str,
+        params: Dict[str, str],
+    ) -> Dict[str, Any]:
+        """
+        TTL 이내의 같은 요청은 이전 응답을 재사용합니다.
+        """
+        data = self._ttl.get(key) if ttl > 0 else None
+        if data is None:
+            data = self._http.get(endpoint, tr_id, params=params)
+            if ttl > 0:
+                self._ttl.set(key, data, ttl)
+        return data
     
     def fetch_ticker(self, symbol: str) -> Ticker:
         """
@@ -39,37 +409,68 @@ class QuoteAPI:
         
         Args:
             symbol: 종목 코드 (예: "005930")
-            
+        
         Returns:
             Ticker 인스턴스
         """
-        data = self._http.get(
+        data = self._get_cached(
+            ("ticker", symbol),
+            self.TICKER_TTL,
             Endpoint.PRICE,
             TrID.PRICE,
-            params={
-                "FID_COND_MRKT_DIV_CODE": MarketCode.STOCK.value,
-                "FID_INPUT_ISCD": symbol,
-            },
+            _symbol_params(symbol),
         )
         return Ticker.from_kis(data, symbol)
     
+    def fetch_tickers(self, symbols: List[str]) -> Dict[str, Ticker]:
+        """
+        여러 종목의 현재가를 병렬로 조회합니다.
+        
+        fetch_ticker와 같은 메모리 캐시를 사용하며, 캐시에 없는 종목만 한 번에 요청합니다.
+        
+        Args:
+            symbols: 종목 코드 리스트
+        
+        Returns:
+            {종목 코드: Ticker} 딕셔너리 (요청 순서 유지)
+        """
+        ttl = self.TICKER_TTL
+        cached = {}
+        if ttl > 0:
+            for symbol in symbols:
+                data = self._ttl.get(("ticker", symbol))
+                if data is not None:
+                    cached[symbol] = data
+        
+        missing = [symbol for symbol in dict.fromkeys(symbols) if symbol not in cached]
+        if missing:
+            responses = self._http.batch([
+                (Endpoint.PRICE, TrID.PRICE, _symbol_params(symbol))
+                for symbol in missing
+            ])
+            for symbol, data in zip(missing, responses):
+                cached[symbol] = data
+                if ttl > 0:
+                    self._ttl.set(("ticker", symbol), data, ttl)
+        
+        return {symbol: Ticker.from_kis(cached[symbol], symbol) for symbol in symbols}
+    
     def fetch_order_book(self, symbol: str) -> OrderBook:
         """
         호가를 조회합니다.
         
         Args:
             symbol: 종목 코드 (예: "005930")
-            
+        
         Returns:
             OrderBook 인스턴스 (매수/매도 각 10단계)
         """
-        data = self._http.get(
+        data = self._get_cached(
+            ("orderbook", symbol),
+            self.ORDERBOOK_TTL,
             Endpoint.ORDERBOOK,
             TrID.ORDERBOOK,
-            params={
-                "FID_COND_MRKT_DIV_CODE": MarketCode.STOCK.value,
-                "FID_INPUT_ISCD": symbol,
-            },
+            _symbol_params(symbol),
         )
         return OrderBook.from_kis(data, symbol)
     
@@ -89,45 +490,77 @@ class QuoteAPI:
                 - "1w": 주봉
                 - "1M": 월봉
             limit: 최대 개수 (기본: 100)
-            
+        
         Returns:
             OHLCV 리스트 (과거 → 최근 순)
         """
-        # timeframe을 KIS API 형식으로 변환
-        period_map = {
-            "1d": "D",  # 일봉
-            "1w": "W",  # 주봉
-            "1M": "M",  # 월봉
-        }
-        
-        data = self._http.get(
+        data = self._get_cached(
+            ("ohlcv", symbol, timeframe),
+            self.OHLCV_TTL,
             Endpoint.DAILY_PRICE,
             TrID.DAILY_PRICE,
-            params={
-                "FID_COND_MRKT_DIV_CODE": MarketCode.STOCK.value,
-                "FID_INPUT_ISCD": symbol,
-                "FID_INPUT_DATE_1": "",        # 시작일 (빈 문자열 = 최근)
-                "FID_INPUT_DATE_2": "",        # 종료일
-                "FID_PERIOD_DIV_CODE": period_map.get(timeframe, "D"),
-                "FID_ORG_ADJ_PRC": "0",        # 0: 수정주가 반영
-            },
+            _ohlcv_params(symbol, timeframe),
         )
+        return _parse_ohlcv(data, limit)
+    
+    def fetch_ohlcv_frame(
+        self,
+        symbol: str,
+        timeframe: str = "1d",
+        limit: Optional[int] = None,
+    ) -> OHLCVFrame:
+        """
+        OHLCV (캔들) 데이터를 컬럼형 numpy 배열로 조회합니다.
         
-        # 캔들 데이터 파싱 (API 버전에 따라 output 또는 output2)
-        items = data.get("output2") or data.get("output") or []
+        Args:
+            symbol: 종목 코드 (예: "005930")
+            timeframe: 기간 구분 ("1d", "1w", "1M")
+            limit: 최대 개수 (기본: 100)
         
-        # items가 dict인 경우 리스트로 변환
-        if isinstance(items, dict):
-            items = []
+        Returns:
+            OHLCVFrame 인스턴스 (과거 → 최근 순)
+        
+        Raises:
+            ImportError: numpy가 설치되지 않은 경우
+        """
+        data = self._get_cached(
+            ("ohlcv", symbol, timeframe),
+            self.OHLCV_TTL,
+            Endpoint.DAILY_PRICE,
+            TrID.DAILY_PRICE,
+            _ohlcv_params(symbol, timeframe),
+        )
+        return OHLCVFrame.from_kis(_recent_items(data, limit))
+    
+    def fetch_snapshot(
+        self,
+        symbol: str,
+        timeframe: str = "1d",
+        limit: Optional[int] = None,
+    ) -> Tuple[Ticker, OrderBook, List[OHLCV]]:
+        """
+        현재가, 호가, OHLCV를 한 번에 조회합니다.
         
-        ohlcv_list = [OHLCV.from_kis(item) for item in items if item]
+        세 요청을 동시에 보내므로 개별 호출을 순서대로 하는 것보다 빠릅니다.
         
-        # limit 적용
-        if limit:
-            ohlcv_list = ohlcv_list[:limit]
+        Args:
+            symbol: 종목 코드 (예: "005930")
+            timeframe: OHLCV 기간 구분 ("1d", "1w", "1M")
+            limit: OHLCV 최대 개수
         
-        # 과거 → 최근 순으로 정렬하여 반환
-        return list(reversed(ohlcv_list))
+        Returns:
+            (Ticker, OrderBook, OHLCV 리스트) 튜플
+        """
+        ticker_data, orderbook_data, ohlcv_data = self._http.batch([
+            (Endpoint.PRICE, TrID.PRICE, _symbol_params(symbol)),
+            (Endpoint.ORDERBOOK, TrID.ORDERBOOK, _symbol_params(symbol)),
+            (Endpoint.DAILY_PRICE, TrID.DAILY_PRICE, _ohlcv_params(symbol, timeframe)),
+        ])
+        return (
+            Ticker.from_kis(ticker_data, symbol),
+            OrderBook.from_kis(orderbook_data, symbol),
+            _parse_ohlcv(ohlcv_data, limit),
+        )
     
     def fetch_ohlcv_range(
         self,
@@ -139,17 +572,17 @@ class QuoteAPI:
         """
         특정 기간의 OHLCV (캔들) 데이터를 조회합니다.
         
-        내부적으로 여러 번 API를 호출하여 전체 기간의 데이터를 수집합니다.
+        기간을 API 1회 호출 단위 구간으로 나누어 병렬로 요청한 뒤 병합합니다.
         
         Args:
             symbol: 종목 코드 (예: "005930")
             start_date: 시작일 ("YYYYMMDD" 또는 "YYYY-MM-DD")
             end_date: 종료일 ("YYYYMMDD" 또는 "YYYY-MM-DD", 기본: 오늘)
             timeframe: 기간 구분 ("1d", "1w", "1M")
-            
+        
         Returns:
             OHLCV 리스트 (과거 → 최근 순)
-            
+        
         Example:
             # 2020년 1월 1일부터 오늘까지
             ohlcv = kis.fetch_ohlcv_range("005930", "20200101")
@@ -157,63 +590,60 @@ class QuoteAPI:
             # 특정 기간
             ohlcv = kis.fetch_ohlcv_range("005930", "2023-01-01", "2023-12-31")
         """
-        # 날짜 형식 정규화 (YYYYMMDD)
-        start = start_date.replace("-", "")
-        end = end_date.replace("-", "") if end_date else datetime.now().strftime("%Y%m%d")
+        start, end = _normalize_range(start_date, end_date)
+        responses = self._fetch_range_windows(symbol, start, end, timeframe)
         
-        period_map = {"1d": "D", "1w": "W", "1M": "M"}
-        period_code = period_map.get(timeframe, "D")
+        # 날짜순 정렬 (과거 → 최근)
+        return _merge_ohlcv_range(responses, start, end)
+    
+    def fetch_ohlcv_range_frame(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: Optional[str] = None,
+        timeframe: str = "1d",
+    ) -> OHLCVFrame:
+        """
+        특정 기간의 OHLCV 데이터를 컬럼형 numpy 배열로 조회합니다.
         
-        # 결과 저장 (중복 제거용 dict)
-        all_data = {}
+        캔들별 OHLCV 객체를 만들지 않고 응답에서 바로 배열을 채웁니다.
         
-        # API 호출당 약 100개 반환
-        # 일봉 기준 약 5개월씩 조회 (100 거래일 ≈ 5개월)
-        chunk_days = 150 if timeframe == "1d" else 365  # 일봉은 150일, 주/월봉은 1년
+        Args:
+            symbol: 종목 코드 (예: "005930")
+            start_date: 시작일 ("YYYYMMDD" 또는 "YYYY-MM-DD")
+            end_date: 종료일 ("YYYYMMDD" 또는 "YYYY-MM-DD", 기본: 오늘)
+            timeframe: 기간 구분 ("1d", "1w", "1M")
         
-        start_dt = datetime.strptime(start, "%Y%m%d")
-        end_dt = datetime.strptime(end, "%Y%m%d")
+        Returns:
+            OHLCVFrame 인스턴스 (과거 → 최근 순)
         
-        # 구간 생성 (최근 → 과거 순)
-        current_end = end_dt
-        request_count = 0
+        Raises:
+            ImportError: numpy가 설치되지 않은 경우
+        """
+        start, end = _normalize_range(start_date, end_date)
+        responses = self._fetch_range_windows(symbol, start, end, timeframe)
+        return OHLCVFrame.from_kis(_range_items(responses, start, end))
+    
+    def _fetch_range_windows(
+        self,
+        symbol: str,
+        start: str,
+        end: str,
+        timeframe: str,
+    ) -> List[Dict[str, Any]]:
+        """
+        기간을 구간별로 나누어 동시에 요청합니다.
         
-        while current_end >= start_dt:
-            current_start = max(start_dt, current_end - timedelta(days=chunk_days))
-            
-            # API 호출
-            data = self._http.get(
-                "/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice",
-                "FHKST03010100",
-                params={
-                    "FID_COND_MRKT_DIV_CODE": MarketCode.STOCK.value,
-                    "FID_INPUT_ISCD": symbol,
-                    "FID_INPUT_DATE_1": current_start.strftime("%Y%m%d"),
-                    "FID_INPUT_DATE_2": current_end.strftime("%Y%m%d"),
-                    "FID_PERIOD_DIV_CODE": period_code,
-                    "FID_ORG_ADJ_PRC": "0",
-                },
+        초당 요청 수는 HTTP 클라이언트의 Rate Limit이 제한합니다.
+        """
+        return self._http.batch([
+            (
+                Endpoint.DAILY_CHART,
+                TrID.DAILY_CHART,
+                _range_params(symbol, window_start, window_end, timeframe),
             )
-            
-            items = data.get("output2", [])
-            
-            for item in items:
-                date_str = item.get("stck_bsop_date", "")
-                if date_str and date_str >= start and date_str <= end:
-                    all_data[date_str] = OHLCV.from_kis(item)
-            
-            # 다음 구간
-            current_end = current_start - timedelta(days=1)
-            request_count += 1
-            
-            # Rate Limit 대기
-            if current_end >= start_dt:
-                time.sleep(self._delay)
-        
-        # 날짜순 정렬 (과거 → 최근)
-        sorted_data = sorted(all_data.values(), key=lambda x: x.datetime)
-        
-        return sorted_data
+            for window_start, window_end in _date_windows(start, end, timeframe)
+        ])
     
     def fetch_minute_ohlcv(
         self,
@@ -229,10 +659,10 @@ class QuoteAPI:
         Args:
             symbol: 종목 코드 (예: "005930")
             interval: 분 간격 (1, 3, 5, 10, 15, 30, 60)
-            
+        
         Returns:
             OHLCV 리스트 (과거 → 최근 순)
-            
+        
         Example:
             # 당일 1분봉
             ohlcv = kis.fetch_minute_ohlcv("005930")
@@ -240,83 +670,19 @@ class QuoteAPI:
             # 당일 5분봉
             ohlcv = kis.fetch_minute_ohlcv("005930", interval=5)
         """
-        all_data = {}
-        
-        # 동적 시간 조회 (15:30부터 09:00까지 역순으로)
-        search_time = "153000"
-        
-        while True:
-            data = self._http.get(
-                "/uapi/domestic-stock/v1/quotations/inquire-time-itemchartprice",
-                "FHKST03010200",
-                params={
-                    "FID_ETC_CLS_CODE": "",
-                    "FID_COND_MRKT_DIV_CODE": MarketCode.STOCK.value,
-                    "FID_INPUT_ISCD": symbol,
-                    "FID_INPUT_HOUR_1": search_time,
-                    "FID_PW_DATA_INCU_YN": "N",
-                },
-            )
-            
-            items = data.get("output2", [])
-            if not items:
-                break
-            
-            min_time_val = None
-            
-            for item in items:
-                date_str = item.get("stck_bsop_date", "")
-                time_str = item.get("stck_cntg_hour", "")
-                
-                if date_str and time_str:
-                    # 다음 조회를 위해 가장 과거 시간 추적
-                    try:
-                        t_int = int(time_str)
-                        if min_time_val is None or t_int < min_time_val:
-                            min_time_val = t_int
-                    except ValueError:
-                        pass
-                    
-                    key = f"{date_str}_{time_str}"
-                    
-                    # 분 간격 필터링
-                    minute = int(time_str[2:4])
-                    if interval > 1 and minute % interval != 0:
-                        continue
-                    
-                    dt = datetime.strptime(f"{date_str}{time_str}", "%Y%m%d%H%M%S")
-                    
-                    all_data[key] = OHLCV(
-                        datetime=dt,
-                        open=float(item.get("stck_oprc", 0)),
-                        high=float(item.get("stck_hgpr", 0)),
-                        low=float(item.get("stck_lwpr", 0)),
-                        close=float(item.get("stck_prpr", 0)),
-                        volume=int(item.get("cntg_vol", 0)),
-                    )
-            
-            # 더 이상 데이터가 없거나 유효한 시간이 없는 경우 종료
-            if min_time_val is None:
-                break
-                
-            # 다음 조회 시간 설정 (최소 시간 - 1분)
-            min_time_str = f"{min_time_val:06d}"
-            today_str = datetime.now().strftime("%Y%m%d")
-            last_dt = datetime.strptime(f"{today_str}{min_time_str}", "%Y%m%d%H%M%S")
-            next_dt = last_dt - timedelta(minutes=1)
-            search_time = next_dt.strftime("%H%M%S")
-            
-            # 09:00 이전이면 종료
-            if search_time < "090000":
-                break
-            
-            # Rate Limit 대기
-            time.sleep(self._delay)
-        
-        # 시간순 정렬
-        sorted_data = sorted(all_data.values(), key=lambda x: x.datetime)
-        
-        return sorted_data
+        # 조회 기준 시각별 요청을 동시에 전송 (각 30건)
+        windows = _today_minute_windows(datetime.now(KST).strftime("%H%M%S"))
+        responses = self._http.batch([
+            (Endpoint.MINUTE_CHART, TrID.MINUTE_CHART, _minute_params(symbol, hour))
+            for hour in windows
+        ])
+        
+        all_data: Dict[int, OHLCV] = {}
+        for data in responses:
+            _collect_minute_bars(data.get("output2", []), None, None, interval, all_data)
+        
+        # 키가 (일자, 시각) 순서이므로 키 정렬이 곧 시간순 정렬
+        return [all_data[key] for key in sorted(all_data)]
     
     def fetch_minute_ohlcv_range(
         self,
@@ -330,20 +696,21 @@ class QuoteAPI:
         
         ※ 실전투자 전용 (모의투자 미지원)
         ※ 최대 1년까지 과거 데이터 조회 가능
-        ※ 한 번 호출에 최대 120건 반환
+        ※ 날짜별 시간대 구간(각 120건)을 병렬로 요청
         
         Args:
             symbol: 종목 코드 (예: "005930")
             start_date: 시작일 ("YYYYMMDD" 또는 "YYYY-MM-DD")
             end_date: 종료일 (기본: 오늘)
             interval: 분 간격 (1, 3, 5, 10, 15, 30, 60)
-            
+        
         Returns:
             OHLCV 리스트 (과거 → 최근 순)
-            
+        
         Raises:
             ValueError: 모의투자에서 호출 시
-            
+            RateLimitError: Rate Limit 초과로 일부 구간을 받지 못한 경우
+        
         Example:
             # 어제 분봉 조회 (실전투자만)
             ohlcv = kis.fetch_minute_ohlcv_range("005930", "20260114")
@@ -354,106 +721,19 @@ class QuoteAPI:
         if self._is_paper:
             raise ValueError("fetch_minute_ohlcv_range는 실전투자에서만 사용 가능합니다. 모의투자는 fetch_minute_ohlcv로 당일 데이터만 조회하세요.")
         
-        # 날짜 형식 정규화 (YYYYMMDD)
-        start = start_date.replace("-", "")
-        end = end_date.replace("-", "") if end_date else datetime.now().strftime("%Y%m%d")
-        
-        all_data = {}
-        
-        start_dt = datetime.strptime(start, "%Y%m%d")
-        end_dt = datetime.strptime(end, "%Y%m%d")
-        
-        # 날짜별로 조회 (각 날짜의 여러 시간대)
-        current_date = end_dt
-        
-        while current_date >= start_dt:
-            date_str = current_date.strftime("%Y%m%d")
-            
-            # 하루에 여러 시간대 조회 (120건씩)
-            # 하루 전체 데이터 수집을 위한 반복 조회 (09:00 ~ 15:30)
-            search_time = "153000"
-            
-            while True:
-                try:
-                    data = self._http.get(
-                        "/uapi/domestic-stock/v1/quotations/inquire-time-dailychartprice",
-                        "FHKST03010230",
-                        params={
-                            "FID_COND_MRKT_DIV_CODE": MarketCode.STOCK.value,
-                            "FID_INPUT_ISCD": symbol,
-                            "FID_INPUT_DATE_1": date_str,
-                            "FID_INPUT_HOUR_1": search_time,
-                            "FID_PW_DATA_INCU_YN": "Y",
-                            "FID_FAKE_TICK_INCU_YN": "",
-                        },
-                    )
-                    
-                    items = data.get("output2", [])
-                    if not items:
-                        break
-                    
-                    min_time_val = None
-                    
-                    for item in items:
-                        item_date = item.get("stck_bsop_date", "")
-                        time_str = item.get("stck_cntg_hour", "")
-                        
-                        if item_date and time_str:
-                            # 다음 조회를 위해 가장 과거 시간 추적
-                            try:
-                                t_int = int(time_str)
-                                if min_time_val is None or t_int < min_time_val:
-                                    min_time_val = t_int
-                            except ValueError:
-                                pass
-                            
-                            # 날짜 범위 확인
-                            if item_date < start or item_date > end:
-                                continue
-                            
-                            key = f"{item_date}_{time_str}"
-                            
-                            # 분 간격 필터링
-                            minute = int(time_str[2:4])
-                            if interval > 1 and minute % interval != 0:
-                                continue
-                            
-                            dt = datetime.strptime(f"{item_date}{time_str}", "%Y%m%d%H%M%S")
-                            
-                            all_data[key] = OHLCV(
-                                datetime=dt,
-                                open=float(item.get("stck_oprc", 0)),
-                                high=float(item.get("stck_hgpr", 0)),
-                                low=float(item.get("stck_lwpr", 0)),
-                                close=float(item.get("stck_prpr", 0)),
-                                volume=int(item.get("cntg_vol", 0)),
-                            )
-                    
-                    # 더 이상 데이터가 없거나 유효한 시간이 없는 경우 종료
-                    if min_time_val is None:
-                        break
-                        
-                    # 다음 조회 시간 설정 (최소 시간 - 1분)
-                    min_time_str = f"{min_time_val:06d}"
-                    last_dt = datetime.strptime(f"{date_str}{min_time_str}", "%Y%m%d%H%M%S")
-                    next_dt = last_dt - timedelta(minutes=1)
-                    search_time = next_dt.strftime("%H%M%S")
-                    
-                    # 09:00 이전이면 종료
-                    if search_time < "090000":
-                        break
-                        
-                except Exception:
-                    break  # 오류 발생 시 해당 날짜 조회 중단
-                
-                # Rate Limit 대기
-                time.sleep(self._delay)
-            
-            # 이전 날짜로
-            current_date = current_date - timedelta(days=1)
-        
-        # 시간순 정렬
-        sorted_data = sorted(all_data.values(), key=lambda x: x.datetime)
-        
-        return sorted_data
-
+        start, end = _normalize_range(start_date, end_date)
+        
+        # 날짜 x 조회 기준 시각 구간을 한 번에 전송 (휴장일 등 오류 구간은 건너뜀)
+        windows = [(date, hour) for date in _weekdays(start, end) for hour in MINUTE_WINDOWS]
+        responses = self._http.batch(
+            [
+                (
+                    Endpoint.MINUTE_CHART_DAILY,
+                    TrID.MINUTE_CHART_DAILY,
+                    _minute_range_params(symbol, date, hour),
+                )
+                for date, hour in windows
+            ],
+            return_exceptions=True,
+        )
+        return _merge_minute_windows(responses, start, end, interval)
@@ -4,16 +4,21 @@ PyKIS 비동기 메인 클라이언트
 KIS API를 비동기로 사용하기 위한 진입점 클래스입니다.
 """
 
-from typing import AsyncIterator, List, Literal, Optional
+import asyncio
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Literal, Optional, Tuple
 
-from pykis.constants import BaseURL, OrderSide, OrderType
+from pykis.constants import BaseURL, RateLimit, OrderType, to_order_side
 from pykis.auth.async_manager import AsyncAuthManager
 from pykis.utils.async_http import AsyncHTTPClient
+from pykis.utils.cache import ResponseCache
 from pykis.api.async_quote import AsyncQuoteAPI
 from pykis.api.async_order import AsyncOrderAPI
 from pykis.api.async_account import AsyncAccountAPI
-from pykis.websocket.client import WebSocketClient
-from pykis.models import Ticker, OrderBook, OHLCV, Order, Balance
+from pykis.models import Ticker, OrderBook, OHLCV, OHLCVFrame, Order, Balance
+
+if TYPE_CHECKING:
+    # websockets는 실시간 구독 시에만 로드
+    from pykis.websocket.client import WebSocketClient
 
 
 class AsyncKIS:
@@ -46,6 +51,7 @@ class AsyncKIS:
         app_secret: str,
         account_no: str,
         is_paper: bool = False,
+        cache: bool = False,
     ):
         """
         AsyncKIS 클라이언트를 초기화합니다.
@@ -55,6 +61,8 @@ class AsyncKIS:
             app_secret: KIS Developers API Secret
             account_no: 계좌번호 (형식: "12345678-01")
             is_paper: 모의투자 여부 (기본: False = 실전투자)
+            cache: 과거 시세 응답 디스크 캐시 사용 여부 (기본: False)
+                ~/.pykis/cache에 저장되며, 오늘 이전 기간 조회만 캐시합니다.
         """
         self.is_paper = is_paper
         self.account_no = account_no
@@ -64,17 +72,22 @@ class AsyncKIS:
         # API 기본 URL 설정
         base_url = BaseURL.PAPER if is_paper else BaseURL.PRODUCTION
         
+        # Rate Limit (모의투자: 초당 2건, 실전투자: 초당 20건)
+        rate = RateLimit.PAPER if is_paper else RateLimit.PRODUCTION
+        
         # 비동기 인증 및 HTTP 클라이언트 초기화
         self._auth = AsyncAuthManager(app_key, app_secret, base_url)
-        self._http = AsyncHTTPClient(base_url, self._auth)
+        self._cache = ResponseCache() if cache else None
+        self._http = AsyncHTTPClient(base_url, self._auth, rate=rate, cache=self._cache)
         
         # 비동기 API 모듈 초기화
-        self._quote = AsyncQuoteAPI(self._http)
+        self._quote = AsyncQuoteAPI(self._http, is_paper)
         self._order = AsyncOrderAPI(self._http, account_no, is_paper)
         self._account = AsyncAccountAPI(self._http, account_no, is_paper)
         
         # WebSocket 클라이언트 (지연 초기화)
-        self._ws: Optional[WebSocketClient] = None
+        self._ws: Optional["WebSocketClient"] = None
+        self._ws_lock: Optional[asyncio.Lock] = None
     
     # =========================================================================
     # Market Data API
@@ -86,19 +99,31 @@ class AsyncKIS:
         
         Args:
             symbol: 종목 코드 (예: "005930")
-            
+        
         Returns:
             Ticker 인스턴스
         """
         return await self._quote.fetch_ticker(symbol)
     
+    async def fetch_tickers(self, symbols: List[str]) -> Dict[str, Ticker]:
+        """
+        여러 종목의 현재가를 동시에 조회합니다.
+        
+        Args:
+            symbols: 종목 코드 리스트 (예: ["005930", "000660"])
+        
+        Returns:
+            {종목 코드: Ticker} 딕셔너리
+        """
+        return await self._quote.fetch_tickers(symbols)
+    
     async def fetch_order_book(self, symbol: str) -> OrderBook:
         """
         호가를 비동기로 조회합니다.
         
         Args:
             symbol: 종목 코드 (예: "005930")
-            
+        
         Returns:
             OrderBook 인스턴스
         """
@@ -117,12 +142,168 @@ class AsyncKIS:
             symbol: 종목 코드 (예: "005930")
             timeframe: 기간 구분 ("1d", "1w", "1M")
             limit: 최대 개수
-            
+        
         Returns:
             OHLCV 리스트
         """
         return await self._quote.fetch_ohlcv(symbol, timeframe, limit)
     
+    async def fetch_ohlcv_frame(
+        self,
+        symbol: str,
+        timeframe: str = "1d",
+        limit: Optional[int] = None,
+    ) -> OHLCVFrame:
+        """
+        OHLCV (캔들) 데이터를 컬럼형 numpy 배열로 비동기 조회합니다.
+        
+        numpy가 필요합니다 (pip install pykis[numpy]).
+        
+        Args:
+            symbol: 종목 코드 (예: "005930")
+            timeframe: 기간 구분 ("1d", "1w", "1M")
+            limit: 최대 개수
+        
+        Returns:
+            OHLCVFrame 인스턴스 (과거 → 최근 순)
+        """
+        return await self._quote.fetch_ohlcv_frame(symbol, timeframe, limit)
+    
+    async def fetch_snapshot(
+        self,
+        symbol: str,
+        timeframe: str = "1d",
+        limit: Optional[int] = None,
+    ) -> Tuple[Ticker, OrderBook, List[OHLCV]]:
+        """
+        현재가, 호가, OHLCV를 동시에 비동기로 조회합니다.
+        
+        Args:
+            symbol: 종목 코드 (예: "005930")
+            timeframe: OHLCV 기간 구분 ("1d", "1w", "1M")
+            limit: OHLCV 최대 개수
+        
+        Returns:
+            (Ticker, OrderBook, OHLCV 리스트) 튜플
+        """
+        return await self._quote.fetch_snapshot(symbol, timeframe, limit)
+    
+    async def fetch_ohlcv_range(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: Optional[str] = None,
+        timeframe: str = "1d",
+    ) -> List[OHLCV]:
+        """
+        특정 기간의 OHLCV (캔들) 데이터를 비동기로 조회합니다.
+        
+        구간별 요청을 동시에 보내므로 동기 버전보다 빠릅니다.
+        
+        Args:
+            symbol: 종목 코드 (예: "005930")
+            start_date: 시작일 ("YYYYMMDD" 또는 "YYYY-MM-DD")
+            end_date: 종료일 ("YYYYMMDD" 또는 "YYYY-MM-DD", 기본: 오늘)
+            timeframe: 기간 구분 ("1d", "1w", "1M")
+        
+        Returns:
+            OHLCV 리스트 (과거 → 최근 순)
+        
+        Example:
+            ```python
+            ohlcv = await kis.fetch_ohlcv_range("005930", "20200101")
+            ```
+        """
+        return await self._quote.fetch_ohlcv_range(symbol, start_date, end_date, timeframe)
+    
+    async def fetch_ohlcv_range_frame(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: Optional[str] = None,
+        timeframe: str = "1d",
+    ) -> OHLCVFrame:
+        """
+        특정 기간의 OHLCV 데이터를 컬럼형 numpy 배열로 비동기 조회합니다.
+        
+        numpy가 필요합니다 (pip install pykis[numpy]).
+        
+        Args:
+            symbol: 종목 코드 (예: "005930")
+            start_date: 시작일 ("YYYYMMDD" 또는 "YYYY-MM-DD")
+            end_date: 종료일 ("YYYYMMDD" 또는 "YYYY-MM-DD", 기본: 오늘)
+            timeframe: 기간 구분 ("1d", "1w", "1M")
+        
+        Returns:
+            OHLCVFrame 인스턴스 (과거 → 최근 순)
+        """
+        return await self._quote.fetch_ohlcv_range_frame(symbol, start_date, end_date, timeframe)
+    
+    async def fetch_minute_ohlcv(
+        self,
+        symbol: str,
+        interval: int = 1,
+    ) -> List[OHLCV]:
+        """
+        당일 분봉 데이터를 비동기로 조회합니다.
+        
+        Args:
+            symbol: 종목 코드 (예: "005930")
+            interval: 분 간격 (1, 3, 5, 10, 15, 30, 60)
+        
+        Returns:
+            OHLCV 리스트 (과거 → 최근 순)
+        
+        Example:
+            ```python
+            ohlcv = await kis.fetch_minute_ohlcv("005930", interval=5)
+            ```
+        """
+        return await self._quote.fetch_minute_ohlcv(symbol, interval)
+    
+    async def fetch_minute_ohlcv_range(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: Optional[str] = None,
+        interval: int = 1,
+    ) -> List[OHLCV]:
+        """
+        과거 일자의 분봉 데이터를 비동기로 조회합니다.
+        
+        ※ 실전투자 전용 (모의투자 미지원)
+        ※ 날짜/시간대 구간을 동시에 요청합니다
+        
+        Args:
+            symbol: 종목 코드 (예: "005930")
+            start_date: 시작일 ("YYYYMMDD" 또는 "YYYY-MM-DD")
+            end_date: 종료일 (기본: 오늘)
+            interval: 분 간격 (1, 3, 5, 10, 15, 30, 60)
+        
+        Returns:
+            OHLCV 리스트 (과거 → 최근 순)
+        
+        Raises:
+            ValueError: 모의투자에서 호출 시
+        
+        Example:
+            ```python
+            ohlcv = await kis.fetch_minute_ohlcv_range("005930", "20260114")
+            ```
+        """
+        return await self._quote.fetch_minute_ohlcv_range(symbol, start_date, end_date, interval)
+    
+    def clear_cache(self) -> None:
+        """
+        시세 응답 캐시를 삭제합니다.
+        
+        현재가/호가/OHLCV 메모리 캐시와, cache=True로 생성한 경우
+        과거 시세 디스크 캐시를 함께 비웁니다.
+        """
+        self._quote.clear_cache()
+        if self._cache:
+            self._cache.clear()
+    
     # =========================================================================
     # Trading API
     # =========================================================================
@@ -142,12 +323,12 @@ class AsyncKIS:
             side: 주문 방향 ("buy" 또는 "sell")
             amount: 주문 수량
             price: 주문 가격
-            
+        
         Returns:
             Order 인스턴스
         """
         return await self._order.create_order(
-            symbol, OrderSide(side), OrderType.LIMIT, amount, price
+            symbol, to_order_side(side), OrderType.LIMIT, amount, price
         )
     
     async def create_market_order(
@@ -163,12 +344,12 @@ class AsyncKIS:
             symbol: 종목 코드
             side: 주문 방향
             amount: 주문 수량
-            
+        
         Returns:
             Order 인스턴스
         """
         return await self._order.create_order(
-            symbol, OrderSide(side), OrderType.MARKET, amount
+            symbol, to_order_side(side), OrderType.MARKET, amount
         )
     
     async def cancel_order(self, order_id: str, symbol: str) -> Order:
@@ -178,7 +359,7 @@ class AsyncKIS:
         Args:
             order_id: 주문번호
             symbol: 종목 코드
-            
+        
         Returns:
             취소된 Order 인스턴스
         """
@@ -210,17 +391,28 @@ class AsyncKIS:
     # WebSocket API (실시간 데이터)
     # =========================================================================
     
-    async def _ensure_ws_connected(self) -> WebSocketClient:
+    async def _ensure_ws_connected(self) -> "WebSocketClient":
         """
         WebSocket 연결을 보장합니다 (지연 초기화).
+        
+        모든 watch_* 구독은 하나의 연결을 공유합니다.
         """
-        if self._ws is None:
-            self._ws = WebSocketClient(
-                self.app_key,
-                self.app_secret,
-                self.is_paper,
-            )
-            await self._ws.connect()
+        if self._ws_lock is None:
+            self._ws_lock = asyncio.Lock()
+        
+        async with self._ws_lock:
+            if self._ws is None:
+                from pykis.websocket.client import WebSocketClient
+                
+                # Approval Key 발급은 REST 클라이언트의 커넥션 풀을 재사용
+                ws = WebSocketClient(
+                    self.app_key,
+                    self.app_secret,
+                    self.is_paper,
+                    http_client=await self._http._get_client(),
+                )
+                await ws.connect()
+                self._ws = ws
         return self._ws
     
     async def watch_ticker(self, symbol: str) -> AsyncIterator[Ticker]:
@@ -229,10 +421,10 @@ class AsyncKIS:
         
         Args:
             symbol: 종목 코드 (예: "005930")
-            
+        
         Yields:
             Ticker 인스턴스 (실시간 업데이트)
-            
+        
         Example:
             ```python
             async for ticker in kis.watch_ticker("005930"):
@@ -242,8 +434,12 @@ class AsyncKIS:
             ```
         """
         ws = await self._ensure_ws_connected()
-        async for ticker in ws.watch_ticker(symbol):
-            yield ticker
+        stream = ws.watch_ticker(symbol)
+        try:
+            async for ticker in stream:
+                yield ticker
+        finally:
+            await stream.aclose()
     
     async def watch_order_book(self, symbol: str) -> AsyncIterator[OrderBook]:
         """
@@ -251,13 +447,17 @@ class AsyncKIS:
         
         Args:
             symbol: 종목 코드 (예: "005930")
-            
+        
         Yields:
             OrderBook 인스턴스 (실시간 업데이트)
         """
         ws = await self._ensure_ws_connected()
-        async for orderbook in ws.watch_order_book(symbol):
-            yield orderbook
+        stream = ws.watch_order_book(symbol)
+        try:
+            async for orderbook in stream:
+                yield orderbook
+        finally:
+            await stream.aclose()
     
     # =========================================================================
     # Context Manager
@@ -268,6 +468,7 @@ class AsyncKIS:
         모든 연결을 종료합니다.
         """
         await self._http.close()
+        await self._auth.close()
         if self._ws:
             await self._ws.disconnect()
             self._ws = None
@@ -4,15 +4,19 @@ PyKIS 인증 매니저
 KIS API Access Token의 발급, 저장, 갱신을 관리합니다.
 """
 
-import json
-import hashlib
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 import httpx
 
+from pykis.auth.store import default_token_path, load_token, save_token
 from pykis.exceptions import AuthenticationError
+from pykis.utils.http import HTTP2
+
+# 토큰 발급은 드물게 호출되므로 작은 커넥션 풀로 충분
+AUTH_POOL_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20)
 
 
 class AuthManager:
@@ -43,16 +47,25 @@ class AuthManager:
         self.app_secret = app_secret
         self.base_url = base_url
         
-        # 토큰 저장 경로 (app_key 해시로 구분)
+        # 토큰 저장 경로 (app_key/환경 해시로 구분)
         if token_path:
             self._path = Path(token_path).expanduser()
         else:
-            key_hash = hashlib.md5(app_key.encode()).hexdigest()[:8]
-            self._path = Path(f"~/.pykis/token_{key_hash}.json").expanduser()
+            self._path = default_token_path(app_key, base_url)
         
         self._token: Optional[str] = None
         self._expires: Optional[datetime] = None
         
+        # 토큰별 요청 헤더 (토큰 갱신 시 다시 생성)
+        self._headers: Optional[dict] = None
+        self._tr_headers: Dict[str, dict] = {}
+        
+        # batch 스레드가 토큰을 중복 발급하지 않도록 갱신 직렬화
+        self._refresh_lock = threading.Lock()
+        
+        # 토큰 발급용 클라이언트 (지연 생성, 갱신 간 연결 재사용)
+        self._client: Optional[httpx.Client] = None
+        
         # 캐시된 토큰 로드 시도
         self._load_token()
     
@@ -65,15 +78,54 @@ class AuthManager:
         Returns:
             API 요청 헤더 딕셔너리
         """
+        self._ensure_token()
+        
+        # 호출 측에서 수정할 수 있으므로 사본 반환
+        return self._base_headers().copy()
+    
+    def get_tr_headers(self, tr_id: str) -> dict:
+        """
+        tr_id 헤더를 포함한 API 요청 헤더를 반환합니다.
+        
+        토큰/TR별로 한 번만 생성해 재사용하므로 반환값을 수정하면 안 됩니다.
+        
+        Args:
+            tr_id: 거래 ID
+        
+        Returns:
+            API 요청 헤더 딕셔너리
+        """
+        self._ensure_token()
+        
+        headers = self._tr_headers.get(tr_id)
+        if headers is None:
+            headers = {**self._base_headers(), "tr_id": tr_id}
+            self._tr_headers[tr_id] = headers
+        return headers
+    
+    def _ensure_token(self) -> None:
+        """
+        토큰이 만료되었거나 없으면 갱신합니다. (동시 호출 시 한 번만 발급)
+        """
         if self._is_expired():
-            self._refresh()
-        
-        return {
-            "authorization": f"Bearer {self._token}",
-            "appkey": self.app_key,
-            "appsecret": self.app_secret,
-            "Content-Type": "application/json; charset=utf-8",
-        }
+            with self._refresh_lock:
+                # 대기 중 다른 스레드가 이미 갱신했으면 건너뜀
+                if self._is_expired():
+                    self._refresh()
+    
+    def _base_headers(self) -> dict:
+        """
+        현재 토큰의 공통 요청 헤더를 반환합니다. (토큰별로 한 번만 생성)
+        """
+        headers = self._headers
+        if headers is None:
+            headers = self._headers = {
+                "authorization": f"Bearer {self._token}",
+                "appkey": self.app_key,
+                "appsecret": self.app_secret,
+                "Content-Type": "application/json; charset=utf-8",
+            }
+        return headers
     
     def _is_expired(self) -> bool:
         """
@@ -88,6 +140,27 @@ class AuthManager:
             return True
         return datetime.now() >= self._expires - timedelta(minutes=5)
     
+    def _get_client(self) -> httpx.Client:
+        """
+        토큰 발급용 Client를 반환합니다. (지연 생성)
+        """
+        if self._client is None:
+            self._client = httpx.Client(
+                base_url=self.base_url,
+                timeout=30.0,
+                limits=AUTH_POOL_LIMITS,
+                http2=HTTP2,
+            )
+        return self._client
+    
+    def close(self) -> None:
+        """
+        토큰 발급용 클라이언트를 종료합니다.
+        """
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+    
     def _refresh(self) -> None:
         """
         새로운 Access Token을 발급받습니다.
@@ -98,64 +171,48 @@ class AuthManager:
             AuthenticationError: 토큰 발급 실패 시
         """
         try:
-            with httpx.Client(timeout=30.0) as client:
-                resp = client.post(
-                    f"{self.base_url}/oauth2/tokenP",
-                    json={
-                        "grant_type": "client_credentials",
-                        "appkey": self.app_key,
-                        "appsecret": self.app_secret,
-                    },
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                
-                if "access_token" not in data:
-                    raise AuthenticationError(
-                        data.get("msg1", "토큰 발급 실패"),
-                        code=data.get("msg_cd"),
-                    )
-                
-                self._token = data["access_token"]
-                # expires_in은 초 단위 (기본 24시간 = 86400초)
-                self._expires = datetime.now() + timedelta(
-                    seconds=data.get("expires_in", 86400)
+            resp = self._get_client().post(
+                "/oauth2/tokenP",
+                json={
+                    "grant_type": "client_credentials",
+                    "appkey": self.app_key,
+                    "appsecret": self.app_secret,
+                },
+            )
+            resp.raise_for_status()
+            data = resp.json()
+            
+            if "access_token" not in data:
+                raise AuthenticationError(
+                    data.get("msg1", "토큰 발급 실패"),
+                    code=data.get("msg_cd"),
                 )
-                self._save_token()
-                
+            
+            self._token = data["access_token"]
+            self._headers = None
+            self._tr_headers = {}
+            # expires_in은 초 단위 (기본 24시간 = 86400초)
+            self._expires = datetime.now() + timedelta(
+                seconds=data.get("expires_in", 86400)
+            )
+            self._save_token()
+        
         except httpx.HTTPError as e:
             raise AuthenticationError(f"토큰 발급 HTTP 오류: {e}") from e
     
     def _load_token(self) -> None:
         """
-        파일에 저장된 토큰을 로드합니다.
+        저장된 토큰을 로드합니다.
         
         유효한 토큰이 있으면 메모리에 캐싱합니다.
         """
-        if not self._path.exists():
-            return
-        
-        try:
-            data = json.loads(self._path.read_text(encoding="utf-8"))
-            exp = datetime.fromisoformat(data["expires_at"])
-            
-            # 아직 유효한 토큰인 경우만 사용
-            if exp > datetime.now():
-                self._token = data["token"]
-                self._expires = exp
-        except (json.JSONDecodeError, KeyError, ValueError):
-            # 파일이 손상된 경우 무시
-            pass
+        entry = load_token(self._path)
+        if entry is not None:
+            self._token, self._expires = entry
     
     def _save_token(self) -> None:
         """
         현재 토큰을 파일에 저장합니다.
         """
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._path.write_text(
-            json.dumps({
-                "token": self._token,
-                "expires_at": self._expires.isoformat() if self._expires else None,
-            }, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        if self._token and self._expires:
+            save_token(self._path, self._token, self._expires)
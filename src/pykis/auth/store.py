@@ -0,0 +1,112 @@
+"""
+PyKIS 토큰 저장소
+
+Access Token을 파일에 저장하고, 같은 프로세스 안에서는 메모리에서 재사용합니다.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# 프로세스 전역 토큰 캐시 {경로: (토큰, 만료 시각)}
+_TOKEN_CACHE: Dict[Path, Tuple[str, datetime]] = {}
+_LOCK = threading.Lock()
+
+
+def default_token_path(app_key: str, base_url: str) -> Path:
+    """
+    기본 토큰 파일 경로를 반환합니다.
+    
+    토큰은 App Key와 환경(실전/모의)별로 발급되므로 둘을 함께 해시해 구분합니다.
+    
+    Args:
+        app_key: KIS API App Key
+        base_url: API 기본 URL
+    
+    Returns:
+        ~/.pykis/token_{hash}.json 경로
+    """
+    key_hash = hashlib.blake2s(f"{base_url}|{app_key}".encode(), digest_size=4).hexdigest()
+    return Path(f"~/.pykis/token_{key_hash}.json").expanduser()
+
+
+def load_token(path: Path) -> Optional[Tuple[str, datetime]]:
+    """
+    저장된 토큰을 로드합니다.
+    
+    같은 프로세스에서 이미 읽었거나 저장한 토큰은 파일을 다시 읽지 않습니다.
+    
+    Args:
+        path: 토큰 파일 경로
+    
+    Returns:
+        (토큰, 만료 시각) 튜플 (없거나 만료되었으면 None)
+    """
+    with _LOCK:
+        cached = _TOKEN_CACHE.get(path)
+        if cached is not None and cached[1] > datetime.now():
+            return cached
+        
+        if not path.exists():
+            return None
+        
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            entry = (data["token"], datetime.fromisoformat(data["expires_at"]))
+        except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+            # 파일이 손상된 경우 무시
+            return None
+        
+        # 아직 유효한 토큰인 경우만 사용
+        if entry[1] <= datetime.now():
+            return None
+        
+        _TOKEN_CACHE[path] = entry
+        return entry
+
+
+def save_token(path: Path, token: str, expires: datetime) -> None:
+    """
+    토큰을 파일에 저장합니다.
+    
+    임시 파일에 쓴 뒤 교체하므로 저장 도중 중단되어도 기존 파일이 손상되지 않습니다.
+    임시 파일은 호출마다 새로 만들어 여러 프로세스가 동시에 저장해도 충돌하지 않으며,
+    파일 저장은 최선 노력(best-effort)이라 실패해도 예외를 발생시키지 않습니다.
+    
+    Args:
+        path: 토큰 파일 경로
+        token: Access Token
+        expires: 만료 시각
+    """
+    with _LOCK:
+        _TOKEN_CACHE[path] = (token, expires)
+        
+        tmp: Optional[str] = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=path.parent,
+                prefix=f"{path.stem}.",
+                suffix=".tmp",
+                delete=False,
+            ) as f:
+                tmp = f.name
+                json.dump({
+                    "token": token,
+                    "expires_at": expires.isoformat(),
+                }, f, ensure_ascii=False)
+            os.replace(tmp, path)
+        except OSError:
+            # 저장 실패는 무시 (메모리 캐시는 유지, 다음 프로세스는 새로 발급)
+            if tmp is not None:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
@@ -4,15 +4,16 @@ PyKIS 메인 클라이언트
 KIS API를 사용하기 위한 진입점 클래스입니다.
 """
 
-from typing import List, Literal, Optional
+from typing import Dict, List, Literal, Optional, Tuple
 
-from pykis.constants import BaseURL, OrderSide, OrderType
+from pykis.constants import BaseURL, RateLimit, OrderType, to_order_side
 from pykis.auth import AuthManager
 from pykis.utils.http import HTTPClient
+from pykis.utils.cache import ResponseCache
 from pykis.api.quote import QuoteAPI
 from pykis.api.order import OrderAPI
 from pykis.api.account import AccountAPI
-from pykis.models import Ticker, OrderBook, OHLCV, Order, Balance
+from pykis.models import Ticker, OrderBook, OHLCV, OHLCVFrame, Order, Balance
 
 
 class KIS:
@@ -47,6 +48,7 @@ class KIS:
         app_secret: str,
         account_no: str,
         is_paper: bool = False,
+        cache: bool = False,
     ):
         """
         KIS 클라이언트를 초기화합니다.
@@ -56,6 +58,8 @@ class KIS:
             app_secret: KIS Developers API Secret
             account_no: 계좌번호 (형식: "12345678-01")
             is_paper: 모의투자 여부 (기본: False = 실전투자)
+            cache: 과거 시세 응답 디스크 캐시 사용 여부 (기본: False)
+                ~/.pykis/cache에 저장되며, 오늘 이전 기간 조회만 캐시합니다.
         """
         self.is_paper = is_paper
         self.account_no = account_no
@@ -63,9 +67,13 @@ class KIS:
         # API 기본 URL 설정
         base_url = BaseURL.PAPER if is_paper else BaseURL.PRODUCTION
         
+        # Rate Limit (모의투자: 초당 2건, 실전투자: 초당 20건)
+        rate = RateLimit.PAPER if is_paper else RateLimit.PRODUCTION
+        
         # 인증 및 HTTP 클라이언트 초기화
         self._auth = AuthManager(app_key, app_secret, base_url)
-        self._http = HTTPClient(base_url, self._auth)
+        self._cache = ResponseCache() if cache else None
+        self._http = HTTPClient(base_url, self._auth, rate=rate, cache=self._cache)
         
         # API 모듈 초기화
         self._quote = QuoteAPI(self._http, is_paper)
@@ -82,10 +90,10 @@ class KIS:
         
         Args:
             symbol: 종목 코드 (예: "005930")
-            
+        
         Returns:
             Ticker 인스턴스
-            
+        
         Example:
             ```python
             ticker = kis.fetch_ticker("005930")
@@ -94,16 +102,36 @@ class KIS:
         """
         return self._quote.fetch_ticker(symbol)
     
+    def fetch_tickers(self, symbols: List[str]) -> Dict[str, Ticker]:
+        """
+        여러 종목의 현재가를 한 번에 조회합니다.
+        
+        요청은 병렬로 전송되며, Rate Limit은 요청마다 적용됩니다.
+        
+        Args:
+            symbols: 종목 코드 리스트 (예: ["005930", "000660"])
+        
+        Returns:
+            {종목 코드: Ticker} 딕셔너리
+        
+        Example:
+            ```python
+            tickers = kis.fetch_tickers(["005930", "000660"])
+            print(tickers["000660"].last)
+            ```
+        """
+        return self._quote.fetch_tickers(symbols)
+    
     def fetch_order_book(self, symbol: str) -> OrderBook:
         """
         호가를 조회합니다.
         
         Args:
             symbol: 종목 코드 (예: "005930")
-            
+        
         Returns:
             OrderBook 인스턴스 (매수/매도 각 10단계)
-            
+        
         Example:
             ```python
             ob = kis.fetch_order_book("005930")
@@ -129,10 +157,10 @@ class KIS:
                 - "1w": 주봉
                 - "1M": 월봉
             limit: 최대 개수 (기본: 100)
-            
+        
         Returns:
             OHLCV 리스트 (과거 → 최근 순)
-            
+        
         Example:
             ```python
             ohlcv = kis.fetch_ohlcv("005930", "1d", limit=30)
@@ -142,6 +170,61 @@ class KIS:
         """
         return self._quote.fetch_ohlcv(symbol, timeframe, limit)
     
+    def fetch_ohlcv_frame(
+        self,
+        symbol: str,
+        timeframe: str = "1d",
+        limit: Optional[int] = None,
+    ) -> OHLCVFrame:
+        """
+        OHLCV (캔들) 데이터를 컬럼형 numpy 배열로 조회합니다.
+        
+        numpy가 필요합니다 (pip install pykis[numpy]).
+        
+        Args:
+            symbol: 종목 코드 (예: "005930")
+            timeframe: 기간 구분 ("1d", "1w", "1M")
+            limit: 최대 개수 (기본: 100)
+        
+        Returns:
+            OHLCVFrame 인스턴스 (과거 → 최근 순)
+        
+        Example:
+            ```python
+            frame = kis.fetch_ohlcv_frame("005930", limit=20)
+            print(frame.close.mean())
+            ```
+        """
+        return self._quote.fetch_ohlcv_frame(symbol, timeframe, limit)
+    
+    def fetch_snapshot(
+        self,
+        symbol: str,
+        timeframe: str = "1d",
+        limit: Optional[int] = None,
+    ) -> Tuple[Ticker, OrderBook, List[OHLCV]]:
+        """
+        현재가, 호가, OHLCV를 한 번에 조회합니다.
+        
+        세 요청을 동시에 보내므로 fetch_ticker, fetch_order_book, fetch_ohlcv를
+        차례로 호출하는 것보다 빠릅니다.
+        
+        Args:
+            symbol: 종목 코드 (예: "005930")
+            timeframe: OHLCV 기간 구분 ("1d", "1w", "1M")
+            limit: OHLCV 최대 개수
+        
+        Returns:
+            (Ticker, OrderBook, OHLCV 리스트) 튜플
+        
+        Example:
+            ```python
+            ticker, ob, ohlcv = kis.fetch_snapshot("005930", limit=5)
+            print(f"{ticker.name}: {ticker.last:,}원, 매도1호가 {ob.asks[0].price:,}원")
+            ```
+        """
+        return self._quote.fetch_snapshot(symbol, timeframe, limit)
+    
     def fetch_ohlcv_range(
         self,
         symbol: str,
@@ -160,10 +243,10 @@ class KIS:
             start_date: 시작일 ("YYYYMMDD" 또는 "YYYY-MM-DD")
             end_date: 종료일 ("YYYYMMDD" 또는 "YYYY-MM-DD", 기본: 오늘)
             timeframe: 기간 구분 ("1d", "1w", "1M")
-            
+        
         Returns:
             OHLCV 리스트 (과거 → 최근 순)
-            
+        
         Example:
             ```python
             # 2020년 1월 1일부터 오늘까지
@@ -172,14 +255,45 @@ class KIS:
             # 특정 기간
             ohlcv = kis.fetch_ohlcv_range("005930", "2023-01-01", "2023-12-31")
             
+            ```
+        
+        Note:
+            긴 기간을 배열/DataFrame으로 다룬다면 fetch_ohlcv_range_frame이 더 빠릅니다.
+        """
+        return self._quote.fetch_ohlcv_range(symbol, start_date, end_date, timeframe)
+    
+    def fetch_ohlcv_range_frame(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: Optional[str] = None,
+        timeframe: str = "1d",
+    ) -> OHLCVFrame:
+        """
+        특정 기간의 OHLCV 데이터를 컬럼형 numpy 배열로 조회합니다.
+        
+        캔들별 객체를 만들지 않으므로 긴 기간 조회에서 fetch_ohlcv_range보다
+        빠르고 메모리를 적게 씁니다. numpy가 필요합니다 (pip install pykis[numpy]).
+        
+        Args:
+            symbol: 종목 코드 (예: "005930")
+            start_date: 시작일 ("YYYYMMDD" 또는 "YYYY-MM-DD")
+            end_date: 종료일 ("YYYYMMDD" 또는 "YYYY-MM-DD", 기본: 오늘)
+            timeframe: 기간 구분 ("1d", "1w", "1M")
+        
+        Returns:
+            OHLCVFrame 인스턴스 (과거 → 최근 순)
+        
+        Example:
+            ```python
+            frame = kis.fetch_ohlcv_range_frame("005930", "20200101")
+            
             # DataFrame으로 변환
             import pandas as pd
-            df = pd.DataFrame([{'date': o.datetime, 'open': o.open, 'high': o.high,
-                               'low': o.low, 'close': o.close, 'volume': o.volume}
-                              for o in ohlcv])
+            df = pd.DataFrame(dict(frame))
             ```
         """
-        return self._quote.fetch_ohlcv_range(symbol, start_date, end_date, timeframe)
+        return self._quote.fetch_ohlcv_range_frame(symbol, start_date, end_date, timeframe)
     
     def fetch_minute_ohlcv(
         self,
@@ -194,10 +308,10 @@ class KIS:
         Args:
             symbol: 종목 코드 (예: "005930")
             interval: 분 간격 (1, 3, 5, 10, 15, 30, 60)
-            
+        
         Returns:
             OHLCV 리스트 (과거 → 최근 순)
-            
+        
         Example:
             ```python
             # 당일 1분봉
@@ -231,13 +345,13 @@ class KIS:
             start_date: 시작일 ("YYYYMMDD" 또는 "YYYY-MM-DD")
             end_date: 종료일 (기본: 오늘)
             interval: 분 간격 (1, 3, 5, 10, 15, 30, 60)
-            
+        
         Returns:
             OHLCV 리스트 (과거 → 최근 순)
-            
+        
         Raises:
             ValueError: 모의투자에서 호출 시
-            
+        
         Example:
             ```python
             # 어제 분봉 조회 (실전투자만)
@@ -249,6 +363,17 @@ class KIS:
         """
         return self._quote.fetch_minute_ohlcv_range(symbol, start_date, end_date, interval)
     
+    def clear_cache(self) -> None:
+        """
+        시세 응답 캐시를 삭제합니다.
+        
+        현재가/호가/OHLCV 메모리 캐시와, cache=True로 생성한 경우
+        과거 시세 디스크 캐시를 함께 비웁니다.
+        """
+        self._quote.clear_cache()
+        if self._cache:
+            self._cache.clear()
+    
     # =========================================================================
     # Trading API
     # =========================================================================
@@ -268,10 +393,10 @@ class KIS:
             side: 주문 방향 ("buy" 또는 "sell")
             amount: 주문 수량 (주)
             price: 주문 가격 (원)
-            
+        
         Returns:
             Order 인스턴스 (주문번호 포함)
-            
+        
         Example:
             ```python
             order = kis.create_limit_order("005930", "buy", 10, 50000)
@@ -279,7 +404,7 @@ class KIS:
             ```
         """
         return self._order.create_order(
-            symbol, OrderSide(side), OrderType.LIMIT, amount, price
+            symbol, to_order_side(side), OrderType.LIMIT, amount, price
         )
     
     def create_market_order(
@@ -295,17 +420,17 @@ class KIS:
             symbol: 종목 코드 (예: "005930")
             side: 주문 방향 ("buy" 또는 "sell")
             amount: 주문 수량 (주)
-            
+        
         Returns:
             Order 인스턴스 (주문번호 포함)
-            
+        
         Example:
             ```python
             order = kis.create_market_order("005930", "sell", 5)
             ```
         """
         return self._order.create_order(
-            symbol, OrderSide(side), OrderType.MARKET, amount
+            symbol, to_order_side(side), OrderType.MARKET, amount
         )
     
     def cancel_order(self, order_id: str, symbol: str) -> Order:
@@ -315,10 +440,10 @@ class KIS:
         Args:
             order_id: 주문번호
             symbol: 종목 코드
-            
+        
         Returns:
             취소된 Order 인스턴스
-            
+        
         Example:
             ```python
             canceled = kis.cancel_order("0000123456", "005930")
@@ -333,7 +458,7 @@ class KIS:
         
         Returns:
             미체결 Order 리스트
-            
+        
         Example:
             ```python
             for order in kis.fetch_open_orders():
@@ -353,7 +478,7 @@ class KIS:
         
         Returns:
             Balance 인스턴스 (예수금, 평가금액, 보유 종목 등)
-            
+        
         Example:
             ```python
             balance = kis.fetch_balance()
@@ -377,6 +502,7 @@ class KIS:
         리소스 정리를 위해 사용 완료 후 호출해주세요.
         """
         self._http.close()
+        self._auth.close()
     
     def __enter__(self) -> "KIS":
         """Context manager 진입"""
@@ -5,6 +5,7 @@ KIS API 사용에 필요한 URL, 엔드포인트, TR_ID 및 Enum 상수를 정
 """
 
 from enum import Enum
+from functools import lru_cache
 
 
 class BaseURL:
@@ -23,6 +24,17 @@ class BaseURL:
     WS_PAPER = "ws://ops.koreainvestment.com:31000"
 
 
+class RateLimit:
+    """
+    KIS API 초당 요청 제한
+    
+    실전투자와 모의투자 환경에 따른 초당 허용 요청 수를 정의합니다.
+    """
+    
+    PRODUCTION = 20   # 실전투자: 초당 20건
+    PAPER = 2         # 모의투자: 초당 2건
+
+
 class Endpoint:
     """
     KIS API 엔드포인트
@@ -37,6 +49,9 @@ class Endpoint:
     PRICE = "/uapi/domestic-stock/v1/quotations/inquire-price"
     ORDERBOOK = "/uapi/domestic-stock/v1/quotations/inquire-asking-price-exp-ccn"
     DAILY_PRICE = "/uapi/domestic-stock/v1/quotations/inquire-daily-price"
+    DAILY_CHART = "/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice"
+    MINUTE_CHART = "/uapi/domestic-stock/v1/quotations/inquire-time-itemchartprice"
+    MINUTE_CHART_DAILY = "/uapi/domestic-stock/v1/quotations/inquire-time-dailychartprice"
     
     # 주문 (국내 주식)
     ORDER = "/uapi/domestic-stock/v1/trading/order-cash"
@@ -59,6 +74,9 @@ class TrID:
     PRICE = "FHKST01010100"           # 현재가 조회
     ORDERBOOK = "FHKST01010200"       # 호가 조회
     DAILY_PRICE = "FHKST01010400"     # 일별 시세(OHLCV)
+    DAILY_CHART = "FHKST03010100"     # 기간별 시세(일/주/월봉)
+    MINUTE_CHART = "FHKST03010200"    # 당일 분봉
+    MINUTE_CHART_DAILY = "FHKST03010230"  # 일별 분봉 (과거, 실전 전용)
     
     # 주문 (실전)
     BUY = "TTTC0802U"                 # 매수
@@ -79,6 +97,35 @@ class TrID:
     OPEN_ORDERS_PAPER = "VTTC8036R"   # 미체결 조회 (모의)
 
 
+# 실전/모의 구분이 있는 TR_ID (action → (실전, 모의))
+_TR_TABLE = {
+    "buy": (TrID.BUY, TrID.BUY_PAPER),
+    "sell": (TrID.SELL, TrID.SELL_PAPER),
+    "modify": (TrID.MODIFY, TrID.MODIFY_PAPER),
+    "balance": (TrID.BALANCE, TrID.BALANCE_PAPER),
+    "open_orders": (TrID.OPEN_ORDERS, TrID.OPEN_ORDERS_PAPER),
+}
+
+
+@lru_cache(maxsize=64)
+def resolve_tr(action: str, is_paper: bool) -> str:
+    """
+    실전/모의투자에 맞는 TR_ID를 반환합니다.
+    
+    Args:
+        action: "buy", "sell", "modify", "balance", "open_orders"
+        is_paper: 모의투자 여부
+        
+    Returns:
+        TR_ID 문자열
+        
+    Raises:
+        KeyError: 알 수 없는 action
+    """
+    real, paper = _TR_TABLE[action]
+    return paper if is_paper else real
+
+
 class OrderSide(str, Enum):
     """
     주문 방향
@@ -89,6 +136,32 @@ class OrderSide(str, Enum):
     SELL = "sell"
 
 
+# 주문 방향 값/멤버 → OrderSide
+_ORDER_SIDES = {side.value: side for side in OrderSide}
+_ORDER_SIDES.update({side: side for side in OrderSide})
+
+
+def to_order_side(side: str) -> OrderSide:
+    """
+    주문 방향 문자열을 OrderSide로 변환합니다.
+    
+    OrderSide(side)와 같지만 Enum 생성 경로 대신 dict 조회만 수행합니다.
+    
+    Args:
+        side: "buy", "sell" 또는 OrderSide
+        
+    Returns:
+        OrderSide
+        
+    Raises:
+        ValueError: 알 수 없는 주문 방향
+    """
+    try:
+        return _ORDER_SIDES[side]
+    except KeyError:
+        raise ValueError(f"{side!r} is not a valid OrderSide") from None
+
+
 class OrderType(str, Enum):
     """
     주문 유형
@@ -4,6 +4,7 @@ PyKIS 예외 클래스 정의
 KIS API 사용 시 발생할 수 있는 다양한 오류를 처리하기 위한 예외 계층 구조를 정의합니다.
 """
 
+from types import MappingProxyType
 from typing import Optional
 
 
@@ -87,13 +88,14 @@ class MarketClosedError(OrderError):
     pass
 
 
-# KIS API 에러 코드와 예외 클래스 매핑
-ERROR_MAP = {
+# KIS API 에러 코드와 예외 클래스 매핑 (읽기 전용)
+ERROR_MAP = MappingProxyType({
     "EGW00001": AuthenticationError,      # 인증 실패
     "EGW00002": TokenExpiredError,        # 토큰 만료
+    "EGW00201": RateLimitError,           # 초당 거래건수 초과
     "OPSP0001": InsufficientBalanceError, # 잔고 부족
     "OPSP0010": MarketClosedError,        # 장 마감
-}
+})
 
 
 def raise_for_code(code: str, message: str) -> None:
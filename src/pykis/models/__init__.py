@@ -7,6 +7,7 @@ API 응답을 표현하는 Pydantic 모델을 정의합니다.
 from pykis.models.ticker import Ticker
 from pykis.models.orderbook import OrderBook, OrderBookLevel
 from pykis.models.ohlcv import OHLCV
+from pykis.models.frame import OHLCVFrame
 from pykis.models.order import Order
 from pykis.models.balance import Balance, Position
 
@@ -15,6 +16,7 @@ __all__ = [
     "OrderBook",
     "OrderBookLevel",
     "OHLCV",
+    "OHLCVFrame",
     "Order",
     "Balance",
     "Position",
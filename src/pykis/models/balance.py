@@ -4,9 +4,26 @@ PyKIS Balance 모델
 계좌 잔고 및 보유 종목 정보를 표현하는 모델입니다.
 """
 
-from typing import List, Optional
+from collections import ChainMap
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+
+try:
+    import numpy as np
+except ImportError:  # 선택 의존성: pip install pykis[numpy]
+    np = None
+
+# 보유 종목 응답 필드 (종목코드, 종목명, 보유수량, 매입평균가, 현재가, 평가손익, 평가손익률)
+_POSITION_FIELDS = itemgetter(
+    "pdno", "prdt_name", "hldg_qty",
+    "pchs_avg_pric", "prpr", "evlu_pfls_amt", "evlu_pfls_rt",
+)
+_POSITION_DEFAULTS = {
+    "pdno": "", "prdt_name": "", "hldg_qty": 0,
+    "pchs_avg_pric": 0, "prpr": 0, "evlu_pfls_amt": 0, "evlu_pfls_rt": 0,
+}
 
 
 class Position(BaseModel):
@@ -16,6 +33,8 @@ class Position(BaseModel):
     개별 보유 종목의 상세 내역입니다.
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     symbol: str                  # 종목 코드
     name: str                    # 종목명
     amount: int                  # 보유 수량
@@ -32,6 +51,8 @@ class Balance(BaseModel):
     계좌의 자산 현황과 보유 종목 리스트를 포함합니다.
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     total: float                 # 총 평가금액
     free: float                  # 주문 가능 금액
     deposit: float               # 예수금
@@ -41,6 +62,43 @@ class Balance(BaseModel):
     total_pnl: float             # 총 평가손익
     total_pnl_percent: float     # 총 수익률 (%)
     
+    # (인덱스를 만든 positions, 종목 코드 → 보유 종목)
+    _position_index: Optional[Tuple[List[Position], Dict[str, Position]]] = PrivateAttr(default=None)
+    
+    def pnl_array(self) -> Any:
+        """
+        보유 종목 지표를 numpy 배열로 반환합니다.
+        
+        열 순서는 (보유 수량, 평균 매입가, 현재가, 평가손익, 수익률)이고
+        행 순서는 positions와 같습니다. 호출할 때마다 현재 positions로 새 배열을 만듭니다.
+        
+        Returns:
+            (보유 종목 수, 5) float64 배열
+        
+        Raises:
+            ImportError: numpy가 설치되지 않은 경우
+        
+        Example:
+            ```python
+            m = balance.pnl_array()
+            weights = m[:, 0] * m[:, 2] / (m[:, 0] * m[:, 2]).sum()
+            ```
+        """
+        if np is None:
+            raise ImportError("pnl_array는 numpy가 필요합니다: pip install pykis[numpy]")
+        
+        positions = self.positions
+        matrix = np.empty((len(positions), 5), dtype=np.float64)
+        for i, pos in enumerate(positions):
+            matrix[i] = (
+                pos.amount,
+                pos.average_price,
+                pos.current_price,
+                pos.unrealized_pnl,
+                pos.unrealized_pnl_percent,
+            )
+        return matrix
+    
     def get_position(self, symbol: str) -> Optional[Position]:
         """
         특정 종목의 보유 정보를 조회합니다.
@@ -51,16 +109,20 @@ class Balance(BaseModel):
         Returns:
             Position 인스턴스 또는 None (미보유 시)
         """
-        for pos in self.positions:
-            if pos.symbol == symbol:
-                return pos
-        return None
+        index = self._position_index
+        if index is None or index[0] is not self.positions:
+            # 첫 조회이거나 model_copy로 positions가 바뀐 경우 다시 생성
+            index = (self.positions, {pos.symbol: pos for pos in self.positions})
+            self._position_index = index
+        return index[1].get(symbol)
     
     @classmethod
     def from_kis(cls, data: dict) -> "Balance":
         """
         KIS API 응답을 Balance 모델로 변환합니다.
         
+        값은 여기서 모두 변환하므로 pydantic 검증 없이 생성합니다.
+        
         Args:
             data: KIS API 응답 데이터
             
@@ -74,20 +136,27 @@ class Balance(BaseModel):
         # 보유 종목 파싱
         positions: List[Position] = []
         for item in output1:
+            try:
+                symbol, name, qty, avg, price, pnl, pnl_pct = _POSITION_FIELDS(item)
+            except KeyError:
+                symbol, name, qty, avg, price, pnl, pnl_pct = _POSITION_FIELDS(
+                    ChainMap(item, _POSITION_DEFAULTS)
+                )
+            
             # 보유 수량이 0보다 큰 종목만 추가
-            qty = int(item.get("hldg_qty", 0))
+            qty = int(qty)
             if qty > 0:
-                positions.append(Position(
-                    symbol=item.get("pdno", ""),
-                    name=item.get("prdt_name", ""),
+                positions.append(Position.model_construct(
+                    symbol=symbol,
+                    name=name,
                     amount=qty,
-                    average_price=float(item.get("pchs_avg_pric", 0)),
-                    current_price=float(item.get("prpr", 0)),
-                    unrealized_pnl=float(item.get("evlu_pfls_amt", 0)),
-                    unrealized_pnl_percent=float(item.get("evlu_pfls_rt", 0)),
+                    average_price=float(avg),
+                    current_price=float(price),
+                    unrealized_pnl=float(pnl),
+                    unrealized_pnl_percent=float(pnl_pct),
                 ))
         
-        return cls(
+        return cls.model_construct(
             total=float(output2.get("tot_evlu_amt", 0)),
             free=float(output2.get("prvs_rcdl_excc_amt", 0)),
             deposit=float(output2.get("dnca_tot_amt", 0)),
@@ -0,0 +1,86 @@
+"""
+PyKIS OHLCV 프레임 모델
+
+여러 캔들을 컬럼별 numpy 배열로 표현하는 모델입니다.
+"""
+
+from datetime import datetime
+from typing import Any, List
+
+from pydantic import BaseModel
+
+from pykis.models.ohlcv import parse_kis_datetime
+
+try:
+    import numpy as np
+except ImportError:  # 선택 의존성: pip install pykis[numpy]
+    np = None
+
+
+class OHLCVFrame(BaseModel):
+    """
+    컬럼형 OHLCV 데이터
+    
+    캔들별 객체 대신 컬럼별 배열을 보관하므로 지표 계산 등 벡터 연산에 적합합니다.
+    모든 배열은 과거 → 최근 순이며 길이가 같습니다.
+    
+    Example:
+        ```python
+        frame = kis.fetch_ohlcv_frame("005930", limit=60)
+        ma20 = np.convolve(frame.close, np.ones(20) / 20, mode="valid")
+        ```
+    """
+    
+    datetime: Any   # np.ndarray[datetime64[s]] 날짜/시간
+    open: Any       # np.ndarray[float64] 시가
+    high: Any       # np.ndarray[float64] 고가
+    low: Any        # np.ndarray[float64] 저가
+    close: Any      # np.ndarray[float64] 종가
+    volume: Any     # np.ndarray[int64] 거래량
+    
+    def __len__(self) -> int:
+        return len(self.close)
+    
+    @classmethod
+    def from_kis(cls, items: List[dict]) -> "OHLCVFrame":
+        """
+        KIS API 응답의 캔들 목록을 OHLCVFrame으로 변환합니다.
+        
+        Args:
+            items: 캔들 데이터 리스트 (과거 → 최근 순)
+        
+        Returns:
+            OHLCVFrame 인스턴스
+        
+        Raises:
+            ImportError: numpy가 설치되지 않은 경우
+        """
+        if np is None:
+            raise ImportError("OHLCVFrame은 numpy가 필요합니다: pip install pykis[numpy]")
+        
+        n = len(items)
+        times = np.empty(n, dtype="datetime64[s]")
+        opens = np.empty(n, dtype=np.float64)
+        highs = np.empty(n, dtype=np.float64)
+        lows = np.empty(n, dtype=np.float64)
+        closes = np.empty(n, dtype=np.float64)
+        volumes = np.empty(n, dtype=np.int64)
+        
+        for i, item in enumerate(items):
+            date_str = item.get("stck_bsop_date", "")
+            times[i] = parse_kis_datetime(date_str) if date_str else datetime.now()
+            opens[i] = float(item.get("stck_oprc", 0))
+            highs[i] = float(item.get("stck_hgpr", 0))
+            lows[i] = float(item.get("stck_lwpr", 0))
+            closes[i] = float(item.get("stck_clpr", 0))
+            volumes[i] = int(item.get("acml_vol", 0))
+        
+        # 배열은 이미 검증된 값이므로 검증 없이 생성
+        return cls.model_construct(
+            datetime=times,
+            open=opens,
+            high=highs,
+            low=lows,
+            close=closes,
+            volume=volumes,
+        )
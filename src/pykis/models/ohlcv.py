@@ -5,9 +5,41 @@ PyKIS OHLCV 모델
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
+
+
+@lru_cache(maxsize=8192)
+def parse_kis_datetime(date: str, time: str = "") -> datetime:
+    """
+    KIS 날짜(YYYYMMDD)와 시각(HHMMSS) 문자열을 datetime으로 변환합니다.
+    
+    고정 길이 문자열이므로 strptime 대신 슬라이싱으로 파싱하며,
+    여러 종목/구간에서 같은 날짜가 반복되므로 결과를 캐시합니다.
+    
+    Args:
+        date: 날짜 문자열 (예: "20260114")
+        time: 시각 문자열 (예: "093000", 생략 시 00:00:00)
+    
+    Returns:
+        datetime 인스턴스
+    """
+    if time:
+        return datetime(
+            int(date[:4]), int(date[4:6]), int(date[6:8]),
+            int(time[:2]), int(time[2:4]), int(time[4:6]),
+        )
+    return datetime(int(date[:4]), int(date[4:6]), int(date[6:8]))
+
+
+@lru_cache(maxsize=8192)
+def _timestamp_ms(dt: datetime) -> int:
+    """
+    datetime의 Unix timestamp(밀리초)를 반환합니다. (캐시)
+    """
+    return int(dt.timestamp() * 1000)
 
 
 class OHLCV(BaseModel):
@@ -17,6 +49,8 @@ class OHLCV(BaseModel):
     시가, 고가, 저가, 종가, 거래량 정보를 포함합니다.
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     datetime: datetime              # 날짜/시간
     timestamp: Optional[int] = None # Unix timestamp (밀리초, 선택)
     
@@ -30,7 +64,44 @@ class OHLCV(BaseModel):
         """timestamp가 없으면 datetime에서 생성"""
         if self.timestamp is None:
             object.__setattr__(self, 'timestamp', int(self.datetime.timestamp() * 1000))
-
+    
+    @classmethod
+    def from_bar(
+        cls,
+        dt: datetime,
+        open: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: int,
+    ) -> "OHLCV":
+        """
+        변환된 값으로 OHLCV를 생성합니다.
+        
+        값이 이미 변환된 상태이므로 검증을 생략하고 바로 생성합니다
+        (대량 분봉 응답 처리용).
+        
+        Args:
+            dt: 날짜/시간
+            open: 시가
+            high: 고가
+            low: 저가
+            close: 종가
+            volume: 거래량
+        
+        Returns:
+            OHLCV 인스턴스
+        """
+        return cls.model_construct(
+            datetime=dt,
+            timestamp=_timestamp_ms(dt),
+            open=open,
+            high=high,
+            low=low,
+            close=close,
+            volume=volume,
+        )
+    
     @classmethod
     def from_kis(cls, item: dict) -> "OHLCV":
         """
@@ -38,23 +109,22 @@ class OHLCV(BaseModel):
         
         Args:
             item: KIS API 응답의 개별 캔들 데이터
-            
+        
         Returns:
             OHLCV 인스턴스
         """
         # 날짜 파싱 (YYYYMMDD 형식)
         date_str = item.get("stck_bsop_date", "")
         if date_str:
-            dt = datetime.strptime(date_str, "%Y%m%d")
+            dt = parse_kis_datetime(date_str)
         else:
             dt = datetime.now()
         
-        return cls(
-            timestamp=int(dt.timestamp() * 1000),
-            datetime=dt,
-            open=float(item.get("stck_oprc", 0)),
-            high=float(item.get("stck_hgpr", 0)),
-            low=float(item.get("stck_lwpr", 0)),
-            close=float(item.get("stck_clpr", 0)),
-            volume=int(item.get("acml_vol", 0)),
+        return cls.from_bar(
+            dt,
+            float(item.get("stck_oprc", 0)),
+            float(item.get("stck_hgpr", 0)),
+            float(item.get("stck_lwpr", 0)),
+            float(item.get("stck_clpr", 0)),
+            int(item.get("acml_vol", 0)),
         )
@@ -7,7 +7,7 @@ PyKIS Order 모델
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from pykis.constants import OrderSide, OrderType, OrderStatus
 
@@ -19,6 +19,8 @@ class Order(BaseModel):
     주문의 상세 내역을 담고 있습니다.
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     id: str                               # 주문번호
     symbol: str                           # 종목 코드
     
@@ -33,3 +35,50 @@ class Order(BaseModel):
     
     timestamp: int                        # Unix timestamp (밀리초)
     datetime: datetime                    # 주문 시각
+    
+    @classmethod
+    def from_open(
+        cls,
+        id: str,
+        symbol: str,
+        side: OrderSide,
+        amount: int,
+        price: int,
+        filled: int,
+        remaining: int,
+        now: datetime,
+        now_ms: int,
+    ) -> "Order":
+        """
+        미체결 조회 결과로 Order를 생성합니다.
+        
+        값이 이미 변환된 상태이므로 검증을 생략하고 바로 생성합니다
+        (대량 미체결 응답 처리용).
+        
+        Args:
+            id: 주문번호
+            symbol: 종목 코드
+            side: 주문 방향
+            amount: 주문 수량
+            price: 주문 가격
+            filled: 체결 수량
+            remaining: 미체결 수량
+            now: 조회 시각
+            now_ms: 조회 시각 (밀리초 timestamp)
+            
+        Returns:
+            Order 인스턴스 (지정가, 미체결 상태)
+        """
+        return cls.model_construct(
+            id=id,
+            symbol=symbol,
+            side=side,
+            type=OrderType.LIMIT,  # 미체결 조회에서는 기본 지정가
+            status=OrderStatus.OPEN,
+            amount=amount,
+            price=price,
+            filled=filled,
+            remaining=remaining,
+            timestamp=now_ms,
+            datetime=now,
+        )
@@ -5,9 +5,30 @@ PyKIS OrderBook 모델
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import compress
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from pykis.utils.clock import now_with_ms
+
+# 호가 1~10단계 응답 필드 (매수호가, 매수잔량, 매도호가, 매도잔량)
+_BID_KEYS = tuple(f"bidp{i}" for i in range(1, 11))
+_BID_QTY_KEYS = tuple(f"bidp_rsqn{i}" for i in range(1, 11))
+_ASK_KEYS = tuple(f"askp{i}" for i in range(1, 11))
+_ASK_QTY_KEYS = tuple(f"askp_rsqn{i}" for i in range(1, 11))
+
+
+def _active_levels(
+    prices: Iterable[float],
+    amounts: Iterable[int],
+) -> Tuple[Tuple[float, ...], Tuple[int, ...]]:
+    """
+    가격이 0인 빈 호가를 제외한 (가격, 잔량) 열을 반환합니다.
+    """
+    prices = tuple(prices)
+    mask = [price > 0 for price in prices]
+    return tuple(compress(prices, mask)), tuple(compress(amounts, mask))
 
 
 class OrderBookLevel(BaseModel):
@@ -16,6 +37,9 @@ class OrderBookLevel(BaseModel):
     
     개별 호가 가격과 잔량을 표현합니다.
     """
+    
+    model_config = ConfigDict(frozen=True)
+    
     price: float    # 호가
     amount: int     # 잔량
 
@@ -25,54 +49,83 @@ class OrderBook(BaseModel):
     호가 정보
     
     매수/매도 호가 10단계를 포함합니다.
+    
+    호가는 가격과 잔량을 별도 튜플로 보관하며, 같은 인덱스가 같은 단계입니다.
+    bids/asks는 접근할 때마다 현재 튜플로부터 OrderBookLevel 리스트를 만듭니다.
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     symbol: str                              # 종목 코드
     timestamp: int                           # Unix timestamp (밀리초)
     datetime: datetime                       # 조회 시각
     
-    bids: List[OrderBookLevel]               # 매수호가 (높은 가격순)
-    asks: List[OrderBookLevel]               # 매도호가 (낮은 가격순)
+    bid_prices: Tuple[float, ...]            # 매수호가 (높은 가격순)
+    bid_amounts: Tuple[int, ...]             # 매수잔량
+    ask_prices: Tuple[float, ...]            # 매도호가 (낮은 가격순)
+    ask_amounts: Tuple[int, ...]             # 매도잔량
+    
+    info: Optional[Dict[str, Any]] = None    # 원본 응답 데이터 (include_raw=True일 때)
+    
+    @property
+    def bids(self) -> List[OrderBookLevel]:
+        """매수호가 리스트 (높은 가격순)"""
+        level = OrderBookLevel.model_construct
+        return [
+            level(price=price, amount=amount)
+            for price, amount in zip(self.bid_prices, self.bid_amounts)
+        ]
     
-    info: Optional[Dict[str, Any]] = None    # 원본 응답 데이터
+    @property
+    def asks(self) -> List[OrderBookLevel]:
+        """매도호가 리스트 (낮은 가격순)"""
+        level = OrderBookLevel.model_construct
+        return [
+            level(price=price, amount=amount)
+            for price, amount in zip(self.ask_prices, self.ask_amounts)
+        ]
 
     @classmethod
-    def from_kis(cls, data: dict, symbol: str) -> "OrderBook":
+    def from_kis(
+        cls,
+        data: dict,
+        symbol: str,
+        include_raw: bool = False,
+    ) -> "OrderBook":
         """
         KIS API 응답을 OrderBook 모델로 변환합니다.
         
         Args:
             data: KIS API 응답 데이터
             symbol: 종목 코드
+            include_raw: True면 원본 응답을 info에 보관
             
         Returns:
             OrderBook 인스턴스
         """
         output = data.get("output1", {})
-        now = datetime.now()
+        now, now_ms = now_with_ms()
         
-        bids: List[OrderBookLevel] = []
-        asks: List[OrderBookLevel] = []
+        get = output.get
         
-        # 호가 10단계 파싱
-        for i in range(1, 11):
-            # 매수호가 (bidp1 ~ bidp10)
-            bid_price = float(output.get(f"bidp{i}", 0))
-            bid_qty = int(output.get(f"bidp_rsqn{i}", 0))
-            if bid_price > 0:
-                bids.append(OrderBookLevel(price=bid_price, amount=bid_qty))
-            
-            # 매도호가 (askp1 ~ askp10)
-            ask_price = float(output.get(f"askp{i}", 0))
-            ask_qty = int(output.get(f"askp_rsqn{i}", 0))
-            if ask_price > 0:
-                asks.append(OrderBookLevel(price=ask_price, amount=ask_qty))
+        # 호가 10단계 파싱 (bidp1 ~ bidp10, askp1 ~ askp10)
+        bid_prices, bid_amounts = _active_levels(
+            [float(get(key, 0)) for key in _BID_KEYS],
+            [int(get(key, 0)) for key in _BID_QTY_KEYS],
+        )
+        ask_prices, ask_amounts = _active_levels(
+            [float(get(key, 0)) for key in _ASK_KEYS],
+            [int(get(key, 0)) for key in _ASK_QTY_KEYS],
+        )
         
-        return cls(
+        # 값은 여기서 모두 변환했으므로 검증 없이 생성
+        return cls.model_construct(
             symbol=symbol,
-            timestamp=int(now.timestamp() * 1000),
+            timestamp=now_ms,
             datetime=now,
-            bids=bids,
-            asks=asks,
-            info=data,
+            bid_prices=bid_prices,
+            bid_amounts=bid_amounts,
+            ask_prices=ask_prices,
+            ask_amounts=ask_amounts,
+            info=data if include_raw else None,
         )
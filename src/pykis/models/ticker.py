@@ -7,7 +7,12 @@ PyKIS Ticker 모델
 from datetime import datetime
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from pykis.utils.clock import now_with_ms
+
+# 전일대비부호 → 부호 배수 (1:상한, 2:상승, 3:보합, 4:하한, 5:하락)
+_SIGN_MULT = {"4": -1.0, "5": -1.0}
 
 
 class Ticker(BaseModel):
@@ -17,6 +22,8 @@ class Ticker(BaseModel):
     종목의 현재 시세 정보를 담고 있습니다.
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     symbol: str                              # 종목 코드 (예: "005930")
     name: Optional[str] = None               # 종목명 (예: "삼성전자")
     
@@ -33,53 +40,53 @@ class Ticker(BaseModel):
     change: float                            # 전일대비 변동 (원)
     change_percent: float                    # 등락률 (%)
     
-    info: Optional[Dict[str, Any]] = None    # 원본 응답 데이터
+    info: Optional[Dict[str, Any]] = None    # 원본 응답 데이터 (include_raw=True일 때)
 
     @classmethod
-    def from_kis(cls, data: dict, symbol: str) -> "Ticker":
+    def from_kis(
+        cls,
+        data: dict,
+        symbol: str,
+        include_raw: bool = False,
+    ) -> "Ticker":
         """
         KIS API 응답을 Ticker 모델로 변환합니다.
         
         Args:
             data: KIS API 응답 데이터
             symbol: 종목 코드
+            include_raw: True면 원본 응답을 info에 보관
             
         Returns:
             Ticker 인스턴스
         """
-        output = data.get("output", {})
+        output = data.get("output") or {}
+        get = output.get
         
         # 현재가
-        last = float(output.get("stck_prpr", 0))
-        
-        # 전일대비 및 부호
-        change = float(output.get("prdy_vrss", 0))
-        sign = output.get("prdy_vrss_sign", "3")
-        
-        # 하락(4, 5)이면 음수로 변환
-        if sign in ("4", "5"):
-            change = -abs(change)
+        last = float(get("stck_prpr", 0))
         
-        # 등락률
-        change_pct = float(output.get("prdy_ctrt", 0))
-        if sign in ("4", "5"):
-            change_pct = -abs(change_pct)
+        # 전일대비/등락률은 부호 필드 기준으로 방향 결정 (하락이면 음수)
+        mult = _SIGN_MULT.get(get("prdy_vrss_sign", "3"), 1.0)
+        change = abs(float(get("prdy_vrss", 0))) * mult
+        change_pct = abs(float(get("prdy_ctrt", 0))) * mult
         
-        now = datetime.now()
+        now, now_ms = now_with_ms()
         
-        return cls(
+        # 값은 여기서 모두 변환했으므로 검증 없이 생성
+        return cls.model_construct(
             symbol=symbol,
             # 종목명: 여러 필드명 시도 (API에 따라 다름)
-            name=output.get("hts_kor_isnm") or output.get("prdt_name") or output.get("stck_shrn_iscd"),
-            timestamp=int(now.timestamp() * 1000),
+            name=get("hts_kor_isnm") or get("prdt_name") or get("stck_shrn_iscd"),
+            timestamp=now_ms,
             datetime=now,
-            open=float(output.get("stck_oprc", 0)),
-            high=float(output.get("stck_hgpr", 0)),
-            low=float(output.get("stck_lwpr", 0)),
+            open=float(get("stck_oprc", 0)),
+            high=float(get("stck_hgpr", 0)),
+            low=float(get("stck_lwpr", 0)),
             close=last,
             last=last,
-            volume=int(output.get("acml_vol", 0)),
+            volume=int(get("acml_vol", 0)),
             change=change,
             change_percent=change_pct,
-            info=data,
+            info=data if include_raw else None,
         )
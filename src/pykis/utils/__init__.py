@@ -4,5 +4,14 @@ PyKIS 유틸리티 모듈
 
 from pykis.utils.http import HTTPClient
 from pykis.utils.async_http import AsyncHTTPClient
+from pykis.utils.ratelimit import TokenBucket, AsyncTokenBucket
+from pykis.utils.cache import ResponseCache, TTLCache
 
-__all__ = ["HTTPClient", "AsyncHTTPClient"]
+__all__ = [
+    "HTTPClient",
+    "AsyncHTTPClient",
+    "TokenBucket",
+    "AsyncTokenBucket",
+    "ResponseCache",
+    "TTLCache",
+]
@@ -4,11 +4,22 @@ PyKIS 비동기 HTTP 클라이언트
 KIS API와의 비동기 HTTP 통신을 담당합니다.
 """
 
-from typing import Any, Dict, Optional
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
 from pykis.exceptions import APIError, RateLimitError, raise_for_code
+from pykis.utils.cache import ResponseCache
+from pykis.utils.http import (
+    HTTP2,
+    MAX_RETRIES,
+    POOL_LIMITS,
+    json_body,
+    parse_json,
+    retry_delay,
+)
+from pykis.utils.ratelimit import AsyncTokenBucket
 
 
 class AsyncHTTPClient:
@@ -18,14 +29,24 @@ class AsyncHTTPClient:
     인증 헤더를 포함한 비동기 HTTP 요청을 수행합니다.
     """
     
-    def __init__(self, base_url: str, auth: Any):
+    def __init__(
+        self,
+        base_url: str,
+        auth: Any,
+        rate: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+    ):
         """
         Args:
             base_url: API 기본 URL
             auth: AsyncAuthManager 인스턴스
+            rate: 초당 최대 요청 수 (None이면 제한 없음)
+            cache: 과거 시세 응답 캐시 (None이면 캐시하지 않음)
         """
         self.base_url = base_url
         self.auth = auth
+        self._cache = cache
+        self._bucket = AsyncTokenBucket(rate) if rate else None
         self._client: Optional[httpx.AsyncClient] = None
     
     async def _get_client(self) -> httpx.AsyncClient:
@@ -36,6 +57,8 @@ class AsyncHTTPClient:
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
                 timeout=30.0,
+                limits=POOL_LIMITS,
+                http2=HTTP2,
             )
         return self._client
     
@@ -52,16 +75,24 @@ class AsyncHTTPClient:
             endpoint: API 엔드포인트
             tr_id: 거래 ID (tr_id 헤더)
             params: 쿼리 파라미터
-            
+        
         Returns:
             API 응답 데이터
         """
-        headers = await self.auth.get_headers()
-        headers["tr_id"] = tr_id
+        # 과거 날짜 조회는 캐시 우선
+        cacheable = self._cache is not None and self._cache.is_cacheable(params)
+        if cacheable:
+            cached = self._cache.get(self.base_url, endpoint, tr_id, params)
+            if cached is not None:
+                return cached
         
-        client = await self._get_client()
-        resp = await client.get(endpoint, params=params, headers=headers)
-        return self._handle_response(resp)
+        headers = await self.auth.get_tr_headers(tr_id)
+        
+        data = await self._send("GET", endpoint, params=params, headers=headers)
+        
+        if cacheable:
+            self._cache.set(self.base_url, endpoint, tr_id, params, data)
+        return data
     
     async def post(
         self,
@@ -76,16 +107,82 @@ class AsyncHTTPClient:
             endpoint: API 엔드포인트
             tr_id: 거래 ID (tr_id 헤더)
             json: 요청 본문 (JSON)
-            
+        
         Returns:
             API 응답 데이터
         """
-        headers = await self.auth.get_headers()
-        headers["tr_id"] = tr_id
+        headers = await self.auth.get_tr_headers(tr_id)
+        
+        return await self._send("POST", endpoint, headers=headers, **json_body(json))
+    
+    async def batch(
+        self,
+        requests: List[Tuple[str, str, Optional[Dict[str, Any]]]],
+        return_exceptions: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        여러 GET 요청을 동시에 수행합니다.
+        
+        Args:
+            requests: (endpoint, tr_id, params) 튜플 리스트
+            return_exceptions: True면 실패한 요청의 예외를 결과 자리에 담아 반환
+            limit: 동시에 진행할 최대 요청 수 (None이면 제한 없음)
+        
+        Returns:
+            요청 순서와 같은 순서의 API 응답 데이터 리스트
+        """
+        if limit is None:
+            return await asyncio.gather(
+                *(
+                    self.get(endpoint, tr_id, params)
+                    for endpoint, tr_id, params in requests
+                ),
+                return_exceptions=return_exceptions,
+            )
+        
+        semaphore = asyncio.Semaphore(limit)
+        
+        async def bounded_get(
+            endpoint: str,
+            tr_id: str,
+            params: Optional[Dict[str, Any]],
+        ) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.get(endpoint, tr_id, params)
+        
+        return await asyncio.gather(
+            *(
+                bounded_get(endpoint, tr_id, params)
+                for endpoint, tr_id, params in requests
+            ),
+            return_exceptions=return_exceptions,
+        )
+    
+    async def _send(self, method: str, endpoint: str, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Rate Limit을 적용해 비동기 요청을 보냅니다.
         
+        HTTP 429 응답과 초당 거래건수 초과(EGW00201) 응답은
+        최대 MAX_RETRIES회까지 대기 후 재시도합니다.
+        """
         client = await self._get_client()
-        resp = await client.post(endpoint, json=json, headers=headers)
-        return self._handle_response(resp)
+        
+        attempt = 0
+        while True:
+            if self._bucket:
+                await self._bucket.acquire()
+            
+            resp = await client.request(method, endpoint, **kwargs)
+            try:
+                return self._handle_response(resp)
+            except RateLimitError:
+                # HTTP 429 또는 본문 오류 코드 EGW00201 (초당 거래건수 초과)
+                if attempt == MAX_RETRIES:
+                    raise
+            
+            await asyncio.sleep(retry_delay(resp, attempt))
+            attempt += 1
     
     def _handle_response(self, resp: httpx.Response) -> Dict[str, Any]:
         """
@@ -95,7 +192,7 @@ class AsyncHTTPClient:
             raise RateLimitError("Rate limit exceeded (초당 20건 초과)")
         
         try:
-            data = resp.json()
+            data = parse_json(resp)
         except Exception as e:
             raise APIError(f"응답 파싱 오류: {e}")
         
@@ -0,0 +1,204 @@
+"""
+PyKIS 응답 캐시
+
+과거 날짜의 시세(일봉/분봉) 응답은 디스크에 저장해 재사용합니다.
+수정주가 응답은 액면분할·배당 등으로 과거 값도 바뀔 수 있으므로 하루가 지나면 다시 조회합니다.
+현재가/호가처럼 자주 바뀌는 응답은 짧은 TTL의 메모리 캐시를 사용합니다.
+"""
+
+import hashlib
+import json
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from pykis.utils import json_codec
+
+# 한국 표준시 (UTC+9)
+KST = timezone(timedelta(hours=9))
+
+
+class ResponseCache:
+    """
+    파일 기반 GET 응답 캐시
+    
+    (base_url, endpoint, tr_id, params)를 키로 응답을 JSON 파일에 저장합니다.
+    조회 기간이 모두 오늘(KST) 이전인 요청만 캐시하며,
+    수정주가(FID_ORG_ADJ_PRC="0") 응답은 ADJUSTED_MAX_AGE초가 지나면 만료됩니다.
+    
+    Example:
+        ```python
+        cache = ResponseCache()
+        if cache.is_cacheable(params):
+            data = cache.get(base_url, endpoint, tr_id, params)
+        ```
+    """
+    
+    # 수정주가 응답 보관 시간 (초)
+    ADJUSTED_MAX_AGE = 24 * 60 * 60
+    
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Args:
+            directory: 캐시 저장 경로 (기본: ~/.pykis/cache)
+        """
+        self._dir = Path(directory or "~/.pykis/cache").expanduser()
+    
+    @staticmethod
+    def is_cacheable(params: Optional[Dict[str, Any]]) -> bool:
+        """
+        캐시 가능한 요청인지 확인합니다.
+        
+        FID_INPUT_DATE_* 값이 하나 이상 있고, 모두 오늘(KST) 이전이면 캐시합니다.
+        날짜가 비어 있으면 "최근" 조회이므로 캐시하지 않습니다.
+        
+        Args:
+            params: 쿼리 파라미터
+        
+        Returns:
+            캐시 가능하면 True
+        """
+        if not params:
+            return False
+        
+        dates = [
+            str(value) for key, value in params.items()
+            if key.startswith("FID_INPUT_DATE") and value
+        ]
+        if not dates:
+            return False
+        
+        today = datetime.now(KST).strftime("%Y%m%d")
+        return max(dates) < today
+    
+    @staticmethod
+    def _is_adjusted(params: Dict[str, Any]) -> bool:
+        """
+        수정주가 반영 요청인지 확인합니다.
+        """
+        return str(params.get("FID_ORG_ADJ_PRC", "")) == "0"
+    
+    def _path(
+        self,
+        base_url: str,
+        endpoint: str,
+        tr_id: str,
+        params: Dict[str, Any],
+    ) -> Path:
+        """
+        요청에 대응하는 캐시 파일 경로를 반환합니다.
+        """
+        key = json.dumps([base_url, endpoint, tr_id, params], sort_keys=True)
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self._dir / f"{digest}.json"
+    
+    def get(
+        self,
+        base_url: str,
+        endpoint: str,
+        tr_id: str,
+        params: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 응답을 반환합니다.
+        
+        Returns:
+            캐시된 응답 데이터 (없거나, 만료됐거나, 읽을 수 없으면 None)
+        """
+        path = self._path(base_url, endpoint, tr_id, params)
+        
+        try:
+            if self._is_adjusted(params) and time.time() - path.stat().st_mtime > self.ADJUSTED_MAX_AGE:
+                return None
+            return json_codec.loads(path.read_bytes())
+        except (OSError, ValueError):
+            # 없거나 손상된 캐시는 무시
+            return None
+    
+    def set(
+        self,
+        base_url: str,
+        endpoint: str,
+        tr_id: str,
+        params: Dict[str, Any],
+        data: Dict[str, Any],
+    ) -> None:
+        """
+        응답을 캐시에 저장합니다.
+        """
+        path = self._path(base_url, endpoint, tr_id, params)
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(json_codec.dumps(data))
+        except OSError:
+            # 캐시 저장 실패는 무시 (다음 요청에서 다시 조회)
+            pass
+    
+    def clear(self) -> None:
+        """
+        캐시를 모두 삭제합니다.
+        """
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+
+class TTLCache:
+    """
+    만료 시간이 있는 메모리 캐시
+    
+    최대 maxsize개를 보관하며, 넘치면 가장 오래 전에 저장한 항목부터 제거합니다.
+    
+    Example:
+        ```python
+        cache = TTLCache()
+        cache.set(("ticker", "005930"), data, ttl=0.1)
+        cache.get(("ticker", "005930"))  # 0.1초 이내면 data, 이후 None
+        ```
+    """
+    
+    def __init__(self, maxsize: int = 1024):
+        """
+        Args:
+            maxsize: 최대 보관 항목 수
+        """
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        만료되지 않은 값을 반환합니다.
+        
+        Returns:
+            캐시된 값 (없거나 만료되었으면 None)
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            
+            expires, value = entry
+            if time.monotonic() >= expires:
+                del self._data[key]
+                return None
+            return value
+    
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """
+        값을 ttl초 동안 저장합니다.
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """
+        캐시를 모두 삭제합니다.
+        """
+        with self._lock:
+            self._data.clear()
@@ -0,0 +1,23 @@
+"""
+PyKIS 시각 유틸리티
+
+모델 생성 시 사용하는 현재 시각을 제공합니다.
+"""
+
+import time
+from datetime import datetime
+from typing import Tuple
+
+
+def now_with_ms() -> Tuple[datetime, int]:
+    """
+    현재 시각과 Unix timestamp(밀리초)를 함께 반환합니다.
+    
+    시각을 한 번만 읽어 두 값을 만들므로 datetime.now()와 timestamp()를
+    따로 호출하는 것보다 빠르고 두 값이 항상 일치합니다.
+    
+    Returns:
+        (현재 시각, Unix timestamp 밀리초) 튜플
+    """
+    ns = time.time_ns()
+    return datetime.fromtimestamp(ns / 1e9), ns // 1_000_000
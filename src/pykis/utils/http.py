@@ -4,11 +4,69 @@ PyKIS HTTP 클라이언트
 KIS API와의 HTTP 통신을 담당합니다.
 """
 
-from typing import Any, Dict, Optional
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
+try:
+    import h2  # noqa: F401
+    HTTP2 = True
+except ImportError:  # 선택 의존성: pip install pykis[http2]
+    HTTP2 = False
+
 from pykis.exceptions import APIError, RateLimitError, raise_for_code
+from pykis.utils import json_codec
+from pykis.utils.cache import ResponseCache
+from pykis.utils.ratelimit import TokenBucket
+
+# 커넥션 풀 설정 (keep-alive로 TLS 핸드셰이크 재사용, 실전 초당 20건 기준)
+# h2가 설치되어 있으면 HTTP/2로 협상해 동시 요청을 하나의 연결에서 다중화
+POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=20,
+    keepalive_expiry=30,
+)
+
+
+# Rate Limit 초과(HTTP 429, EGW00201) 시 재시도 횟수와 기본 대기 시간(초, 시도마다 2배, 지터 포함)
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5
+
+
+def retry_delay(resp: httpx.Response, attempt: int) -> float:
+    """
+    429 응답 후 재시도까지 대기할 시간(초)을 반환합니다.
+    
+    Retry-After 헤더(초 단위)가 있으면 따르고, 없으면 지수 백오프를 적용합니다.
+    동시에 거절된 요청들이 같은 시각에 다시 몰리지 않도록 백오프의 절반은 무작위로 둡니다.
+    """
+    retry_after = resp.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    backoff = RETRY_BACKOFF * (2 ** attempt)
+    return backoff / 2 + random.uniform(0, backoff / 2)
+
+
+def parse_json(resp: httpx.Response) -> Any:
+    """
+    응답 본문을 JSON으로 파싱합니다 (orjson이 있으면 orjson 사용).
+    """
+    return json_codec.loads(resp.content)
+
+
+def json_body(body: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    POST 요청 본문 인자를 생성합니다 (orjson이 있으면 직접 직렬화).
+    """
+    if json_codec.orjson is not None and body is not None:
+        return {"content": json_codec.dumps(body)}
+    return {"json": body}
 
 
 class HTTPClient:
@@ -19,15 +77,34 @@ class HTTPClient:
     응답의 성공/실패를 처리합니다.
     """
     
-    def __init__(self, base_url: str, auth: Any):
+    # batch() 동시 요청 스레드 수
+    MAX_WORKERS = 8
+    
+    def __init__(
+        self,
+        base_url: str,
+        auth: Any,
+        rate: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+    ):
         """
         Args:
             base_url: API 기본 URL
             auth: AuthManager 인스턴스
+            rate: 초당 최대 요청 수 (None이면 제한 없음)
+            cache: 과거 시세 응답 캐시 (None이면 캐시하지 않음)
         """
         self.base_url = base_url
         self.auth = auth
-        self._client = httpx.Client(base_url=base_url, timeout=30.0)
+        self._cache = cache
+        self._bucket = TokenBucket(rate) if rate else None
+        self._client = httpx.Client(
+            base_url=base_url,
+            timeout=30.0,
+            limits=POOL_LIMITS,
+            http2=HTTP2,
+        )
+        self._executor: Optional[ThreadPoolExecutor] = None
     
     def get(
         self,
@@ -42,19 +119,28 @@ class HTTPClient:
             endpoint: API 엔드포인트
             tr_id: 거래 ID (tr_id 헤더)
             params: 쿼리 파라미터
-            
+        
         Returns:
             API 응답 데이터
-            
+        
         Raises:
             APIError: API 오류 발생 시
             RateLimitError: Rate Limit 초과 시
         """
-        headers = self.auth.get_headers()
-        headers["tr_id"] = tr_id
+        # 과거 날짜 조회는 캐시 우선
+        cacheable = self._cache is not None and self._cache.is_cacheable(params)
+        if cacheable:
+            cached = self._cache.get(self.base_url, endpoint, tr_id, params)
+            if cached is not None:
+                return cached
+        
+        headers = self.auth.get_tr_headers(tr_id)
+        
+        data = self._send("GET", endpoint, params=params, headers=headers)
         
-        resp = self._client.get(endpoint, params=params, headers=headers)
-        return self._handle_response(resp)
+        if cacheable:
+            self._cache.set(self.base_url, endpoint, tr_id, params, data)
+        return data
     
     def post(
         self,
@@ -69,19 +155,87 @@ class HTTPClient:
             endpoint: API 엔드포인트
             tr_id: 거래 ID (tr_id 헤더)
             json: 요청 본문 (JSON)
-            
+        
         Returns:
             API 응답 데이터
-            
+        
         Raises:
             APIError: API 오류 발생 시
             RateLimitError: Rate Limit 초과 시
         """
-        headers = self.auth.get_headers()
-        headers["tr_id"] = tr_id
+        headers = self.auth.get_tr_headers(tr_id)
+        
+        return self._send("POST", endpoint, headers=headers, **json_body(json))
+    
+    def batch(
+        self,
+        requests: List[Tuple[str, str, Optional[Dict[str, Any]]]],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        여러 GET 요청을 동시에 수행합니다.
+        
+        KIS API는 다중 TR 일괄 조회를 지원하지 않으므로,
+        같은 커넥션 풀을 공유하는 스레드에서 요청을 병렬로 보냅니다.
+        Rate Limit은 각 요청마다 적용됩니다.
+        
+        Args:
+            requests: (endpoint, tr_id, params) 튜플 리스트
+            return_exceptions: True면 실패한 요청의 예외를 결과 자리에 담아 반환
+        
+        Returns:
+            요청 순서와 같은 순서의 API 응답 데이터 리스트
+        
+        Raises:
+            APIError: 하나라도 API 오류 발생 시 (return_exceptions=False)
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.MAX_WORKERS,
+                thread_name_prefix="pykis-http",
+            )
         
-        resp = self._client.post(endpoint, json=json, headers=headers)
-        return self._handle_response(resp)
+        futures = [
+            self._executor.submit(self.get, endpoint, tr_id, params)
+            for endpoint, tr_id, params in requests
+        ]
+        if not return_exceptions:
+            return [f.result() for f in futures]
+        
+        results: List[Any] = []
+        for f in futures:
+            try:
+                results.append(f.result())
+            except Exception as e:
+                results.append(e)
+        return results
+    
+    def _send(self, method: str, endpoint: str, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Rate Limit을 적용해 요청을 보냅니다.
+        
+        HTTP 429 응답과 초당 거래건수 초과(EGW00201) 응답은
+        최대 MAX_RETRIES회까지 대기 후 재시도합니다.
+        
+        Raises:
+            APIError: API 오류 발생 시
+            RateLimitError: 재시도 후에도 Rate Limit 초과 시
+        """
+        attempt = 0
+        while True:
+            if self._bucket:
+                self._bucket.acquire()
+            
+            resp = self._client.request(method, endpoint, **kwargs)
+            try:
+                return self._handle_response(resp)
+            except RateLimitError:
+                # HTTP 429 또는 본문 오류 코드 EGW00201 (초당 거래건수 초과)
+                if attempt == MAX_RETRIES:
+                    raise
+            
+            time.sleep(retry_delay(resp, attempt))
+            attempt += 1
     
     def _handle_response(self, resp: httpx.Response) -> Dict[str, Any]:
         """
@@ -89,10 +243,10 @@ class HTTPClient:
         
         Args:
             resp: HTTP 응답 객체
-            
+        
         Returns:
             API 응답 데이터
-            
+        
         Raises:
             APIError: API 오류 발생 시
             RateLimitError: Rate Limit 초과 시
@@ -102,7 +256,7 @@ class HTTPClient:
             raise RateLimitError("Rate limit exceeded (초당 20건 초과)")
         
         try:
-            data = resp.json()
+            data = parse_json(resp)
         except Exception as e:
             raise APIError(f"응답 파싱 오류: {e}")
         
@@ -118,4 +272,7 @@ class HTTPClient:
         """
         HTTP 클라이언트를 종료합니다.
         """
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         self._client.close()
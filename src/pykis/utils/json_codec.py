@@ -0,0 +1,43 @@
+"""
+PyKIS JSON 코덱
+
+orjson이 설치되어 있으면 orjson을, 없으면 표준 json을 사용합니다.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성: 없으면 표준 json 사용
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    JSON 문서를 파싱합니다.
+    
+    Args:
+        data: JSON 바이트 또는 문자열
+    
+    Returns:
+        파싱된 객체
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    객체를 UTF-8 JSON 바이트로 직렬화합니다.
+    
+    Args:
+        obj: 직렬화할 객체
+    
+    Returns:
+        JSON 바이트 (한글은 이스케이프하지 않음)
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
@@ -0,0 +1,114 @@
+"""
+PyKIS Rate Limiter
+
+KIS API 초당 요청 제한(실전 20건, 모의 2건)을 지키기 위한 토큰 버킷을 제공합니다.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class _TokenBucketBase:
+    """
+    토큰 버킷 공통 상태
+    
+    초당 rate개의 토큰이 채워지며, 최대 capacity개까지 쌓입니다.
+    요청 1건당 토큰 1개를 소비합니다.
+    
+    KIS는 초과 요청을 429가 아닌 rt_cd 오류로 거절하기도 하므로, 기본 capacity는 1입니다.
+    요청 간격이 1/rate초 이상으로 유지되어 어느 1초 구간에서도 rate건을 넘지 않습니다.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: 초당 토큰 충전 개수 (= 초당 허용 요청 수)
+            capacity: 버킷 최대 크기 (기본: 1, 순간 허용 요청 수)
+                1보다 크면 시작 직후 1초 동안 rate + capacity - 1건까지 허용됩니다.
+        """
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다")
+        
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else 1
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+    
+    def _refill(self) -> None:
+        """
+        경과 시간만큼 토큰을 충전합니다.
+        """
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+    
+    def _wait_time(self) -> float:
+        """
+        토큰 1개가 채워질 때까지 남은 시간(초)을 반환합니다.
+        """
+        return (1 - self._tokens) / self.rate
+
+
+class TokenBucket(_TokenBucketBase):
+    """
+    동기 토큰 버킷
+    
+    여러 스레드가 하나의 버킷을 공유할 수 있습니다.
+    
+    Example:
+        ```python
+        bucket = TokenBucket(rate=20)
+        bucket.acquire()  # 토큰이 없으면 채워질 때까지 대기
+        ```
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        super().__init__(rate, capacity)
+        self._cond = threading.Condition()
+    
+    def acquire(self) -> None:
+        """
+        토큰 1개를 소비합니다. 토큰이 없으면 충전될 때까지 대기합니다.
+        """
+        with self._cond:
+            self._refill()
+            while self._tokens < 1:
+                self._cond.wait(self._wait_time())
+                self._refill()
+            self._tokens -= 1
+
+
+class AsyncTokenBucket(_TokenBucketBase):
+    """
+    비동기 토큰 버킷
+    
+    여러 코루틴이 하나의 버킷을 공유할 수 있습니다.
+    토큰이 없을 때만 대기하므로 불필요하게 이벤트 루프를 멈추지 않습니다.
+    
+    Example:
+        ```python
+        bucket = AsyncTokenBucket(rate=20)
+        await bucket.acquire()
+        ```
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        super().__init__(rate, capacity)
+        # 이벤트 루프 바인딩을 피하기 위해 지연 생성
+        self._lock: Optional[asyncio.Lock] = None
+    
+    async def acquire(self) -> None:
+        """
+        토큰 1개를 비동기로 소비합니다. 토큰이 없으면 충전될 때까지 대기합니다.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep(self._wait_time())
+                self._refill()
+            self._tokens -= 1
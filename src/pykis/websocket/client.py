@@ -5,15 +5,35 @@ PyKIS WebSocket 클라이언트
 """
 
 import asyncio
-import json
-from datetime import datetime
-from typing import AsyncIterator, Callable, Dict, List, Optional, Any
+from typing import AsyncIterator, Callable, Dict, List, Optional, Any, Tuple
 
+import httpx
 import websockets
 from websockets.client import WebSocketClientProtocol
 
 from pykis.constants import BaseURL
-from pykis.models import Ticker, OrderBook, OrderBookLevel
+from pykis.models import Ticker, OrderBook
+from pykis.models.orderbook import _active_levels
+from pykis.models.ticker import _SIGN_MULT
+from pykis.utils import json_codec
+from pykis.utils.clock import now_with_ms
+
+# 구독 요청 헤더 중 고정 필드
+_SUBSCRIBE_HEADER = {
+    "custtype": "P",
+    "content-type": "utf-8",
+}
+
+
+def _put_latest(queue: asyncio.Queue, message: Optional[str]) -> None:
+    """
+    큐에 메시지를 넣습니다. 큐가 가득 차면 가장 오래된 메시지를 버립니다.
+    
+    실시간 시세는 최신 값만 의미가 있으므로 느린 구독자 때문에 메모리가 늘지 않게 합니다.
+    """
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(message)
 
 
 class WebSocketClient:
@@ -22,6 +42,9 @@ class WebSocketClient:
     
     실시간 시세 데이터를 스트리밍합니다.
     
+    하나의 WebSocket 연결에서 여러 종목을 구독하며, 수신 태스크가
+    메시지를 (TR_ID, 종목코드)별 구독자 큐로 분배합니다.
+    
     Example:
         ```python
         async with WebSocketClient(app_key, app_secret) as ws:
@@ -35,28 +58,42 @@ class WebSocketClient:
     TR_ID_ORDERBOOK = "H0STASP0"   # 실시간 호가
     TR_ID_EXECUTION = "H0STCNI0"   # 체결 통보 (내 주문)
     
+    # 1세션당 최대 실시간 등록 건수
+    MAX_SUBSCRIPTIONS = 41
+    
+    # 구독자별 대기 메시지 최대 개수 (초과 시 가장 오래된 메시지 삭제)
+    QUEUE_SIZE = 100
+    
     def __init__(
         self,
         app_key: str,
         app_secret: str,
         is_paper: bool = False,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """
         Args:
             app_key: KIS API App Key
             app_secret: KIS API App Secret
             is_paper: 모의투자 여부
+            http_client: Approval Key 발급에 사용할 AsyncClient
+                (전달하면 해당 커넥션 풀을 재사용하며 닫지 않음)
         """
         self.app_key = app_key
         self.app_secret = app_secret
         self.is_paper = is_paper
+        self._http_client = http_client
         
         # WebSocket URL 설정
         self.ws_url = BaseURL.WS_PAPER if is_paper else BaseURL.WS_PRODUCTION
         
         self._ws: Optional[WebSocketClientProtocol] = None
         self._approval_key: Optional[str] = None
-        self._subscriptions: Dict[str, List[str]] = {}
+        # (TR_ID, 종목코드) → 구독자 큐 목록
+        self._subscriptions: Dict[Tuple[str, str], List[asyncio.Queue]] = {}
+        self._reader_task: Optional[asyncio.Task] = None
+        # (TR_ID, 종목코드, 등록/해제) → 직렬화된 구독 메시지 (Approval Key 발급 시 초기화)
+        self._sub_messages: Dict[Tuple[str, str, str], str] = {}
     
     async def connect(self) -> None:
         """
@@ -64,21 +101,34 @@ class WebSocketClient:
         """
         # Approval Key 발급 (웹소켓 접속용 일회성 키)
         self._approval_key = await self._get_approval_key()
+        self._sub_messages.clear()
         
-        # WebSocket 연결
+        # WebSocket 연결 (짧은 텍스트 프레임이므로 permessage-deflate 압축 비활성화)
         self._ws = await websockets.connect(
             f"{self.ws_url}/tryitout/H0STCNT0",
             ping_interval=30,
             ping_timeout=10,
+            compression=None,
         )
+        self._reader_task = asyncio.create_task(self._reader())
     
     async def disconnect(self) -> None:
         """
         WebSocket 연결을 종료합니다.
         """
+        if self._reader_task:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+        
         if self._ws:
             await self._ws.close()
             self._ws = None
+        
+        self._close_subscribers()
     
     async def __aenter__(self) -> "WebSocketClient":
         """Context manager 진입"""
@@ -93,84 +143,204 @@ class WebSocketClient:
         """
         WebSocket 접속용 Approval Key를 발급받습니다.
         
+        공유 AsyncClient가 있으면 기존 연결을 재사용하고,
+        없으면 이번 요청에만 쓰는 클라이언트를 생성합니다.
+        
         Returns:
             Approval Key 문자열
         """
-        import httpx
+        if self._http_client is not None:
+            return await self._request_approval_key(self._http_client)
         
+        async with httpx.AsyncClient() as client:
+            return await self._request_approval_key(client)
+    
+    async def _request_approval_key(self, client: httpx.AsyncClient) -> str:
+        """
+        주어진 클라이언트로 Approval Key 발급 요청을 보냅니다.
+        """
         base_url = BaseURL.PAPER if self.is_paper else BaseURL.PRODUCTION
         
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                f"{base_url}/oauth2/Approval",
-                json={
-                    "grant_type": "client_credentials",
-                    "appkey": self.app_key,
-                    "secretkey": self.app_secret,
-                },
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            return data.get("approval_key", "")
+        resp = await client.post(
+            f"{base_url}/oauth2/Approval",
+            json={
+                "grant_type": "client_credentials",
+                "appkey": self.app_key,
+                "secretkey": self.app_secret,
+            },
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        return data.get("approval_key", "")
     
-    async def _subscribe(self, tr_id: str, symbol: str) -> None:
+    async def _subscribe(self, tr_id: str, symbol: str, tr_type: str = "1") -> None:
         """
-        종목을 구독합니다.
+        종목 구독을 등록하거나 해제합니다.
         
         Args:
             tr_id: 거래 ID (체결가/호가)
             symbol: 종목 코드
+            tr_type: "1" 등록, "2" 해제
         """
         if not self._ws:
             raise RuntimeError("WebSocket이 연결되지 않았습니다")
         
-        message = json.dumps({
-            "header": {
-                "approval_key": self._approval_key,
-                "custtype": "P",
-                "tr_type": "1",  # 1: 등록, 2: 해제
-                "content-type": "utf-8",
-            },
-            "body": {
-                "input": {
-                    "tr_id": tr_id,
-                    "tr_key": symbol,
+        key = (tr_id, symbol, tr_type)
+        message = self._sub_messages.get(key)
+        if message is None:
+            message = json_codec.dumps({
+                "header": {
+                    **_SUBSCRIBE_HEADER,
+                    "approval_key": self._approval_key,
+                    "tr_type": tr_type,  # 1: 등록, 2: 해제
+                },
+                "body": {
+                    "input": {
+                        "tr_id": tr_id,
+                        "tr_key": symbol,
+                    }
                 }
-            }
-        })
+            }).decode("utf-8")  # 텍스트 프레임으로 전송
+            self._sub_messages[key] = message
         
         await self._ws.send(message)
     
+    async def _reader(self) -> None:
+        """
+        수신 메시지를 구독자 큐로 분배합니다.
+        
+        연결당 하나만 실행되며, 연결이 끊기면 모든 구독자에게 종료를 알립니다.
+        """
+        try:
+            async for message in self._ws:
+                if isinstance(message, bytes):
+                    message = message.decode("utf-8")
+                
+                if message.startswith("{"):
+                    # 제어 메시지 (구독 확인, PINGPONG)
+                    await self._handle_control_message(message)
+                    continue
+                
+                # 실시간 데이터: 암호화여부|TR_ID|건수|데이터(^ 구분, 첫 필드 종목코드)
+                parts = message.split("|", 3)
+                if len(parts) < 4:
+                    continue
+                
+                key = (parts[1], parts[3].split("^", 1)[0])
+                for queue in self._subscriptions.get(key, ()):
+                    _put_latest(queue, message)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            self._close_subscribers()
+    
+    async def _handle_control_message(self, message: str) -> None:
+        """
+        JSON 제어 메시지를 처리합니다.
+        
+        서버의 PINGPONG 메시지는 그대로 돌려보내 연결을 유지합니다.
+        """
+        try:
+            data = json_codec.loads(message)
+        except ValueError:
+            return
+        
+        if data.get("header", {}).get("tr_id") == "PINGPONG" and self._ws:
+            await self._ws.send(message)
+    
+    def _close_subscribers(self) -> None:
+        """
+        모든 구독자 큐에 종료 신호(None)를 보냅니다.
+        """
+        for queues in self._subscriptions.values():
+            for queue in queues:
+                _put_latest(queue, None)
+        self._subscriptions.clear()
+    
+    async def _listen(self, tr_id: str, symbol: str) -> AsyncIterator[str]:
+        """
+        (TR_ID, 종목코드)의 실시간 메시지를 구독합니다.
+        
+        같은 종목을 여러 곳에서 구독해도 서버에는 한 번만 등록하며,
+        마지막 구독자가 종료되면 등록을 해제합니다.
+        
+        Args:
+            tr_id: 거래 ID (체결가/호가)
+            symbol: 종목 코드
+        
+        Yields:
+            원본 실시간 메시지
+        """
+        if not self._ws:
+            raise RuntimeError("WebSocket이 연결되지 않았습니다")
+        
+        key = (tr_id, symbol)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        
+        if key not in self._subscriptions:
+            if len(self._subscriptions) >= self.MAX_SUBSCRIPTIONS:
+                raise RuntimeError(
+                    f"실시간 등록은 최대 {self.MAX_SUBSCRIPTIONS}건까지 가능합니다"
+                )
+            self._subscriptions[key] = [queue]
+            try:
+                await self._subscribe(tr_id, symbol)
+            except BaseException:
+                # 등록 실패 시 키를 되돌리고, 그 사이 합류한 구독자도 종료
+                for other in self._subscriptions.pop(key, ()):
+                    if other is not queue:
+                        _put_latest(other, None)
+                raise
+        else:
+            self._subscriptions[key].append(queue)
+        
+        try:
+            while True:
+                message = await queue.get()
+                if message is None:
+                    # 연결 종료
+                    return
+                yield message
+        finally:
+            queues = self._subscriptions.get(key)
+            if queues and queue in queues:
+                queues.remove(queue)
+                if not queues:
+                    del self._subscriptions[key]
+                    if self._ws:
+                        try:
+                            await self._subscribe(tr_id, symbol, tr_type="2")
+                        except websockets.ConnectionClosed:
+                            pass
+    
     async def watch_ticker(self, symbol: str) -> AsyncIterator[Ticker]:
         """
         실시간 체결가를 구독합니다.
         
         Args:
             symbol: 종목 코드 (예: "005930")
-            
+        
         Yields:
             Ticker 인스턴스 (실시간 업데이트)
-            
+        
         Example:
             ```python
             async for ticker in ws.watch_ticker("005930"):
                 print(f"{ticker.last:,}원")
             ```
         """
-        if not self._ws:
-            raise RuntimeError("WebSocket이 연결되지 않았습니다")
-        
-        # 구독 요청
-        await self._subscribe(self.TR_ID_TICKER, symbol)
-        
-        # 메시지 수신 및 파싱
-        async for message in self._ws:
-            try:
-                ticker = self._parse_ticker_message(message, symbol)
-                if ticker:
-                    yield ticker
-            except Exception:
-                continue
+        listener = self._listen(self.TR_ID_TICKER, symbol)
+        try:
+            async for message in listener:
+                try:
+                    ticker = self._parse_ticker_message(message, symbol)
+                    if ticker:
+                        yield ticker
+                except Exception:
+                    continue
+        finally:
+            # 구독 해제를 즉시 반영
+            await listener.aclose()
     
     async def watch_order_book(self, symbol: str) -> AsyncIterator[OrderBook]:
         """
@@ -178,22 +348,22 @@ class WebSocketClient:
         
         Args:
             symbol: 종목 코드 (예: "005930")
-            
+        
         Yields:
             OrderBook 인스턴스 (실시간 업데이트)
         """
-        if not self._ws:
-            raise RuntimeError("WebSocket이 연결되지 않았습니다")
-        
-        await self._subscribe(self.TR_ID_ORDERBOOK, symbol)
-        
-        async for message in self._ws:
-            try:
-                orderbook = self._parse_orderbook_message(message, symbol)
-                if orderbook:
-                    yield orderbook
-            except Exception:
-                continue
+        listener = self._listen(self.TR_ID_ORDERBOOK, symbol)
+        try:
+            async for message in listener:
+                try:
+                    orderbook = self._parse_orderbook_message(message, symbol)
+                    if orderbook:
+                        yield orderbook
+                except Exception:
+                    continue
+        finally:
+            # 구독 해제를 즉시 반영
+            await listener.aclose()
     
     def _parse_ticker_message(
         self,
@@ -214,32 +384,29 @@ class WebSocketClient:
             return None
         
         # 파이프(|)로 구분된 메시지 파싱
-        parts = message.split("|")
+        parts = message.split("|", 3)
         if len(parts) < 4:
             return None
         
-        # 데이터 부분 (^ 구분)
-        data_parts = parts[3].split("^")
+        # 데이터 부분 (^ 구분, 사용하는 앞 20개 필드까지만 분리)
+        data_parts = parts[3].split("^", 20)
         if len(data_parts) < 20:
             return None
         
-        now = datetime.now()
+        now, now_ms = now_with_ms()
         
         try:
             last = float(data_parts[2])
-            change = float(data_parts[4])
-            change_pct = float(data_parts[5])
             
             # 전일대비부호 (2:상승, 5:하락)
-            sign = data_parts[3]
-            if sign in ("4", "5"):
-                change = -abs(change)
-                change_pct = -abs(change_pct)
+            mult = _SIGN_MULT.get(data_parts[3], 1.0)
+            change = abs(float(data_parts[4])) * mult
+            change_pct = abs(float(data_parts[5])) * mult
             
-            return Ticker(
+            return Ticker.model_construct(
                 symbol=symbol,
                 name=None,
-                timestamp=int(now.timestamp() * 1000),
+                timestamp=now_ms,
                 datetime=now,
                 open=float(data_parts[7]),
                 high=float(data_parts[8]),
@@ -264,41 +431,34 @@ class WebSocketClient:
         if not message or message.startswith("{"):
             return None
         
-        parts = message.split("|")
+        parts = message.split("|", 3)
         if len(parts) < 4:
             return None
         
-        data_parts = parts[3].split("^")
-        if len(data_parts) < 40:
+        # 호가 10단계 (3~22: 매도호가/잔량, 23~42: 매수호가/잔량 교대)
+        data_parts = parts[3].split("^", 43)
+        if len(data_parts) < 43:
             return None
         
-        now = datetime.now()
+        now, now_ms = now_with_ms()
         
         try:
-            bids: List[OrderBookLevel] = []
-            asks: List[OrderBookLevel] = []
-            
-            # 호가 10단계 파싱 (매도 먼저, 매수 나중)
-            for i in range(10):
-                ask_idx = 3 + i * 2
-                bid_idx = 23 + i * 2
-                
-                ask_price = float(data_parts[ask_idx])
-                ask_qty = int(data_parts[ask_idx + 1])
-                bid_price = float(data_parts[bid_idx])
-                bid_qty = int(data_parts[bid_idx + 1])
-                
-                if ask_price > 0:
-                    asks.append(OrderBookLevel(price=ask_price, amount=ask_qty))
-                if bid_price > 0:
-                    bids.append(OrderBookLevel(price=bid_price, amount=bid_qty))
+            # 가격/잔량 열을 슬라이스로 한 번에 변환 (0인 호가는 제외)
+            ask_prices, ask_amounts = _active_levels(
+                map(float, data_parts[3:23:2]), map(int, data_parts[4:23:2])
+            )
+            bid_prices, bid_amounts = _active_levels(
+                map(float, data_parts[23:43:2]), map(int, data_parts[24:43:2])
+            )
             
-            return OrderBook(
+            return OrderBook.model_construct(
                 symbol=symbol,
-                timestamp=int(now.timestamp() * 1000),
+                timestamp=now_ms,
                 datetime=now,
-                bids=bids,
-                asks=asks,
+                bid_prices=bid_prices,
+                bid_amounts=bid_amounts,
+                ask_prices=ask_prices,
+                ask_amounts=ask_amounts,
             )
         except (ValueError, IndexError):
             return None
@@ -4,9 +4,13 @@ PyKIS 테스트 설정
 pytest 픽스처 및 공통 설정을 정의합니다.
 """
 
-import pytest
+from types import MappingProxyType
+from typing import List, Optional
 from unittest.mock import Mock, patch, MagicMock
 
+import httpx
+import pytest
+
 
 @pytest.fixture
 def mock_auth():
@@ -21,15 +25,106 @@ def mock_auth():
     return auth
 
 
+def _token_transport(
+    access_token: str,
+    expires_in: int,
+    status_code: int,
+    requests: Optional[List[httpx.Request]],
+) -> httpx.MockTransport:
+    """토큰 발급 요청에 응답하고, requests가 주어지면 요청을 기록하는 MockTransport"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/oauth2/tokenP"
+        if requests is not None:
+            requests.append(request)
+        return httpx.Response(
+            status_code,
+            json={"access_token": access_token, "expires_in": expires_in},
+        )
+    
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture
+def auth_manager_factory(tmp_path):
+    """
+    토큰 발급 엔드포인트를 MockTransport로 대체한 AuthManager 생성 함수
+    
+    토큰 파일은 테스트별 임시 디렉터리에 저장됩니다.
+    """
+    from pykis.auth.manager import AuthManager
+    
+    def factory(
+        access_token: str = "new_token",
+        expires_in: int = 86400,
+        status_code: int = 200,
+        requests: Optional[List[httpx.Request]] = None,
+    ):
+        auth = AuthManager(
+            app_key="test_key",
+            app_secret="test_secret",
+            base_url="https://test.com",
+            token_path=str(tmp_path / "token.json"),
+        )
+        auth._client = httpx.Client(
+            base_url=auth.base_url,
+            transport=_token_transport(access_token, expires_in, status_code, requests),
+        )
+        return auth
+    
+    return factory
+
+
+@pytest.fixture
+def async_auth_manager_factory(tmp_path):
+    """
+    토큰 발급 엔드포인트를 MockTransport로 대체한 AsyncAuthManager 생성 함수
+    
+    auth_manager_factory의 비동기 버전입니다.
+    """
+    from pykis.auth.async_manager import AsyncAuthManager
+    
+    def factory(
+        access_token: str = "new_token",
+        expires_in: int = 86400,
+        status_code: int = 200,
+        requests: Optional[List[httpx.Request]] = None,
+    ):
+        auth = AsyncAuthManager(
+            app_key="test_key",
+            app_secret="test_secret",
+            base_url="https://test.com",
+            token_path=str(tmp_path / "token.json"),
+        )
+        auth._client = httpx.AsyncClient(
+            base_url=auth.base_url,
+            transport=_token_transport(access_token, expires_in, status_code, requests),
+        )
+        return auth
+    
+    return factory
+
+
+@pytest.fixture
+def price_response_factory():
+    """현재가 output 필드 일부를 바꾼 응답 생성 함수"""
+    def factory(**overrides):
+        return {
+            **SAMPLE_PRICE_RESPONSE,
+            "output": {**SAMPLE_PRICE_RESPONSE["output"], **overrides},
+        }
+    
+    return factory
+
+
 @pytest.fixture
 def mock_http_client():
     """모의 HTTPClient"""
     return Mock()
 
 
-@pytest.fixture
-def mock_kis():
-    """모의 KIS 클라이언트"""
+@pytest.fixture(scope="session")
+def _shared_kis():
+    """세션 동안 공유하는 모의 KIS 클라이언트"""
     with patch("pykis.client.AuthManager") as mock_auth_class:
         with patch("pykis.client.HTTPClient") as mock_http_class:
             # AuthManager 모킹
@@ -52,16 +147,31 @@ def mock_kis():
                 account_no="12345678-01",
                 is_paper=True,
             )
-            
-            yield kis, mock_http
+    
+    return kis, mock_http
+
+
+@pytest.fixture
+def mock_kis(_shared_kis):
+    """
+    모의 KIS 클라이언트
+    
+    인스턴스는 세션 동안 재사용하고, 테스트마다 모의 HTTP 응답과 시세 캐시를 초기화합니다.
+    클라이언트 속성을 바꿀 때는 monkeypatch를 사용하세요.
+    """
+    kis, mock_http = _shared_kis
+    mock_http.reset_mock(return_value=True, side_effect=True)
+    kis.clear_cache()
+    return kis, mock_http
 
 
 # 테스트용 샘플 응답 데이터
-SAMPLE_PRICE_RESPONSE = {
+# 읽기 전용 (변형 응답은 price_response_factory 사용)
+SAMPLE_PRICE_RESPONSE = MappingProxyType({
     "rt_cd": "0",
     "msg_cd": "0000",
     "msg1": "정상처리",
-    "output": {
+    "output": MappingProxyType({
         "stck_prpr": "57500",
         "stck_oprc": "57000",
         "stck_hgpr": "58000",
@@ -71,8 +181,8 @@ SAMPLE_PRICE_RESPONSE = {
         "prdy_vrss_sign": "2",
         "prdy_ctrt": "0.88",
         "hts_kor_isnm": "삼성전자",
-    }
-}
+    }),
+})
 
 SAMPLE_ORDERBOOK_RESPONSE = {
     "rt_cd": "0",
@@ -118,6 +228,32 @@ SAMPLE_DAILY_PRICE_RESPONSE = {
     ]
 }
 
+SAMPLE_MINUTE_RESPONSE = {
+    "rt_cd": "0",
+    "msg_cd": "0000",
+    "msg1": "정상처리",
+    "output2": [
+        {
+            "stck_bsop_date": "20260114",
+            "stck_cntg_hour": "090500",
+            "stck_oprc": "57000",
+            "stck_hgpr": "57100",
+            "stck_lwpr": "56900",
+            "stck_prpr": "57050",
+            "cntg_vol": "1200",
+        },
+        {
+            "stck_bsop_date": "20260114",
+            "stck_cntg_hour": "090100",
+            "stck_oprc": "56800",
+            "stck_hgpr": "57000",
+            "stck_lwpr": "56700",
+            "stck_prpr": "57000",
+            "cntg_vol": "3000",
+        },
+    ]
+}
+
 SAMPLE_ORDER_RESPONSE = {
     "rt_cd": "0",
     "msg_cd": "0000",
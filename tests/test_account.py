@@ -57,6 +57,37 @@ class TestFetchBalance:
         pos = balance.get_position("000660")
         assert pos is None
     
+    def test_fetch_balance_pnl_array(self, mock_kis):
+        """보유 종목 지표 배열"""
+        pytest.importorskip("numpy")
+        kis, mock_http = mock_kis
+        mock_http.get.return_value = SAMPLE_BALANCE_RESPONSE
+        
+        matrix = kis.fetch_balance().pnl_array()
+        
+        assert matrix.shape == (1, 5)
+        assert matrix[0].tolist() == [100, 55000, 57500, 250000, 4.55]
+    
+    def test_model_copy_reflects_positions(self, mock_kis):
+        """model_copy로 바꾼 보유 종목이 조회/지표에 반영"""
+        pytest.importorskip("numpy")
+        kis, mock_http = mock_kis
+        mock_http.get.return_value = SAMPLE_BALANCE_RESPONSE
+        
+        balance = kis.fetch_balance()
+        balance.get_position("005930")
+        index = balance._position_index
+        balance.get_position("000660")
+        assert balance._position_index is index  # 같은 positions면 인덱스 재사용
+        balance.pnl_array()
+        
+        hynix = balance.positions[0].model_copy(update={"symbol": "000660", "amount": 3})
+        updated = balance.model_copy(update={"positions": [hynix]})
+        
+        assert updated.get_position("005930") is None
+        assert updated.get_position("000660").amount == 3
+        assert updated.pnl_array()[0, 0] == 3
+    
     def test_fetch_balance_empty(self, mock_kis):
         """보유 종목 없음"""
         kis, mock_http = mock_kis
@@ -78,3 +109,17 @@ class TestFetchBalance:
         
         assert len(balance.positions) == 0
         assert balance.total == 50000000
+    
+    def test_fetch_balance_reuses_params(self, mock_kis):
+        """잔고 조회 파라미터 재사용"""
+        kis, mock_http = mock_kis
+        mock_http.get.return_value = SAMPLE_BALANCE_RESPONSE
+        
+        kis.fetch_balance()
+        kis.fetch_balance()
+        
+        first, second = (c.kwargs["params"] for c in mock_http.get.call_args_list)
+        assert first is second
+        assert first["CANO"] == "12345678"
+        assert first["ACNT_PRDT_CD"] == "01"
+        assert len(first) == 11
@@ -2,11 +2,15 @@
 비동기 API 테스트
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from conftest import (
     SAMPLE_PRICE_RESPONSE,
     SAMPLE_ORDERBOOK_RESPONSE,
+    SAMPLE_DAILY_PRICE_RESPONSE,
+    SAMPLE_MINUTE_RESPONSE,
     SAMPLE_ORDER_RESPONSE,
     SAMPLE_BALANCE_RESPONSE,
 )
@@ -24,12 +28,14 @@ def mock_async_kis():
                 "appkey": "mock_app_key",
                 "appsecret": "mock_app_secret",
             })
+            mock_auth.close = AsyncMock()
             mock_auth_class.return_value = mock_auth
             
             # AsyncHTTPClient 모킹
             mock_http = MagicMock()
             mock_http.get = AsyncMock()
             mock_http.post = AsyncMock()
+            mock_http.batch = AsyncMock()
             mock_http.close = AsyncMock()
             mock_http_class.return_value = mock_http
             
@@ -60,6 +66,46 @@ class TestAsyncFetchTicker:
         assert ticker.last == 57500
 
 
+class TestAsyncFetchTickers:
+    """비동기 fetch_tickers 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_fetch_tickers(self, mock_async_kis):
+        """여러 종목 동시 조회"""
+        kis, mock_http = mock_async_kis
+        mock_http.get.return_value = SAMPLE_PRICE_RESPONSE
+        
+        tickers = await kis.fetch_tickers(["005930", "000660"])
+        
+        assert list(tickers) == ["005930", "000660"]
+        assert tickers["000660"].symbol == "000660"
+        assert mock_http.get.call_count == 2
+
+
+class TestAsyncQuoteTTLCache:
+    """비동기 최근 시세 메모리 캐시 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_fetch_ticker_single_request(self, mock_async_kis):
+        """동시에 들어온 같은 종목 조회는 한 번만 요청"""
+        kis, mock_http = mock_async_kis
+        
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return SAMPLE_PRICE_RESPONSE
+        
+        mock_http.get.side_effect = slow_get
+        
+        tickers = await asyncio.gather(*(kis.fetch_ticker("005930") for _ in range(5)))
+        
+        assert mock_http.get.call_count == 1
+        assert all(t.last == 57500 for t in tickers)
+        
+        # TTL 이내 재조회도 캐시 사용
+        await kis.fetch_ticker("005930")
+        assert mock_http.get.call_count == 1
+
+
 class TestAsyncFetchOrderBook:
     """비동기 fetch_order_book 테스트"""
     
@@ -76,6 +122,113 @@ class TestAsyncFetchOrderBook:
         assert len(ob.bids) == 3
 
 
+class TestAsyncFetchSnapshot:
+    """비동기 fetch_snapshot 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_fetch_snapshot_success(self, mock_async_kis):
+        """비동기 현재가/호가/OHLCV 동시 조회 성공"""
+        kis, mock_http = mock_async_kis
+        mock_http.batch.return_value = [
+            SAMPLE_PRICE_RESPONSE,
+            SAMPLE_ORDERBOOK_RESPONSE,
+            SAMPLE_DAILY_PRICE_RESPONSE,
+        ]
+        
+        ticker, ob, ohlcv = await kis.fetch_snapshot("005930")
+        
+        assert ticker.last == 57500
+        assert len(ob.bids) == 3
+        assert len(ohlcv) == 2
+
+
+class TestAsyncFetchOHLCVRange:
+    """비동기 fetch_ohlcv_range 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_fetch_ohlcv_range_merges_windows(self, mock_async_kis):
+        """구간별 동시 요청 후 중복 제거 병합"""
+        kis, mock_http = mock_async_kis
+        mock_http.batch.side_effect = lambda requests, limit: [SAMPLE_DAILY_PRICE_RESPONSE] * len(requests)
+        
+        ohlcv = await kis.fetch_ohlcv_range("005930", "20250101", "20260131")
+        
+        assert mock_http.batch.call_count == 1
+        assert len(mock_http.batch.call_args[0][0]) == 3
+        assert len(ohlcv) == 2
+        assert ohlcv[0].datetime < ohlcv[1].datetime
+
+
+class TestAsyncFetchMinuteOHLCV:
+    """비동기 fetch_minute_ohlcv 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_fetch_minute_ohlcv_merges_windows(self, mock_async_kis):
+        """시간대별 동시 요청 후 중복 제거 병합"""
+        kis, mock_http = mock_async_kis
+        mock_http.batch.side_effect = lambda requests: [SAMPLE_MINUTE_RESPONSE] * len(requests)
+        
+        ohlcv = await kis.fetch_minute_ohlcv("005930")
+        
+        assert mock_http.batch.call_count == 1
+        assert [o.datetime.strftime("%H%M") for o in ohlcv] == ["0901", "0905"]
+
+
+class TestAsyncFetchMinuteOHLCVRange:
+    """비동기 fetch_minute_ohlcv_range 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_paper_not_supported(self, mock_async_kis):
+        """모의투자에서는 ValueError"""
+        kis, _ = mock_async_kis
+        
+        with pytest.raises(ValueError):
+            await kis.fetch_minute_ohlcv_range("005930", "20260114")
+    
+    @pytest.mark.asyncio
+    async def test_merges_windows(self, mock_async_kis, monkeypatch):
+        """날짜 x 시간대 구간을 한 번에 요청하고 오류 구간은 건너뜀"""
+        from pykis.exceptions import APIError
+        
+        kis, mock_http = mock_async_kis
+        monkeypatch.setattr(kis._quote, "_is_paper", False)
+        window = {
+            "rt_cd": "0",
+            "output2": [
+                {"stck_bsop_date": "20260114", "stck_cntg_hour": "090100",
+                 "stck_oprc": "57000", "stck_hgpr": "57100", "stck_lwpr": "56900",
+                 "stck_prpr": "57050", "cntg_vol": "1200"},
+                {"stck_bsop_date": "20260114", "stck_cntg_hour": "090000",
+                 "stck_oprc": "56800", "stck_hgpr": "57000", "stck_lwpr": "56700",
+                 "stck_prpr": "57000", "cntg_vol": "3000"},
+            ],
+        }
+        mock_http.batch.side_effect = lambda requests, return_exceptions, limit: (
+            [APIError("휴장일")] + [window] * (len(requests) - 1)
+        )
+        
+        ohlcv = await kis.fetch_minute_ohlcv_range("005930", "20260113", "20260114")
+        
+        assert len(mock_http.batch.call_args[0][0]) == 8
+        assert mock_http.batch.call_args.kwargs["limit"] == kis._quote.MAX_CONCURRENT_REQUESTS
+        assert [o.datetime.strftime("%H%M") for o in ohlcv] == ["0900", "0901"]
+        assert ohlcv[1].volume == 1200
+    
+    @pytest.mark.asyncio
+    async def test_rate_limited_window_raises(self, mock_async_kis, monkeypatch):
+        """Rate Limit으로 실패한 구간은 건너뛰지 않고 예외 발생"""
+        from pykis.exceptions import RateLimitError
+        
+        kis, mock_http = mock_async_kis
+        monkeypatch.setattr(kis._quote, "_is_paper", False)
+        mock_http.batch.side_effect = lambda requests, return_exceptions, limit: (
+            [RateLimitError("초당 거래건수 초과")] + [SAMPLE_MINUTE_RESPONSE] * (len(requests) - 1)
+        )
+        
+        with pytest.raises(RateLimitError):
+            await kis.fetch_minute_ohlcv_range("005930", "20260113", "20260114")
+
+
 class TestAsyncCreateOrder:
     """비동기 주문 생성 테스트"""
     
@@ -124,3 +277,4 @@ class TestAsyncContextManager:
         
         # close가 호출되었는지 확인
         mock_http.close.assert_called_once()
+        kis._auth.close.assert_called_once()
@@ -2,91 +2,213 @@
 인증 시스템 테스트
 """
 
-import pytest
+import asyncio
 import json
 from datetime import datetime, timedelta
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from pykis.auth import store
+from pykis.exceptions import AuthenticationError
 
 
 class TestAuthManager:
     """AuthManager 테스트"""
     
-    def test_token_expired_when_no_token(self):
+    def test_token_expired_when_no_token(self, auth_manager_factory):
         """토큰이 없으면 만료 상태"""
-        with patch("pykis.auth.manager.httpx.Client"):
-            from pykis.auth.manager import AuthManager
-            
-            auth = AuthManager(
-                app_key="test_key",
-                app_secret="test_secret",
-                base_url="https://test.com",
-                token_path="/tmp/test_token.json",
-            )
-            
-            # 토큰이 없으면 만료 상태
-            assert auth._is_expired() is True
-    
-    def test_token_refresh(self):
+        auth = auth_manager_factory()
+        
+        # 토큰이 없으면 만료 상태
+        assert auth._is_expired() is True
+    
+    def test_token_refresh(self, auth_manager_factory):
         """토큰 갱신"""
-        with patch("pykis.auth.manager.httpx.Client") as mock_client:
-            # HTTP 응답 모킹
-            mock_response = Mock()
-            mock_response.json.return_value = {
-                "access_token": "new_token",
-                "expires_in": 86400,
-            }
-            mock_response.raise_for_status = Mock()
-            
-            mock_client_instance = MagicMock()
-            mock_client_instance.__enter__.return_value.post.return_value = mock_response
-            mock_client.return_value = mock_client_instance
-            
-            from pykis.auth.manager import AuthManager
-            
-            auth = AuthManager(
-                app_key="test_key",
-                app_secret="test_secret",
-                base_url="https://test.com",
-                token_path="/tmp/test_token_refresh.json",
-            )
-            
-            # 토큰 갱신
-            auth._refresh()
-            
-            assert auth._token == "new_token"
-            assert auth._expires is not None
+        auth = auth_manager_factory(access_token="new_token")
+        
+        # 토큰 갱신
+        auth._refresh()
+        
+        assert auth._token == "new_token"
+        assert auth._expires is not None
     
-    def test_get_headers(self):
+    def test_get_headers(self, auth_manager_factory):
         """헤더 생성"""
-        with patch("pykis.auth.manager.httpx.Client") as mock_client:
-            # HTTP 응답 모킹
-            mock_response = Mock()
-            mock_response.json.return_value = {
-                "access_token": "test_token",
-                "expires_in": 86400,
-            }
-            mock_response.raise_for_status = Mock()
-            
-            mock_client_instance = MagicMock()
-            mock_client_instance.__enter__.return_value.post.return_value = mock_response
-            mock_client.return_value = mock_client_instance
-            
-            from pykis.auth.manager import AuthManager
-            
-            auth = AuthManager(
-                app_key="test_key",
-                app_secret="test_secret",
-                base_url="https://test.com",
-                token_path="/tmp/test_token_headers.json",
-            )
-            
-            headers = auth.get_headers()
-            
-            assert "authorization" in headers
-            assert headers["authorization"] == "Bearer test_token"
-            assert headers["appkey"] == "test_key"
-            assert headers["appsecret"] == "test_secret"
+        auth = auth_manager_factory(access_token="test_token")
+        
+        headers = auth.get_headers()
+        
+        assert "authorization" in headers
+        assert headers["authorization"] == "Bearer test_token"
+        assert headers["appkey"] == "test_key"
+        assert headers["appsecret"] == "test_secret"
+    
+    def test_saved_token_reused_by_new_instance(self, auth_manager_factory):
+        """저장된 토큰은 새 인스턴스에서 발급 요청 없이 재사용"""
+        auth_manager_factory(access_token="saved_token")._refresh()
+        
+        requests = []
+        auth = auth_manager_factory(access_token="other_token", requests=requests)
+        headers = auth.get_headers()
+        
+        assert headers["authorization"] == "Bearer saved_token"
+        assert requests == []
+    
+    def test_refresh_http_error(self, auth_manager_factory):
+        """토큰 발급 HTTP 오류는 AuthenticationError로 변환"""
+        auth = auth_manager_factory(status_code=403)
+        
+        with pytest.raises(AuthenticationError):
+            auth._refresh()
+        assert auth._token is None
+    
+    def test_refresh_reuses_client(self, auth_manager_factory):
+        """토큰 갱신 시 같은 클라이언트 재사용"""
+        requests = []
+        auth = auth_manager_factory(requests=requests)
+        client = auth._client
+        
+        auth._refresh()
+        auth._refresh()
+        
+        assert auth._client is client
+        assert len(requests) == 2
+        
+        auth.close()
+        assert client.is_closed
+        assert auth._client is None
+    
+    def test_get_tr_headers_cached_until_refresh(self, auth_manager_factory):
+        """TR별 헤더는 재사용하고 토큰 갱신 시 다시 생성"""
+        auth = auth_manager_factory(access_token="new_token")
+        auth._token = "cached_token"
+        auth._expires = datetime.now() + timedelta(days=1)
+        
+        first = auth.get_tr_headers("FHKST01010100")
+        assert first["tr_id"] == "FHKST01010100"
+        assert auth.get_tr_headers("FHKST01010100") is first
+        assert "tr_id" not in auth.get_headers()
+        
+        auth._refresh()
+        
+        assert auth.get_tr_headers("FHKST01010100")["authorization"] == "Bearer new_token"
+
+
+class TestAsyncAuthManager:
+    """AsyncAuthManager 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_refresh_reuses_client(self, async_auth_manager_factory):
+        """토큰 갱신 시 같은 클라이언트 재사용"""
+        requests = []
+        auth = async_auth_manager_factory(requests=requests)
+        client = auth._client
+        
+        await auth._refresh()
+        await auth._refresh()
+        
+        assert auth._token == "new_token"
+        assert auth._client is client
+        assert len(requests) == 2
+        
+        await auth.close()
+        assert client.is_closed
+        assert auth._client is None
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_get_headers_refresh_once(self, async_auth_manager_factory):
+        """동시 호출 시 토큰 발급은 한 번만"""
+        auth = async_auth_manager_factory()
+        
+        async def fake_refresh():
+            await asyncio.sleep(0.01)
+            auth._token = "new_token"
+            auth._expires = datetime.now() + timedelta(days=1)
+        
+        with patch.object(auth, "_refresh", side_effect=fake_refresh) as refresh:
+            headers = await asyncio.gather(*(auth.get_headers() for _ in range(5)))
+        
+        assert refresh.call_count == 1
+        assert all(h["authorization"] == "Bearer new_token" for h in headers)
+    
+    @pytest.mark.asyncio
+    async def test_get_headers_cached_per_token(self, async_auth_manager_factory):
+        """헤더는 토큰별로 한 번 생성되고 호출마다 사본 반환"""
+        auth = async_auth_manager_factory()
+        auth._token = "cached_token"
+        auth._expires = datetime.now() + timedelta(days=1)
+        
+        first = await auth.get_headers()
+        first["tr_id"] = "FHKST01010100"
+        second = await auth.get_headers()
+        
+        assert second["authorization"] == "Bearer cached_token"
+        assert "tr_id" not in second
+        assert first is not second
+    
+    @pytest.mark.asyncio
+    async def test_get_tr_headers_cached_until_refresh(self, async_auth_manager_factory):
+        """TR별 헤더는 재사용하고 토큰 갱신 시 다시 생성"""
+        auth = async_auth_manager_factory()
+        auth._token = "cached_token"
+        auth._expires = datetime.now() + timedelta(days=1)
+        
+        first = await auth.get_tr_headers("FHKST01010100")
+        assert first["tr_id"] == "FHKST01010100"
+        assert await auth.get_tr_headers("FHKST01010100") is first
+        
+        await auth._refresh()
+        
+        refreshed = await auth.get_tr_headers("FHKST01010100")
+        assert refreshed["authorization"] == "Bearer new_token"
+
+
+class TestTokenStore:
+    """토큰 저장소 테스트"""
+    
+    def test_save_and_load(self, tmp_path):
+        """저장한 토큰은 파일과 메모리 캐시에 기록"""
+        path = tmp_path / "token.json"
+        expires = datetime.now() + timedelta(days=1)
+        store.save_token(path, "saved_token", expires)
+        
+        assert json.loads(path.read_text(encoding="utf-8"))["token"] == "saved_token"
+        assert [p.name for p in tmp_path.iterdir()] == ["token.json"]
+        
+        # 파일이 지워져도 같은 프로세스에서는 메모리 캐시 사용
+        path.unlink()
+        assert store.load_token(path) == ("saved_token", expires)
+    
+    def test_save_failure_ignored(self, tmp_path):
+        """파일 저장 실패는 예외 없이 메모리 캐시만 갱신"""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("", encoding="utf-8")
+        path = blocker / "token.json"  # 상위 경로가 파일이라 저장 불가
+        expires = datetime.now() + timedelta(days=1)
+        
+        store.save_token(path, "unsaved_token", expires)
+        
+        assert not path.exists()
+        assert store.load_token(path) == ("unsaved_token", expires)
+    
+    def test_expired_token_ignored(self, tmp_path):
+        """만료된 토큰 파일은 무시"""
+        path = tmp_path / "token.json"
+        path.write_text(json.dumps({
+            "token": "old_token",
+            "expires_at": (datetime.now() - timedelta(hours=1)).isoformat(),
+        }), encoding="utf-8")
+        
+        assert store.load_token(path) is None
+    
+    def test_default_path_per_environment(self):
+        """같은 App Key라도 실전/모의 토큰 파일은 분리"""
+        from pykis.auth.store import default_token_path
+        from pykis.constants import BaseURL
+        
+        assert default_token_path("key", BaseURL.PAPER) != default_token_path("key", BaseURL.PRODUCTION)
+        assert default_token_path("key", BaseURL.PAPER) == default_token_path("key", BaseURL.PAPER)
 
 
 class TestExceptions:
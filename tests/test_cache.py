@@ -0,0 +1,123 @@
+"""
+응답 캐시 테스트
+"""
+
+import os
+import time
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import httpx
+
+from pykis.utils.cache import KST, ResponseCache, TTLCache
+from pykis.utils.http import HTTPClient
+
+
+PAST = {"FID_INPUT_ISCD": "005930", "FID_INPUT_DATE_1": "20200101", "FID_INPUT_DATE_2": "20200131"}
+
+
+class TestResponseCache:
+    """ResponseCache 테스트"""
+    
+    def test_is_cacheable(self):
+        """오늘 이전 기간만 캐시"""
+        today = datetime.now(KST).strftime("%Y%m%d")
+        
+        assert ResponseCache.is_cacheable(PAST)
+        assert not ResponseCache.is_cacheable({"FID_INPUT_DATE_1": "20200101", "FID_INPUT_DATE_2": today})
+        assert not ResponseCache.is_cacheable({"FID_INPUT_DATE_1": "", "FID_INPUT_DATE_2": ""})
+        assert not ResponseCache.is_cacheable({"FID_INPUT_ISCD": "005930"})
+        assert not ResponseCache.is_cacheable(None)
+    
+    def test_set_get_clear(self, tmp_path):
+        """저장 후 조회, 삭제"""
+        cache = ResponseCache(str(tmp_path / "cache"))
+        data = {"rt_cd": "0", "output2": [{"stck_clpr": "57000"}]}
+        
+        assert cache.get("url", "/ep", "TR", PAST) is None
+        cache.set("url", "/ep", "TR", PAST, data)
+        assert cache.get("url", "/ep", "TR", PAST) == data
+        assert cache.get("url", "/ep", "OTHER", PAST) is None
+        
+        cache.clear()
+        assert cache.get("url", "/ep", "TR", PAST) is None
+    
+    def test_adjusted_price_expires(self, tmp_path):
+        """수정주가 응답은 ADJUSTED_MAX_AGE 이후 만료"""
+        cache = ResponseCache(str(tmp_path / "cache"))
+        data = {"rt_cd": "0", "output2": []}
+        adjusted = {**PAST, "FID_ORG_ADJ_PRC": "0"}
+        original = {**PAST, "FID_ORG_ADJ_PRC": "1"}
+        cache.set("url", "/ep", "TR", adjusted, data)
+        cache.set("url", "/ep", "TR", original, data)
+        assert cache.get("url", "/ep", "TR", adjusted) == data
+        
+        stale = time.time() - ResponseCache.ADJUSTED_MAX_AGE - 60
+        for path in (tmp_path / "cache").iterdir():
+            os.utime(path, (stale, stale))
+        
+        assert cache.get("url", "/ep", "TR", adjusted) is None
+        assert cache.get("url", "/ep", "TR", original) == data
+
+
+class TestHTTPClientCache:
+    """HTTPClient 캐시 연동 테스트"""
+    
+    def _client(self, tmp_path, calls):
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"rt_cd": "0", "output2": []})
+        
+        auth = MagicMock()
+        auth.get_tr_headers.return_value = {}
+        http = HTTPClient("https://test", auth, cache=ResponseCache(str(tmp_path)))
+        http._client = httpx.Client(
+            base_url="https://test",
+            transport=httpx.MockTransport(handler),
+        )
+        return http
+    
+    def test_past_request_hits_network_once(self, tmp_path):
+        """과거 기간 요청은 두 번째부터 캐시 사용"""
+        calls = []
+        http = self._client(tmp_path, calls)
+        
+        first = http.get("/ep", "TR", params=PAST)
+        second = http.get("/ep", "TR", params=PAST)
+        
+        assert first == second
+        assert len(calls) == 1
+    
+    def test_recent_request_not_cached(self, tmp_path):
+        """최근 조회는 항상 요청"""
+        calls = []
+        http = self._client(tmp_path, calls)
+        tomorrow = (datetime.now(KST) + timedelta(days=1)).strftime("%Y%m%d")
+        params = {"FID_INPUT_DATE_1": "20200101", "FID_INPUT_DATE_2": tomorrow}
+        
+        http.get("/ep", "TR", params=params)
+        http.get("/ep", "TR", params=params)
+        
+        assert len(calls) == 2
+
+
+class TestTTLCache:
+    """TTLCache 테스트"""
+    
+    def test_expires(self):
+        """TTL이 지나면 None"""
+        cache = TTLCache()
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=0)
+        
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+    
+    def test_maxsize_evicts_oldest(self):
+        """최대 크기 초과 시 가장 오래된 항목 제거"""
+        cache = TTLCache(maxsize=2)
+        for key in ("a", "b", "c"):
+            cache.set(key, key, ttl=60)
+        
+        assert cache.get("a") is None
+        assert cache.get("c") == "c"
@@ -4,48 +4,92 @@
 
 import pytest
 from pykis import OrderSide, OrderType, OrderStatus
+from pykis.constants import TrID, resolve_tr
 from conftest import SAMPLE_ORDER_RESPONSE
 
 
+# 결과 없는 응답 (취소 / 미체결 없음)
+EMPTY_OUTPUT_RESPONSE = {"rt_cd": "0", "output": {}}
+EMPTY_LIST_RESPONSE = {"rt_cd": "0", "output": []}
+
+# 미체결 주문 응답
+OPEN_ORDERS_RESPONSE = {
+    "rt_cd": "0",
+    "output": [
+        {
+            "odno": "0000123456",
+            "pdno": "005930",
+            "sll_buy_dvsn_cd": "02",  # 매수
+            "ord_qty": "10",
+            "ord_unpr": "57000",
+            "tot_ccld_qty": "0",
+            "psbl_qty": "10",
+        }
+    ]
+}
+
+# 체결/잔여 수량 필드가 빠진 미체결 응답
+OPEN_ORDERS_MISSING_FIELDS_RESPONSE = {
+    "rt_cd": "0",
+    "output": [
+        {
+            "odno": "0000123457",
+            "pdno": "005930",
+            "sll_buy_dvsn_cd": "01",  # 매도
+            "ord_qty": "5",
+            "ord_unpr": "57000.00",
+        }
+    ]
+}
+
+
 class TestCreateOrder:
     """주문 생성 테스트"""
     
-    def test_create_limit_order_buy(self, mock_kis):
-        """지정가 매수 주문"""
+    @pytest.mark.parametrize(
+        "side, amount, price, expected_side, expected_type",
+        [
+            ("buy", 10, 57000, OrderSide.BUY, OrderType.LIMIT),    # 지정가 매수
+            ("sell", 5, 58000, OrderSide.SELL, OrderType.LIMIT),   # 지정가 매도
+            ("buy", 10, None, OrderSide.BUY, OrderType.MARKET),    # 시장가 매수
+        ],
+    )
+    def test_create_order(self, mock_kis, side, amount, price, expected_side, expected_type):
+        """지정가/시장가 주문 생성"""
         kis, mock_http = mock_kis
         mock_http.post.return_value = SAMPLE_ORDER_RESPONSE
         
-        order = kis.create_limit_order("005930", "buy", 10, 57000)
+        if price is None:
+            order = kis.create_market_order("005930", side, amount)
+        else:
+            order = kis.create_limit_order("005930", side, amount, price)
         
         assert order.id == "0000123456"
         assert order.symbol == "005930"
-        assert order.side == OrderSide.BUY
-        assert order.type == OrderType.LIMIT
+        assert order.side == expected_side
+        assert order.type == expected_type
         assert order.status == OrderStatus.OPEN
-        assert order.amount == 10
-        assert order.price == 57000
-        assert order.remaining == 10
+        assert order.amount == amount
+        assert order.price == price
+        assert order.remaining == amount
     
-    def test_create_limit_order_sell(self, mock_kis):
-        """지정가 매도 주문"""
+    def test_create_order_request_body(self, mock_kis):
+        """방향별 TR_ID와 주문구분, 계좌 필드로 요청"""
         kis, mock_http = mock_kis
         mock_http.post.return_value = SAMPLE_ORDER_RESPONSE
         
-        order = kis.create_limit_order("005930", "sell", 5, 58000)
+        kis.create_market_order("005930", "sell", 3)
         
-        assert order.side == OrderSide.SELL
-        assert order.amount == 5
-        assert order.price == 58000
-    
-    def test_create_market_order(self, mock_kis):
-        """시장가 주문"""
-        kis, mock_http = mock_kis
-        mock_http.post.return_value = SAMPLE_ORDER_RESPONSE
-        
-        order = kis.create_market_order("005930", "buy", 10)
-        
-        assert order.type == OrderType.MARKET
-        assert order.price is None
+        args, kwargs = mock_http.post.call_args
+        assert args[1] == TrID.SELL_PAPER
+        assert kwargs["json"] == {
+            "CANO": "12345678",
+            "ACNT_PRDT_CD": "01",
+            "PDNO": "005930",
+            "ORD_DVSN": "01",
+            "ORD_QTY": "3",
+            "ORD_UNPR": "0",
+        }
 
 
 class TestCancelOrder:
@@ -54,7 +98,7 @@ class TestCancelOrder:
     def test_cancel_order_success(self, mock_kis):
         """주문 취소 성공"""
         kis, mock_http = mock_kis
-        mock_http.post.return_value = {"rt_cd": "0", "output": {}}
+        mock_http.post.return_value = EMPTY_OUTPUT_RESPONSE
         
         result = kis.cancel_order("0000123456", "005930")
         
@@ -68,7 +112,7 @@ class TestFetchOpenOrders:
     def test_fetch_open_orders_empty(self, mock_kis):
         """미체결 없음"""
         kis, mock_http = mock_kis
-        mock_http.get.return_value = {"rt_cd": "0", "output": []}
+        mock_http.get.return_value = EMPTY_LIST_RESPONSE
         
         orders = kis.fetch_open_orders()
         
@@ -77,20 +121,7 @@ class TestFetchOpenOrders:
     def test_fetch_open_orders_with_items(self, mock_kis):
         """미체결 있음"""
         kis, mock_http = mock_kis
-        mock_http.get.return_value = {
-            "rt_cd": "0",
-            "output": [
-                {
-                    "odno": "0000123456",
-                    "pdno": "005930",
-                    "sll_buy_dvsn_cd": "02",  # 매수
-                    "ord_qty": "10",
-                    "ord_unpr": "57000",
-                    "tot_ccld_qty": "0",
-                    "psbl_qty": "10",
-                }
-            ]
-        }
+        mock_http.get.return_value = OPEN_ORDERS_RESPONSE
         
         orders = kis.fetch_open_orders()
         
@@ -98,3 +129,37 @@ class TestFetchOpenOrders:
         assert orders[0].id == "0000123456"
         assert orders[0].side == OrderSide.BUY
         assert orders[0].remaining == 10
+    
+    def test_fetch_open_orders_missing_fields(self, mock_kis):
+        """누락 필드는 기본값 적용"""
+        kis, mock_http = mock_kis
+        mock_http.get.return_value = OPEN_ORDERS_MISSING_FIELDS_RESPONSE
+        
+        orders = kis.fetch_open_orders()
+        
+        assert orders[0].side == OrderSide.SELL
+        assert orders[0].price == 57000
+        assert orders[0].filled == 0
+        assert orders[0].remaining == 0
+
+
+class TestResolveTr:
+    """resolve_tr 테스트"""
+    
+    def test_resolve_tr(self):
+        """실전/모의 TR_ID 선택"""
+        assert resolve_tr("buy", False) == TrID.BUY
+        assert resolve_tr("buy", True) == TrID.BUY_PAPER
+        assert resolve_tr("balance", True) == TrID.BALANCE_PAPER
+        
+        with pytest.raises(KeyError):
+            resolve_tr("unknown", False)
+    
+    def test_to_order_side(self):
+        """주문 방향 변환"""
+        from pykis.constants import to_order_side
+        
+        assert to_order_side("buy") is OrderSide.BUY
+        assert to_order_side(OrderSide.SELL) is OrderSide.SELL
+        with pytest.raises(ValueError):
+            to_order_side("hold")
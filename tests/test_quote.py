@@ -7,8 +7,11 @@ from conftest import (
     SAMPLE_PRICE_RESPONSE,
     SAMPLE_ORDERBOOK_RESPONSE,
     SAMPLE_DAILY_PRICE_RESPONSE,
+    SAMPLE_MINUTE_RESPONSE,
 )
 
+from pykis.models import OrderBook
+
 
 class TestFetchTicker:
     """fetch_ticker 테스트"""
@@ -30,19 +33,16 @@ class TestFetchTicker:
         assert ticker.change == 500
         assert ticker.change_percent == 0.88
     
-    def test_fetch_ticker_falling(self, mock_kis):
+    def test_fetch_ticker_falling(self, mock_kis, price_response_factory):
         """하락 종목 조회"""
         kis, mock_http = mock_kis
         
         # 하락 응답 (prdy_vrss_sign: "5")
-        response = {**SAMPLE_PRICE_RESPONSE}
-        response["output"] = {
-            **SAMPLE_PRICE_RESPONSE["output"],
-            "prdy_vrss": "500",
-            "prdy_vrss_sign": "5",
-            "prdy_ctrt": "0.88",
-        }
-        mock_http.get.return_value = response
+        mock_http.get.return_value = price_response_factory(
+            prdy_vrss="500",
+            prdy_vrss_sign="5",
+            prdy_ctrt="0.88",
+        )
         
         ticker = kis.fetch_ticker("005930")
         
@@ -51,6 +51,96 @@ class TestFetchTicker:
         assert ticker.change_percent == -0.88
 
 
+class TestFetchTickers:
+    """fetch_tickers 테스트"""
+    
+    def test_fetch_tickers(self, mock_kis):
+        """여러 종목을 한 번의 batch로 조회"""
+        kis, mock_http = mock_kis
+        mock_http.batch.return_value = [SAMPLE_PRICE_RESPONSE, SAMPLE_PRICE_RESPONSE]
+        
+        tickers = kis.fetch_tickers(["005930", "000660"])
+        
+        assert list(tickers) == ["005930", "000660"]
+        assert tickers["000660"].symbol == "000660"
+        assert len(mock_http.batch.call_args[0][0]) == 2
+    
+    def test_fetch_tickers_shares_ttl_cache(self, mock_kis):
+        """fetch_ticker와 같은 메모리 캐시를 사용"""
+        kis, mock_http = mock_kis
+        mock_http.get.return_value = SAMPLE_PRICE_RESPONSE
+        mock_http.batch.side_effect = lambda requests: [SAMPLE_PRICE_RESPONSE] * len(requests)
+        
+        kis.fetch_ticker("005930")
+        kis.fetch_tickers(["005930", "000660"])
+        
+        # 캐시에 없는 종목만 요청
+        assert [params["FID_INPUT_ISCD"] for _, _, params in mock_http.batch.call_args[0][0]] == ["000660"]
+        
+        # 방금 조회한 종목은 fetch_ticker도 캐시 사용
+        kis.fetch_ticker("000660")
+        assert mock_http.get.call_count == 1
+
+
+class TestQuoteTTLCache:
+    """최근 시세 메모리 캐시 테스트"""
+    
+    def test_fetch_ticker_reuses_response(self, mock_kis):
+        """TTL 이내 같은 종목 조회는 한 번만 요청"""
+        kis, mock_http = mock_kis
+        mock_http.get.return_value = SAMPLE_PRICE_RESPONSE
+        
+        first = kis.fetch_ticker("005930")
+        second = kis.fetch_ticker("005930")
+        
+        assert mock_http.get.call_count == 1
+        assert first.last == second.last
+    
+    def test_fetch_ohlcv_shares_response_across_limits(self, mock_kis):
+        """limit만 다른 OHLCV 조회는 응답 재사용"""
+        kis, mock_http = mock_kis
+        mock_http.get.return_value = SAMPLE_DAILY_PRICE_RESPONSE
+        
+        assert len(kis.fetch_ohlcv("005930", limit=1)) == 1
+        assert len(kis.fetch_ohlcv("005930")) == 2
+        assert mock_http.get.call_count == 1
+    
+    def test_symbol_params_reused(self, mock_kis, monkeypatch):
+        """같은 종목 요청 파라미터는 재사용"""
+        kis, mock_http = mock_kis
+        mock_http.get.return_value = SAMPLE_PRICE_RESPONSE
+        monkeypatch.setattr(kis._quote, "TICKER_TTL", 0)
+        
+        kis.fetch_ticker("005930")
+        kis.fetch_ticker("005930")
+        
+        first, second = (c.kwargs["params"] for c in mock_http.get.call_args_list)
+        assert first is second
+        assert first == {"FID_COND_MRKT_DIV_CODE": "J", "FID_INPUT_ISCD": "005930"}
+    
+    def test_clear_cache_drops_ttl_entries(self, mock_kis):
+        """clear_cache 후에는 다시 요청"""
+        kis, mock_http = mock_kis
+        mock_http.get.return_value = SAMPLE_PRICE_RESPONSE
+        
+        kis.fetch_ticker("005930")
+        kis.clear_cache()
+        kis.fetch_ticker("005930")
+        
+        assert mock_http.get.call_count == 2
+    
+    def test_ttl_zero_disables_cache(self, mock_kis, monkeypatch):
+        """TTL이 0이면 매번 요청"""
+        kis, mock_http = mock_kis
+        mock_http.get.return_value = SAMPLE_PRICE_RESPONSE
+        monkeypatch.setattr(kis._quote, "TICKER_TTL", 0)
+        
+        kis.fetch_ticker("005930")
+        kis.fetch_ticker("005930")
+        
+        assert mock_http.get.call_count == 2
+
+
 class TestFetchOrderBook:
     """fetch_order_book 테스트"""
     
@@ -72,32 +162,237 @@ class TestFetchOrderBook:
         # 매수호가 확인
         assert ob.bids[0].price == 57400
         assert ob.bids[0].amount == 50000
+    
+    def test_fetch_order_book_parallel_levels(self, mock_kis):
+        """호가 가격/잔량 병렬 튜플"""
+        kis, mock_http = mock_kis
+        mock_http.get.return_value = SAMPLE_ORDERBOOK_RESPONSE
+        
+        ob = kis.fetch_order_book("005930")
+        
+        assert ob.ask_prices[0] == 57500
+        assert ob.bid_amounts[0] == 50000
+        assert len(ob.bid_prices) == len(ob.bid_amounts) == 3
+        assert [level.price for level in ob.asks] == list(ob.ask_prices)
+        
+        # model_copy로 바꾼 튜플이 bids/asks에 반영
+        ob.bids
+        updated = ob.model_copy(update={"bid_prices": (57300.0,), "bid_amounts": (100,)})
+        assert [(level.price, level.amount) for level in updated.bids] == [(57300.0, 100)]
+    
+    def test_raw_response_opt_in(self):
+        """원본 응답은 include_raw=True일 때만 보관"""
+        assert OrderBook.from_kis(SAMPLE_ORDERBOOK_RESPONSE, "005930").info is None
+        ob = OrderBook.from_kis(SAMPLE_ORDERBOOK_RESPONSE, "005930", include_raw=True)
+        assert ob.info is SAMPLE_ORDERBOOK_RESPONSE
 
 
 class TestFetchOHLCV:
     """fetch_ohlcv 테스트"""
     
-    def test_fetch_ohlcv_success(self, mock_kis):
-        """OHLCV 조회 성공"""
+    @pytest.mark.parametrize(
+        "limit, expected_days, expected_opens",
+        [
+            (None, [13, 14], [56000, 57000]),   # 과거 → 최근 순 정렬
+            (1, [14], [57000]),                 # limit 적용 시 가장 최근 캔들 유지
+        ],
+    )
+    def test_fetch_ohlcv(self, mock_kis, limit, expected_days, expected_opens):
+        """OHLCV 조회 (limit 적용 여부별)"""
         kis, mock_http = mock_kis
         mock_http.get.return_value = SAMPLE_DAILY_PRICE_RESPONSE
         
-        ohlcv = kis.fetch_ohlcv("005930", "1d")
+        kwargs = {"limit": limit} if limit else {}
+        ohlcv = kis.fetch_ohlcv("005930", "1d", **kwargs)
         
-        # 과거 → 최근 순으로 정렬되어야 함
-        assert len(ohlcv) == 2
-        assert ohlcv[0].datetime.day == 13  # 더 과거
-        assert ohlcv[1].datetime.day == 14  # 더 최근
+        assert [o.datetime.day for o in ohlcv] == expected_days
+        assert [o.open for o in ohlcv] == expected_opens
+        assert ohlcv[-1].close == 57500
+    
+    def test_fetch_ohlcv_frozen(self, mock_kis):
+        """캔들은 변경 불가"""
+        from pydantic import ValidationError
+        
+        kis, mock_http = mock_kis
+        mock_http.get.return_value = SAMPLE_DAILY_PRICE_RESPONSE
+        
+        ohlcv = kis.fetch_ohlcv("005930")
         
-        # 첫 번째 캔들 (더 과거)
-        assert ohlcv[0].open == 56000
-        assert ohlcv[0].close == 57000
+        assert ohlcv[0].timestamp == int(ohlcv[0].datetime.timestamp() * 1000)
+        with pytest.raises(ValidationError):
+            ohlcv[0].close = 0
+
+
+class TestParseKisDatetime:
+    """parse_kis_datetime 테스트"""
     
-    def test_fetch_ohlcv_with_limit(self, mock_kis):
-        """OHLCV 조회 (limit 적용)"""
+    def test_date_and_time(self):
+        """날짜/시각 문자열 변환"""
+        from datetime import datetime
+        from pykis.models.ohlcv import parse_kis_datetime
+        
+        assert parse_kis_datetime("20260114") == datetime(2026, 1, 14)
+        assert parse_kis_datetime("20260114", "093015") == datetime(2026, 1, 14, 9, 30, 15)
+    
+    def test_cached(self):
+        """같은 문자열은 캐시된 결과 재사용"""
+        from pykis.models.ohlcv import parse_kis_datetime
+        
+        assert parse_kis_datetime("20260114") is parse_kis_datetime("20260114")
+
+
+class TestFetchOHLCVFrame:
+    """fetch_ohlcv_frame 테스트"""
+    
+    def test_fetch_ohlcv_frame(self, mock_kis):
+        """컬럼형 배열로 변환 (과거 → 최근 순)"""
+        np = pytest.importorskip("numpy")
+        kis, mock_http = mock_kis
+        mock_http.get.return_value = SAMPLE_DAILY_PRICE_RESPONSE
+        
+        frame = kis.fetch_ohlcv_frame("005930")
+        
+        assert len(frame) == 2
+        assert frame.close.tolist() == [57000.0, 57500.0]
+        assert frame.volume.dtype == np.int64
+        assert frame.datetime[-1] == np.datetime64("2026-01-14")
+    
+    def test_fetch_ohlcv_frame_limit(self, mock_kis):
+        """limit 적용 시 최근 캔들 유지"""
+        pytest.importorskip("numpy")
         kis, mock_http = mock_kis
         mock_http.get.return_value = SAMPLE_DAILY_PRICE_RESPONSE
         
-        ohlcv = kis.fetch_ohlcv("005930", "1d", limit=1)
+        frame = kis.fetch_ohlcv_frame("005930", limit=1)
         
+        assert frame.close.tolist() == [57500.0]
+
+
+class TestFetchSnapshot:
+    """fetch_snapshot 테스트"""
+    
+    def test_fetch_snapshot_success(self, mock_kis):
+        """현재가/호가/OHLCV 동시 조회 성공"""
+        kis, mock_http = mock_kis
+        mock_http.batch.return_value = [
+            SAMPLE_PRICE_RESPONSE,
+            SAMPLE_ORDERBOOK_RESPONSE,
+            SAMPLE_DAILY_PRICE_RESPONSE,
+        ]
+        
+        ticker, ob, ohlcv = kis.fetch_snapshot("005930", "1d", limit=1)
+        
+        assert mock_http.batch.call_count == 1
+        assert len(mock_http.batch.call_args[0][0]) == 3
+        assert ticker.last == 57500
+        assert ob.symbol == "005930"
+        assert len(ob.asks) == 3
         assert len(ohlcv) == 1
+
+
+class TestFetchMinuteOHLCV:
+    """fetch_minute_ohlcv 테스트"""
+    
+    def test_fetch_minute_ohlcv_merges_windows(self, mock_kis):
+        """시간대별 요청을 한 번에 전송 후 중복 제거, 간격 필터"""
+        kis, mock_http = mock_kis
+        mock_http.batch.side_effect = lambda requests: [SAMPLE_MINUTE_RESPONSE] * len(requests)
+        
+        ohlcv = kis.fetch_minute_ohlcv("005930", interval=5)
+        
+        assert mock_http.batch.call_count == 1
+        assert [o.datetime.strftime("%H%M") for o in ohlcv] == ["0905"]
+
+
+class TestFetchMinuteOHLCVRange:
+    """fetch_minute_ohlcv_range 테스트"""
+    
+    def test_batches_windows_and_skips_errors(self, mock_kis, monkeypatch):
+        """날짜 x 시간대 구간을 한 번에 요청하고 오류 구간은 건너뜀"""
+        from pykis.exceptions import APIError
+        
+        kis, mock_http = mock_kis
+        monkeypatch.setattr(kis._quote, "_is_paper", False)
+        mock_http.batch.side_effect = lambda requests, return_exceptions: (
+            [APIError("휴장일")] + [SAMPLE_MINUTE_RESPONSE] * (len(requests) - 1)
+        )
+        
+        ohlcv = kis.fetch_minute_ohlcv_range("005930", "20260113", "20260114")
+        
+        assert len(mock_http.batch.call_args[0][0]) == 8
+        assert [o.datetime.strftime("%H%M") for o in ohlcv] == ["0901", "0905"]
+    
+    def test_rate_limited_window_raises(self, mock_kis, monkeypatch):
+        """Rate Limit으로 실패한 구간은 건너뛰지 않고 예외 발생"""
+        from pykis.exceptions import RateLimitError
+        
+        kis, mock_http = mock_kis
+        monkeypatch.setattr(kis._quote, "_is_paper", False)
+        mock_http.batch.side_effect = lambda requests, return_exceptions: (
+            [RateLimitError("초당 거래건수 초과")] + [SAMPLE_MINUTE_RESPONSE] * (len(requests) - 1)
+        )
+        
+        with pytest.raises(RateLimitError):
+            kis.fetch_minute_ohlcv_range("005930", "20260113", "20260114")
+    
+    def test_skips_weekends(self, mock_kis, monkeypatch):
+        """주말은 요청하지 않음"""
+        kis, mock_http = mock_kis
+        monkeypatch.setattr(kis._quote, "_is_paper", False)
+        mock_http.batch.side_effect = lambda requests, return_exceptions: (
+            [SAMPLE_MINUTE_RESPONSE] * len(requests)
+        )
+        
+        # 2026-01-09(금) ~ 2026-01-12(월)
+        kis.fetch_minute_ohlcv_range("005930", "20260109", "20260112")
+        
+        dates = {params["FID_INPUT_DATE_1"] for _, _, params in mock_http.batch.call_args[0][0]}
+        assert dates == {"20260109", "20260112"}
+
+
+class TestFetchOHLCVRange:
+    """fetch_ohlcv_range 테스트"""
+    
+    def test_fetch_ohlcv_range_filters_period(self, mock_kis):
+        """기간 밖 데이터 제외"""
+        kis, mock_http = mock_kis
+        mock_http.batch.return_value = [SAMPLE_DAILY_PRICE_RESPONSE]
+        
+        ohlcv = kis.fetch_ohlcv_range("005930", "2026-01-14", "2026-01-31")
+        
+        assert len(mock_http.batch.call_args[0][0]) == 1
+        assert len(ohlcv) == 1
+        assert ohlcv[0].datetime.day == 14
+    
+    def test_fetch_ohlcv_range_batches_windows(self, mock_kis):
+        """구간별 요청을 한 번에 전송 후 중복 제거 병합"""
+        kis, mock_http = mock_kis
+        mock_http.batch.side_effect = lambda requests: [SAMPLE_DAILY_PRICE_RESPONSE] * len(requests)
+        
+        ohlcv = kis.fetch_ohlcv_range("005930", "20250101", "20260131")
+        
+        assert mock_http.batch.call_count == 1
+        assert len(mock_http.batch.call_args[0][0]) == 3
+        assert len(ohlcv) == 2
+        assert ohlcv[0].datetime < ohlcv[1].datetime
+    
+    def test_fetch_ohlcv_range_frame(self, mock_kis):
+        """구간 병합 결과를 컬럼형 배열로 반환"""
+        np = pytest.importorskip("numpy")
+        kis, mock_http = mock_kis
+        mock_http.batch.side_effect = lambda requests: [SAMPLE_DAILY_PRICE_RESPONSE] * len(requests)
+        
+        frame = kis.fetch_ohlcv_range_frame("005930", "20250101", "20260131")
+        
+        assert frame.close.tolist() == [57000.0, 57500.0]
+        assert frame.datetime[0] == np.datetime64("2026-01-13")
+    
+    def test_date_windows_disjoint(self):
+        """구간이 겹치지 않고 짧은 기간은 한 구간"""
+        from pykis.api.quote import _date_windows
+        
+        assert _date_windows("20260101", "20260131", "1d") == [("20260101", "20260131")]
+        
+        windows = _date_windows("20250101", "20260131", "1d")
+        for (newer_start, _), (_, older_end) in zip(windows, windows[1:]):
+            assert older_end < newer_start
@@ -0,0 +1,190 @@
+"""
+Rate Limiter 테스트
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from pykis.exceptions import RateLimitError
+from pykis.utils.async_http import AsyncHTTPClient
+from pykis.utils.http import MAX_RETRIES, RETRY_BACKOFF, HTTPClient, retry_delay
+from pykis.utils.ratelimit import TokenBucket, AsyncTokenBucket
+
+
+class TestTokenBucket:
+    """TokenBucket 테스트"""
+    
+    def test_at_most_rate_per_second(self):
+        """시작 직후 연속 요청도 어느 1초 구간에서나 rate건 이하"""
+        rate = 20
+        bucket = TokenBucket(rate=rate)
+        
+        times = []
+        for _ in range(rate + 5):
+            bucket.acquire()
+            times.append(time.monotonic())
+        
+        for i, start in enumerate(times):
+            in_window = [t for t in times[i:] if t - start < 1.0]
+            assert len(in_window) <= rate
+    
+    def test_waits_when_depleted(self):
+        """토큰 소진 시 충전될 때까지 대기"""
+        bucket = TokenBucket(rate=20, capacity=1)
+        bucket.acquire()
+        
+        start = time.monotonic()
+        bucket.acquire()
+        
+        assert time.monotonic() - start >= 0.04
+    
+    def test_invalid_rate(self):
+        """rate가 0 이하이면 ValueError"""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestAsyncTokenBucket:
+    """AsyncTokenBucket 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_waits_when_depleted(self):
+        """토큰 소진 시 비동기 대기"""
+        bucket = AsyncTokenBucket(rate=20, capacity=1)
+        await bucket.acquire()
+        
+        start = time.monotonic()
+        await bucket.acquire()
+        
+        assert time.monotonic() - start >= 0.04
+
+
+class TestRetryOnRateLimit:
+    """HTTP 429 재시도 테스트"""
+    
+    @staticmethod
+    def _responses():
+        return [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"rt_cd": "0", "output": {"ok": "1"}}),
+        ]
+    
+    def test_retry_after_header(self):
+        """Retry-After 헤더가 있으면 해당 시간 대기"""
+        resp = httpx.Response(429, headers={"Retry-After": "2"})
+        assert retry_delay(resp, 0) == 2.0
+    
+    def test_exponential_backoff(self):
+        """헤더가 없으면 시도마다 대기 시간 2배 (절반은 지터)"""
+        resp = httpx.Response(429)
+        for attempt in range(3):
+            backoff = RETRY_BACKOFF * (2 ** attempt)
+            assert backoff / 2 <= retry_delay(resp, attempt) <= backoff
+    
+    def test_sync_retries_429(self):
+        """동기 클라이언트는 429 응답 후 재시도"""
+        auth = Mock()
+        auth.get_tr_headers.return_value = {}
+        http = HTTPClient("https://test.com", auth)
+        http._client = Mock()
+        http._client.request.side_effect = self._responses()
+        
+        data = http.get("/test", "TR0001")
+        
+        assert data["output"] == {"ok": "1"}
+        assert http._client.request.call_count == 2
+    
+    def test_sync_gives_up_after_max_retries(self):
+        """재시도 횟수 초과 시 RateLimitError"""
+        auth = Mock()
+        auth.get_tr_headers.return_value = {}
+        http = HTTPClient("https://test.com", auth)
+        http._client = Mock()
+        http._client.request.return_value = httpx.Response(429, headers={"Retry-After": "0"})
+        
+        with pytest.raises(RateLimitError):
+            http.get("/test", "TR0001")
+        
+        assert http._client.request.call_count == MAX_RETRIES + 1
+    
+    def test_sync_retries_body_rate_limit(self):
+        """본문 오류 코드 EGW00201도 재시도 후 초과 시 RateLimitError"""
+        auth = Mock()
+        auth.get_tr_headers.return_value = {}
+        http = HTTPClient("https://test.com", auth)
+        http._client = Mock()
+        http._client.request.return_value = httpx.Response(
+            200,
+            headers={"Retry-After": "0"},
+            json={"rt_cd": "1", "msg_cd": "EGW00201", "msg1": "초당 거래건수를 초과하였습니다."},
+        )
+        
+        with pytest.raises(RateLimitError) as exc_info:
+            http.get("/test", "TR0001")
+        
+        assert exc_info.value.code == "EGW00201"
+        assert http._client.request.call_count == MAX_RETRIES + 1
+    
+    @pytest.mark.asyncio
+    async def test_async_retries_body_rate_limit(self):
+        """비동기 클라이언트도 EGW00201 응답 후 재시도"""
+        auth = Mock()
+        auth.get_tr_headers = AsyncMock(return_value={})
+        http = AsyncHTTPClient("https://test.com", auth)
+        http._client = Mock()
+        http._client.request = AsyncMock(side_effect=[
+            httpx.Response(
+                200,
+                headers={"Retry-After": "0"},
+                json={"rt_cd": "1", "msg_cd": "EGW00201", "msg1": "초당 거래건수를 초과하였습니다."},
+            ),
+            httpx.Response(200, json={"rt_cd": "0", "output": {"ok": "1"}}),
+        ])
+        
+        data = await http.get("/test", "TR0001")
+        
+        assert data["output"] == {"ok": "1"}
+        assert http._client.request.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_async_retries_429(self):
+        """비동기 클라이언트는 429 응답 후 재시도"""
+        auth = Mock()
+        auth.get_tr_headers = AsyncMock(return_value={})
+        http = AsyncHTTPClient("https://test.com", auth)
+        http._client = Mock()
+        http._client.request = AsyncMock(side_effect=self._responses())
+        
+        data = await http.post("/test", "TR0001", json={"a": "b"})
+        
+        assert data["output"] == {"ok": "1"}
+        assert http._client.request.await_count == 2
+
+
+class TestAsyncBatchLimit:
+    """비동기 batch 동시 요청 수 제한 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_limit_caps_in_flight_requests(self):
+        """limit을 넘는 요청은 앞 요청이 끝날 때까지 대기"""
+        http = AsyncHTTPClient("https://test.com", Mock())
+        in_flight = 0
+        peak = 0
+        
+        async def fake_get(endpoint, tr_id, params=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"params": params}
+        
+        http.get = fake_get
+        results = await http.batch([("/ep", "TR", {"i": i}) for i in range(10)], limit=3)
+        
+        assert peak == 3
+        assert [r["params"]["i"] for r in results] == list(range(10))
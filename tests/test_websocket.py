@@ -0,0 +1,175 @@
+"""
+WebSocket 클라이언트 테스트
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from pykis.websocket.client import WebSocketClient
+
+
+def make_ticker_message(symbol: str, price: int) -> str:
+    """실시간 체결가 메시지 생성"""
+    fields = [symbol, "093000", str(price), "2", "500", "0.88", "0",
+              "57000", "58000", "56500", "0", "0", "0", "15000000"]
+    fields += ["0"] * (20 - len(fields))
+    return f"0|{WebSocketClient.TR_ID_TICKER}|001|" + "^".join(fields)
+
+
+class FakeWebSocket:
+    """수신 메시지를 큐로 흉내내는 WebSocket"""
+    
+    def __init__(self):
+        self.incoming: asyncio.Queue = asyncio.Queue()
+        self.sent = []
+    
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+    
+    async def close(self):
+        await self.incoming.put(None)
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self):
+        message = await self.incoming.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+
+@pytest.fixture
+async def ws_client():
+    """가짜 연결을 사용하는 WebSocketClient"""
+    client = WebSocketClient("key", "secret")
+    client._ws = FakeWebSocket()
+    client._approval_key = "approval"
+    client._reader_task = asyncio.create_task(client._reader())
+    yield client
+    await client.disconnect()
+
+
+class TestWebSocketMultiplex:
+    """단일 연결 구독 분배 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_dispatch_by_symbol(self, ws_client):
+        """종목별로 메시지 분배"""
+        samsung = ws_client.watch_ticker("005930")
+        hynix = ws_client.watch_ticker("000660")
+        
+        first = asyncio.ensure_future(samsung.__anext__())
+        second = asyncio.ensure_future(hynix.__anext__())
+        await asyncio.sleep(0)
+        
+        await ws_client._ws.incoming.put(make_ticker_message("000660", 120000))
+        await ws_client._ws.incoming.put(make_ticker_message("005930", 57500))
+        
+        assert (await first).last == 57500
+        assert (await second).last == 120000
+        
+        await samsung.aclose()
+        await hynix.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_subscribe_once_per_symbol(self, ws_client):
+        """같은 종목은 한 번만 등록하고 마지막 구독 해제 시 해제"""
+        a = ws_client.watch_ticker("005930")
+        b = ws_client.watch_ticker("005930")
+        
+        tasks = [asyncio.ensure_future(g.__anext__()) for g in (a, b)]
+        await asyncio.sleep(0)
+        await ws_client._ws.incoming.put(make_ticker_message("005930", 57500))
+        results = await asyncio.gather(*tasks)
+        
+        assert [t.last for t in results] == [57500, 57500]
+        types = [m["header"]["tr_type"] for m in ws_client._ws.sent]
+        assert types == ["1"]
+        
+        await a.aclose()
+        assert [m["header"]["tr_type"] for m in ws_client._ws.sent] == ["1"]
+        await b.aclose()
+        assert [m["header"]["tr_type"] for m in ws_client._ws.sent] == ["1", "2"]
+    
+    @pytest.mark.asyncio
+    async def test_failed_subscribe_releases_key(self, ws_client, monkeypatch):
+        """등록 전송 실패 시 구독 키를 남기지 않음"""
+        send = ws_client._ws.send
+        
+        async def failing_send(message):
+            raise OSError("send failed")
+        
+        monkeypatch.setattr(ws_client._ws, "send", failing_send)
+        with pytest.raises(OSError):
+            await ws_client.watch_ticker("005930").__anext__()
+        assert ws_client._subscriptions == {}
+        
+        # 재시도 시 다시 등록하고 메시지 수신
+        monkeypatch.setattr(ws_client._ws, "send", send)
+        gen = ws_client.watch_ticker("005930")
+        task = asyncio.ensure_future(gen.__anext__())
+        await asyncio.sleep(0)
+        await ws_client._ws.incoming.put(make_ticker_message("005930", 57500))
+        
+        assert (await task).last == 57500
+        assert [m["header"]["tr_type"] for m in ws_client._ws.sent] == ["1"]
+        await gen.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_keeps_latest(self, ws_client, monkeypatch):
+        """느린 구독자의 큐가 가득 차면 오래된 메시지부터 버림"""
+        monkeypatch.setattr(ws_client, "QUEUE_SIZE", 2)
+        gen = ws_client.watch_ticker("005930")
+        task = asyncio.ensure_future(gen.__anext__())
+        await asyncio.sleep(0)
+        await ws_client._ws.incoming.put(make_ticker_message("005930", 57000))
+        assert (await task).last == 57000
+        
+        for price in (57100, 57200, 57300, 57400):
+            await ws_client._ws.incoming.put(make_ticker_message("005930", price))
+        await asyncio.sleep(0.01)
+        
+        assert [(await gen.__anext__()).last for _ in range(2)] == [57300, 57400]
+        await gen.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_pingpong_echo(self, ws_client):
+        """PINGPONG 메시지 응답"""
+        ping = json.dumps({"header": {"tr_id": "PINGPONG"}})
+        await ws_client._ws.incoming.put(ping)
+        await asyncio.sleep(0.01)
+        
+        assert ws_client._ws.sent == [{"header": {"tr_id": "PINGPONG"}}]
+    
+    @pytest.mark.asyncio
+    async def test_subscribe_message_cached(self, ws_client):
+        """같은 구독 요청은 직렬화 결과를 재사용"""
+        await ws_client._subscribe(WebSocketClient.TR_ID_TICKER, "005930")
+        cached = ws_client._sub_messages[(WebSocketClient.TR_ID_TICKER, "005930", "1")]
+        await ws_client._subscribe(WebSocketClient.TR_ID_TICKER, "005930")
+        
+        assert ws_client._sub_messages[(WebSocketClient.TR_ID_TICKER, "005930", "1")] is cached
+        assert ws_client._ws.sent[0] == ws_client._ws.sent[1]
+        assert ws_client._ws.sent[0]["header"]["approval_key"] == "approval"
+
+
+class TestApprovalKey:
+    """Approval Key 발급 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_shared_http_client_reused(self):
+        """공유 AsyncClient로 발급하고 닫지 않음"""
+        def handler(request):
+            return httpx.Response(200, json={"approval_key": "abc"})
+        
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = WebSocketClient("key", "secret", http_client=http_client)
+        
+        assert await client._get_approval_key() == "abc"
+        assert await client._get_approval_key() == "abc"
+        assert not http_client.is_closed
+        await http_client.aclose()